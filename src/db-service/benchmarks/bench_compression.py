@@ -0,0 +1,103 @@
+"""
+benchmarks/bench_compression.py
+-------------------------------
+
+Measures the CPU cost of compressing `GET /tv-series` bodies against the
+bytes it saves, for gzip and (if `brotli` is installed) Brotli at several
+levels, on synthetic series from 1 to 1000 seasons (the latter, a long
+running soap opera).
+
+For each body and codec: its compressed size, the ratio to the JSON size,
+and the best time to compress and to decompress it. The cost is paid once
+per cached entry (compressed bodies are cached with the response), and on
+every partial response. No database is needed. Run from the service's root:
+
+    PYTHONPATH=src python3 benchmarks/bench_compression.py
+"""
+
+import datetime
+import gzip
+import random
+import timeit
+
+from db.serializers import encode_tv_series
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SEASON_COUNTS = (1, 10, 40, 200, 1000)
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+REPEAT = 5
+
+
+def make_raw_doc(seasons_count: int) -> dict:
+    """Returns a raw document, shaped as stored by `Database.add_from_dict`.
+    """
+    rng = random.Random(seasons_count)
+    stamp = datetime.datetime(2019, 7, 30, 12, 0, 0, 123000)
+    return {
+        '_id': f'synthetic_series_{seasons_count}',
+        'name': f'Synthetic Series {seasons_count}',
+        'last_modified': stamp,
+        'seasons_count': seasons_count,
+        'overall_rating': 8.4,
+        'ratings': [{
+            '_id': season,
+            'episodes_count': episodes,
+            'last_modified': stamp,
+            'last_checked': stamp,
+            'ratings': [{'_id': ep, 'rating': round(rng.uniform(6, 10), 1)}
+                        for ep in range(1, episodes + 1)],
+        } for season, episodes in (
+            (s, rng.randint(10, 24)) for s in range(1, seasons_count + 1))],
+    }
+
+
+def codecs():
+    """Returns the `(name, compress, decompress)` of every codec measured."""
+    result = [(f'gzip-{level}',
+               lambda body, level=level: gzip.compress(
+                   body, compresslevel=level, mtime=0),
+               gzip.decompress)
+              for level in GZIP_LEVELS]
+    if brotli is not None:
+        result += [(f'br-{quality}',
+                    lambda body, quality=quality: brotli.compress(
+                        body, mode=brotli.MODE_TEXT, quality=quality),
+                    brotli.decompress)
+                   for quality in BROTLI_QUALITIES]
+    return result
+
+
+def bench(func, arg) -> float:
+    """Returns the best time per call, in microseconds."""
+    number = max(1, 20000 // max(1, len(arg) // 1024))
+    return min(timeit.repeat(lambda: func(arg), number=number,
+                             repeat=REPEAT)) / number * 1e6
+
+
+def main():
+    if brotli is None:
+        print("brotli is not installed; measuring gzip only")
+    print("{:>8} {:>9} {:>8} {:>9} {:>7} {:>12} {:>12} {:>10}".format(
+        "seasons", "bytes", "codec", "out", "ratio", "compress us",
+        "decompr. us", "us/KB"))
+    for seasons_count in SEASON_COUNTS:
+        body = encode_tv_series(make_raw_doc(seasons_count))
+        for name, compress, decompress in codecs():
+            out = compress(body)
+            assert decompress(out) == body
+            compress_us = bench(compress, body)
+            print("{:>8} {:>9} {:>8} {:>9} {:>7.3f} {:>12.1f} {:>12.1f} "
+                  "{:>10.2f}".format(
+                      seasons_count, len(body), name, len(out),
+                      len(out) / len(body), compress_us,
+                      bench(decompress, out),
+                      compress_us / (len(body) / 1024)))
+
+
+if __name__ == '__main__':
+    main()
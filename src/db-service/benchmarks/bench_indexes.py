@@ -0,0 +1,163 @@
+"""
+benchmarks/bench_indexes.py
+---------------------------
+
+Times queries across series on a synthetic catalog, without and with the
+indexes declared in `db/models.py`, and prints the plan Mongo picked
+(`COLLSCAN`, or `IXSCAN` when an index is used):
+
+- series rated above 8.5, the 20 most recently modified series, and a series
+    by name, on `TVSeries`
+- episodes rated 9.5 or more, on `TVSeries` (by unwinding every series) and
+    on the flattened `episode_ratings` collection
+
+Needs a running Mongo; the catalog (50k series by default) is written to a
+scratch database, `imdb_bench`, which is dropped afterwards. Run from the
+service's root:
+
+    MONGO_HOST=localhost PYTHONPATH=src python3 benchmarks/bench_indexes.py \\
+        [--series 50000]
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+import mongoengine
+
+from common import settings
+from db import episodes
+from db.models import FlatEpisodeRating, TVSeries
+
+BENCH_DB = 'imdb_bench'
+REPEAT = 5
+INSERT_BATCH = 1000
+
+
+def make_raw_doc(i: int, rng: random.Random) -> dict:
+    """Returns a raw series document, shaped as stored by db-service, with 1
+    to 10 seasons of 6 to 24 episodes."""
+    base = rng.uniform(5, 9.5)
+    return {
+        '_id': f'synthetic_series_{i}',
+        'name': f'Synthetic Series {i}',
+        'last_modified': datetime.datetime(2019, 1, 1) +
+        datetime.timedelta(minutes=rng.randint(0, 500000)),
+        'seasons_count': 0,
+        'overall_rating': round(base, 1),
+        'ratings': [{
+            '_id': season,
+            'episodes_count': episodes_count,
+            'ratings': [{'_id': ep,
+                         'rating': round(min(10, max(0, rng.gauss(base, .6))),
+                                         1)}
+                        for ep in range(1, episodes_count + 1)],
+        } for season, episodes_count in (
+            (s, rng.randint(6, 24)) for s in range(1, rng.randint(1, 10) + 1))],
+    }
+
+
+def populate(series_count: int) -> None:
+    rng = random.Random(0)
+    collection = TVSeries._get_collection()
+    batch = []
+    for i in range(series_count):
+        doc = make_raw_doc(i, rng)
+        doc['seasons_count'] = len(doc['ratings'])
+        batch.append(doc)
+        if len(batch) == INSERT_BATCH:
+            collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+    episodes.rebuild(collection, batch_size=INSERT_BATCH)
+
+
+def queries(series_count: int):
+    series = TVSeries._get_collection()
+    flat = FlatEpisodeRating._get_collection()
+    name = f'Synthetic Series {series_count // 2}'
+    return [
+        ('series rated > 8.5',
+         lambda: list(series.find({'overall_rating': {'$gt': 8.5}},
+                                  {'name': 1})),
+         lambda: series.find({'overall_rating': {'$gt': 8.5}}).explain()),
+        ('20 recently modified',
+         lambda: list(series.find({}, {'name': 1})
+                      .sort('last_modified', -1).limit(20)),
+         lambda: series.find({}).sort('last_modified', -1).limit(20)
+         .explain()),
+        ('series by name',
+         lambda: series.find_one({'name': name}, {'name': 1}),
+         lambda: series.find({'name': name}).explain()),
+        ('episodes >= 9.5 (unwind)',
+         lambda: list(series.aggregate([
+             {'$unwind': '$ratings'}, {'$unwind': '$ratings.ratings'},
+             {'$match': {'ratings.ratings.rating': {'$gte': 9.5}}},
+             {'$project': {'ratings.ratings.rating': 1}}])),
+         None),
+        ('episodes >= 9.5 (flat)',
+         lambda: list(flat.find({'rating': {'$gte': 9.5}},
+                                {'series': 1, 'rating': 1})),
+         lambda: flat.find({'rating': {'$gte': 9.5}}).explain()),
+    ]
+
+
+def winning_stage(explain: dict) -> str:
+    """Returns the stages of the winning plan, innermost last."""
+    stage = explain['queryPlanner']['winningPlan']
+    stages = []
+    while stage is not None:
+        stages.append(stage['stage'])
+        stage = stage.get('inputStage')
+    return '>'.join(stages)
+
+
+def bench(func) -> float:
+    """Returns the best time of a query, in milliseconds."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def run(label: str, series_count: int):
+    print(f"\n{label}")
+    print("{:<28} {:>10}  {}".format("query", "ms", "plan"))
+    for name, func, explain in queries(series_count):
+        plan = winning_stage(explain()) if explain is not None else '-'
+        print("{:<28} {:>10.1f}  {}".format(name, bench(func), plan))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--series', type=int, default=50000)
+    args = parser.parse_args()
+
+    mongoengine.connect(db=BENCH_DB, host=settings.MONGO_HOST)
+    client = TVSeries._get_db().client
+    client.drop_database(BENCH_DB)
+    try:
+        start = time.perf_counter()
+        populate(args.series)
+        episodes_count = FlatEpisodeRating._get_collection().count_documents(
+            {})
+        print(f"{args.series} series, {episodes_count} episodes, written in "
+              f"{time.perf_counter() - start:.1f}s")
+
+        for model in (TVSeries, FlatEpisodeRating):
+            model._get_collection().drop_indexes()
+        run("without indexes", args.series)
+
+        for model in (TVSeries, FlatEpisodeRating):
+            model.ensure_indexes()
+        run("with indexes", args.series)
+    finally:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+benchmarks/bench_serialization.py
+---------------------------------
+
+Compares the cost of serializing a `TVSeries` for `GET /tv-series`:
+
+- `mongoengine`: hydrate a `TVSeries`, then
+    `jsonify(json.loads(doc.to_json()))` (the previous path)
+- `raw`: `encode_tv_series` on the raw pymongo document (the current path),
+    with the standard library, and with orjson if installed
+
+Documents are synthetic, with 10 to 40 seasons of 10 to 24 episodes. No
+database is needed. Run from the service's root:
+
+    PYTHONPATH=src python3 benchmarks/bench_serialization.py
+"""
+
+import datetime
+import json
+import random
+import timeit
+
+from flask import Flask, jsonify
+
+import db.serializers as serializers
+from db.models import TVSeries
+
+SEASON_COUNTS = (10, 20, 30, 40)
+REPEAT = 5
+
+
+def make_raw_doc(seasons_count: int) -> dict:
+    """Returns a raw document, shaped as stored by `Database.add_from_dict`.
+    """
+    rng = random.Random(seasons_count)
+    return {
+        '_id': f'synthetic_series_{seasons_count}',
+        'name': f'Synthetic Series {seasons_count}',
+        'last_modified': datetime.datetime(2019, 7, 30, 12, 0, 0, 123000),
+        'seasons_count': seasons_count,
+        'overall_rating': 8.4,
+        'ratings': [{
+            '_id': season,
+            'episodes_count': episodes,
+            'ratings': [{'_id': ep, 'rating': round(rng.uniform(6, 10), 1)}
+                        for ep in range(1, episodes + 1)],
+        } for season, episodes in (
+            (s, rng.randint(10, 24)) for s in range(1, seasons_count + 1))],
+    }
+
+
+def mongoengine_path(raw_doc: dict) -> bytes:
+    doc = TVSeries._from_son(raw_doc)
+    return jsonify(json.loads(doc.to_json())).get_data()
+
+
+def raw_path(raw_doc: dict) -> bytes:
+    return serializers.encode_tv_series(raw_doc)
+
+
+def raw_path_stdlib(raw_doc: dict) -> bytes:
+    orjson, serializers.orjson = serializers.orjson, None
+    try:
+        return serializers.encode_tv_series(raw_doc)
+    finally:
+        serializers.orjson = orjson
+
+
+def bench(func, raw_doc: dict) -> float:
+    """Returns the best time per call, in microseconds."""
+    number = 200
+    return min(timeit.repeat(lambda: func(raw_doc), number=number,
+                             repeat=REPEAT)) / number * 1e6
+
+
+def main():
+    app = Flask(__name__)
+    paths = [('mongoengine', mongoengine_path), ('raw/json', raw_path_stdlib)]
+    if serializers.orjson is not None:
+        paths.append(('raw/orjson', raw_path))
+
+    print("{:>8} {:>9} ".format("seasons", "bytes") +
+          "".join("{:>14}".format(name + " us") for name, _ in paths))
+    with app.app_context():
+        for seasons_count in SEASON_COUNTS:
+            raw_doc = make_raw_doc(seasons_count)
+            expected = json.loads(mongoengine_path(raw_doc))
+            for _, func in paths[1:]:
+                assert json.loads(func(raw_doc)) == expected
+            print("{:>8} {:>9} ".format(
+                seasons_count, len(mongoengine_path(raw_doc))) +
+                "".join("{:>14.1f}".format(bench(func, raw_doc))
+                        for _, func in paths))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,8 +6,10 @@ from flask_cors import CORS, cross_origin
 from flask_restful import Api
 
 from common import utils
-from db import Database
-from resources.tvseries import TVSeries
+from db import init_db
+from resources.analytics import TVSeriesRankings, TVSeriesStats
+from resources.metrics import Metrics
+from resources.tvseries import TVSeries, TVSeriesBatch
 
 try:
     logging.config.fileConfig(utils.get_logger_cfg_fpath())
@@ -22,8 +24,13 @@ app.config['CORS_HEADERS'] = 'Content-Type'
 api = Api(app)
 CORS(app)
 
+init_db()
 
 api.add_resource(TVSeries, '/tv-series')
+api.add_resource(TVSeriesBatch, '/tv-series/batch')
+api.add_resource(TVSeriesStats, '/tv-series/stats')
+api.add_resource(TVSeriesRankings, '/tv-series/rankings')
+api.add_resource(Metrics, '/metrics')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,161 @@
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response, with the validators of conditional requests,
+    and its compressed bodies by content coding (see
+    `ResponseCache.put_encoded`).
+    """
+    body: bytes
+    etag: str = None
+    last_modified: datetime.datetime = None
+    encoded: Dict[str, bytes] = None
+
+
+class ResponseCache():
+    """A thread-safe LRU cache of serialized responses, with a TTL.
+
+    Entries are evicted, least recently used first, when either `max_entries`
+    or `max_bytes` (the total size of keys and bodies, compressed ones
+    included) would be exceeded.
+    Entries older than `ttl_secs` are treated as missing.
+
+    A response read before its key is invalidated is stale: take a `version`
+    before reading it, and `put` drops it if the key was invalidated since.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 2**20,
+                 ttl_secs: float = 300):
+        self.__MAX_ENTRIES = max_entries
+        self.__MAX_BYTES = max_bytes
+        self.__TTL_SECS = ttl_secs
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+        # version of the last invalidation of each key; versions not above
+        # `__floor` are forgotten, and treated as invalidated
+        self.__version = 0
+        self.__floor = 0
+        self.__invalidations = {}
+
+    def version(self) -> int:
+        """Returns the current version, to pass to `put` with a response read
+        from now on."""
+        with self.__lock:
+            return self.__version
+
+    def get(self, key: str) -> CachedResponse:
+        """Returns the cached response for `key`, or None on a miss."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                self.__expirations += 1
+                entry = None
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, key: str, response: CachedResponse,
+            version: int = None) -> None:
+        """Caches `response` under `key`, evicting older entries if need be.
+        Responses larger than `max_bytes` are not cached, nor responses read
+        at `version` (see `version`) if `key` was invalidated since.
+        """
+        size = self._size(key, response)
+        if size > self.__MAX_BYTES:
+            return
+        with self.__lock:
+            if version is not None and (
+                    version < self.__floor or
+                    self.__invalidations.get(key, 0) > version):
+                return
+            if key in self.__entries:
+                self._remove(key)
+            while self.__entries and (
+                    len(self.__entries) >= self.__MAX_ENTRIES or
+                    self.__bytes + size > self.__MAX_BYTES):
+                self._remove(next(iter(self.__entries)))
+                self.__evictions += 1
+            self.__entries[key] = (response,
+                                  time.monotonic() + self.__TTL_SECS)
+            self.__bytes += size
+
+    def put_encoded(self, key: str, response: CachedResponse, encoding: str,
+                    body: bytes) -> None:
+        """Caches the `body` of `response` compressed with `encoding`, if
+        `response` (or a copy of it with other encodings) is still cached
+        under `key`, so that it is compressed once per entry. It counts
+        towards `max_bytes`, and is evicted with the entry; it is not cached
+        if the entry would exceed `max_bytes` with it.
+
+        Cached responses are never modified: the entry is replaced by a copy
+        with the compressed body.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return
+            cached, expires = entry
+            if (cached.body is not response.body or cached.encoded is None or
+                    encoding in cached.encoded or
+                    self._size(key, cached) + len(body) > self.__MAX_BYTES):
+                return
+            # evict other entries, least recently used first
+            while self.__bytes + len(body) > self.__MAX_BYTES:
+                victim = next(other for other in self.__entries
+                              if other != key)
+                self._remove(victim)
+                self.__evictions += 1
+            self.__entries[key] = (
+                cached._replace(encoded=dict(cached.encoded,
+                                             **{encoding: body})),
+                expires)
+            self.__bytes += len(body)
+
+    def invalidate(self, key: str) -> None:
+        with self.__lock:
+            if key in self.__entries:
+                self._remove(key)
+            self.__version += 1
+            self.__invalidations[key] = self.__version
+            if len(self.__invalidations) > 4 * self.__MAX_ENTRIES:
+                # forget them all: responses read before now are dropped
+                self.__invalidations.clear()
+                self.__floor = self.__version
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'evictions': self.__evictions,
+                'expirations': self.__expirations,
+                'entries': len(self.__entries),
+                'bytes': self.__bytes,
+            }
+
+    def _remove(self, key: str) -> None:
+        response, _ = self.__entries.pop(key)
+        self.__bytes -= self._size(key, response)
+
+    @staticmethod
+    def _size(key: str, response: CachedResponse) -> int:
+        return len(key) + len(response.body) + sum(
+            len(body) for body in (response.encoded or {}).values())
@@ -0,0 +1,34 @@
+"""
+common/compression.py
+---------------------
+
+Compresses response bodies with the content codings the service can serve:
+`br` (Brotli) if `brotli` is installed, and `gzip`, in order of preference.
+"""
+
+import gzip
+
+from common import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODINGS = (('br',) if brotli is not None else ()) + ('gzip',)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses `body` with `encoding`, one of `ENCODINGS`, at the level
+    set in `common.settings`.
+    """
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, mode=brotli.MODE_TEXT,
+                               quality=settings.COMPRESSION_BROTLI_QUALITY)
+    if encoding == 'gzip':
+        # mtime=0: the same body always compresses to the same bytes
+        return gzip.compress(body,
+                             compresslevel=settings.COMPRESSION_GZIP_LEVEL,
+                             mtime=0)
+    raise ValueError(f"`encoding` must be one of {ENCODINGS}, "
+                     f"got {encoding!r}")
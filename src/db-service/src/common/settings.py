@@ -4,4 +4,39 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-JOB_SERVICE_API = os.getenv('JOB_SERVICE_API')
\ No newline at end of file
+JOB_SERVICE_API = os.getenv('JOB_SERVICE_API')
+
+# MongoDB connection pool, shared by all requests of the process
+MONGO_DB = os.getenv('MONGO_DB', 'imdb')
+MONGO_HOST = os.getenv('MONGO_HOST', 'mongo')
+MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 0))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 60000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', 5000))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv('MONGO_SOCKET_TIMEOUT_MS', 10000))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(
+    os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', 2000))
+MONGO_READ_PREFERENCE = os.getenv('MONGO_READ_PREFERENCE', 'primaryPreferred')
+
+# In-process cache of GET /tv-series responses
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 256))
+RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 2**20))
+RESPONSE_CACHE_TTL_SECS = float(os.getenv('RESPONSE_CACHE_TTL_SECS', 300))
+
+# How long browsers and proxies may reuse GET /tv-series responses before
+# revalidating them (with If-None-Match); 0 to always revalidate
+HTTP_CACHE_MAX_AGE_SECS = int(os.getenv('HTTP_CACHE_MAX_AGE_SECS', 60))
+
+# Compression of GET /tv-series responses (gzip, or brotli if installed), for
+# clients that accept it; smaller bodies are sent as is
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+
+# Copy episode ratings to the flattened `episode_ratings` collection on every
+# write (see `db.episodes`); backfill with `python3 src/migrate.py episodes`
+EPISODE_RATINGS_SYNC = os.getenv(
+    'EPISODE_RATINGS_SYNC', 'false').lower() in ('1', 'true', 'yes')
@@ -14,5 +14,15 @@ def singleton(cls, *args, **kwargs):
     return singleton_wrapper
 
 
+def bounded_int(low: int, high: int):
+    """Returns a `reqparse` argument type parsing an int in `[low, high]`."""
+    def parse(value):
+        value = int(value)
+        if not low <= value <= high:
+            raise ValueError(f"must be between {low} and {high}")
+        return value
+    return parse
+
+
 def get_logger_cfg_fpath():
     return ''.join([os.getcwd(), '/cfg/logger_cfg.ini'])
\ No newline at end of file
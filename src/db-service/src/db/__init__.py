@@ -1,43 +1,491 @@
+import datetime
+import threading
 import traceback
+from typing import Dict, Iterable, List, Tuple
 
 import mongoengine
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from db.models import TVSeries, SeasonRatings, EpisodeRating
+from common import settings
+from db import analytics, episodes, projection
+from db.delta import diff_tv_series
+from db.metrics import PoolMetrics
+from db.models import (TVSeries, SeasonRatings, EpisodeRating,
+                       FlatEpisodeRating)
+
+MERGE_ATTEMPTS = 3
+DUPLICATE_KEY_ERROR = 11000
+# bookkeeping of incremental refreshes, on every season: read by the batch
+# season summaries, not served with the series
+SEASON_STAMPS = ('last_modified', 'last_checked')
+
+_init_lock = threading.Lock()
+_client = None
+
+
+def init_db():
+    """Connects the process-wide, pooled Mongo client. Call once at app
+    startup; calling it again is a no-op.
+
+    Pool size, timeouts and read preference are read from `common.settings`.
+    """
+    global _client
+    with _init_lock:
+        if _client is None:
+            _client = mongoengine.connect(
+                db=settings.MONGO_DB, host=settings.MONGO_HOST,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+                socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+                serverSelectionTimeoutMS=(
+                    settings.MONGO_SERVER_SELECTION_TIMEOUT_MS),
+                waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                readPreference=settings.MONGO_READ_PREFERENCE,
+                event_listeners=[PoolMetrics()])
+    return _client
+
+
+def get_identifier(name: str) -> str:
+    """Returns the identifier (primary key) a series' name is stored under.
+    """
+    def process_char(c: str):
+        if c.isalnum():
+            return c.lower()
+        elif c == ' ':
+            return '_'
+        else:
+            return ''
+    return ''.join(process_char(c) for c in name)
 
 
 class Database():
+    """Data access for TV series.
 
-    def __init__(self):
-        self.__DB_NAME = 'imdb'
+    Usable as a context manager for backwards compatibility; connections are
+    borrowed from the process-wide pool set up by `init_db` (initialized on
+    first use if need be), never opened or closed per request.
+    """
 
     def __enter__(self):
-        self.__db = mongoengine.connect(db=self.__DB_NAME, host='mongo')
+        init_db()
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
         if exception_type is not None:
             print(exception_type, exception_value, traceback)
-        self.__db.close()
 
-    def find(self, series_name: str) -> TVSeries:
-        if self.if_tv_series_exists(series_name):
-            return TVSeries.objects.with_id(self._get_id(series_name))
-        else:
-            return None
+    def find(self, series_name: str,
+             fields: Iterable[str] = None) -> TVSeries:
+        """Returns the series with the `series_name` provided, or None if it
+        does not exist. Takes a single query.
+
+        If `fields` is provided, only those fields are loaded (e.g.
+        `('name', 'overall_rating')`); the others are left unset.
+        """
+        query = TVSeries.objects(pk=self._get_id(series_name))
+        if fields:
+            query = query.only(*fields)
+        return query.first()
+
+    def find_raw(self, series_name: str,
+                 projection: dict = None) -> dict:
+        """Returns the raw document (a dict, as stored in Mongo) of the series
+        with the `series_name` provided, or None if it does not exist. Unless
+        a `projection` is provided, the `SEASON_STAMPS` of its seasons are
+        left out.
+
+        Skips mongoengine document hydration; use with
+        `db.serializers.encode_tv_series` to serve the document as is.
+        """
+        if projection is None:
+            projection = {f'ratings.{field}': 0 for field in SEASON_STAMPS}
+        return TVSeries._get_collection().find_one(
+            {'_id': self._get_id(series_name)}, projection)
+
+    def find_last_modified(self, series_name: str) -> datetime.datetime:
+        """Returns the `last_modified` of the series with the `series_name`
+        provided, reading only that field.
+
+        Raises
+        ------
+            KeyError: if the series does not exist
+        """
+        doc = TVSeries._get_collection().find_one(
+            {'_id': self._get_id(series_name)}, {'last_modified': 1})
+        if doc is None:
+            raise KeyError(series_name)
+        return doc.get('last_modified')
+
+    def find_partial(self, series_name: str, fields: List[str],
+                     episodes: bool = True, season_offset: int = 0,
+                     season_limit: int = None, cursor: str = None,
+                     episode_limit: int = None) -> dict:
+        """Returns part of the raw document of the series with the
+        `series_name` provided, or None if it does not exist: its `fields`,
+        with only the seasons in the range of `season_offset` and
+        `season_limit`, stripped of their episodes unless `episodes` (see
+        `db.projection`).
+
+        If `episode_limit` is provided, seasons only carry the page of up to
+        `episode_limit` episodes starting at `cursor` (or at the first
+        episode of the range), and the document gets the cursor of the next
+        page under `next_cursor` (None after the last page); the page is
+        planned from the episode counts, read first.
+
+        Raises
+        ------
+            ValueError: if `cursor` is malformed
+        """
+        identifier = self._get_id(series_name)
+        collection = TVSeries._get_collection()
+        page = None
+        next_cursor = None
+        paged = (episode_limit is not None and episodes and
+                 'ratings' in fields)
+        if paged:
+            start = (projection.decode_cursor(cursor)
+                     if cursor is not None else (0, 0))
+            counts = next(collection.aggregate(
+                projection.episode_counts_pipeline(identifier)), None)
+            if counts is None:
+                return None
+            page, following = projection.plan_page(
+                counts['counts'], season_offset, season_limit, start,
+                episode_limit)
+            if following is not None:
+                next_cursor = projection.encode_cursor(*following)
+
+        doc = next(collection.aggregate(projection.partial_pipeline(
+            identifier, fields, episodes, season_offset, season_limit,
+            page)), None)
+        if doc is not None and paged:
+            doc['next_cursor'] = next_cursor
+        return doc
 
     def delete(self, series_name: str):
         """Deletes a series with the `series_name` provided.
         Returns True if the object is deleted, False if not deleted.
         """
-        if self.if_tv_series_exists(series_name):
-            resp = TVSeries.objects.with_id(self._get_id(series_name)).delete()
-            return True
-        return False
+        identifier = self._get_id(series_name)
+        deleted = TVSeries.objects(pk=identifier).delete() > 0
+        if deleted and episodes.enabled():
+            episodes.delete_series(identifier)
+        return deleted
 
     def if_tv_series_exists(self, series_name: str) -> bool:
         return TVSeries.objects(identifier=self._get_id(series_name)).count() > 0
 
+    def exist_many(self, series_names: List[str]) -> Dict[str, bool]:
+        """Returns whether each of the `series_names` exists, in one query.
+        """
+        ids = {name: self._get_id(name) for name in series_names}
+        found = {doc['_id'] for doc in TVSeries._get_collection().find(
+            {'_id': {'$in': list(set(ids.values()))}}, {'_id': 1})}
+        return {name: ids[name] in found for name in series_names}
+
+    def season_summaries(self, series_names: List[str]) -> Dict[str, dict]:
+        """Returns, in one query, the stored seasons of each of the
+        `series_names` (or None for a series that does not exist) as
+        `{'last_modified': ..., 'seasons': [{'season': ..., 'episodes_count':
+        ..., 'last_modified': ..., 'last_checked': ...}]}`, without episode
+        ratings.
+        """
+        ids = {name: self._get_id(name) for name in series_names}
+        projection = {'last_modified': 1, 'ratings._id': 1,
+                      'ratings.episodes_count': 1,
+                      'ratings.last_modified': 1, 'ratings.last_checked': 1}
+        found = {doc['_id']: doc for doc in TVSeries._get_collection().find(
+            {'_id': {'$in': list(set(ids.values()))}}, projection)}
+        summaries = {}
+        for name, identifier in ids.items():
+            doc = found.get(identifier)
+            if doc is None:
+                summaries[name] = None
+                continue
+            summaries[name] = {
+                'last_modified': doc.get('last_modified'),
+                'seasons': [{'season': season['_id'],
+                             'episodes_count': season.get('episodes_count'),
+                             'last_modified': season.get('last_modified'),
+                             'last_checked': season.get('last_checked')}
+                            for season in doc.get('ratings', [])]}
+        return summaries
+
+    def series_stats(self, series_name: str, top: int = 5) -> dict:
+        """Returns, in one aggregation, the summary of the series with the
+        `series_name` provided (see `db.analytics.stats_pipeline`), or None if
+        it does not exist.
+        """
+        result = next(TVSeries._get_collection().aggregate(
+            analytics.stats_pipeline(self._get_id(series_name), top)), None)
+        if result is None or not result['series']:
+            return None
+        series = result['series'][0]
+        trend = result['trend'][0]['value'] if result['trend'] else None
+        return {
+            'name': series.get('name'),
+            'identifier': series['_id'],
+            'overall_rating': series.get('overall_rating'),
+            'seasons_count': series.get('seasons_count'),
+            'seasons': result['seasons'],
+            'trend': trend,
+            'best_episodes': [self._episode_summary(ep)
+                              for ep in result.get('best_episodes', [])],
+            'worst_episodes': [self._episode_summary(ep)
+                               for ep in result.get('worst_episodes', [])],
+        }
+
+    def rankings(self, metric: str, k: int = 10, descending: bool = True,
+                 min_seasons: int = 1) -> List[dict]:
+        """Returns the top `k` series (or episodes) by `metric`, one of
+        `db.analytics.RANKING_METRICS`, as `{'name': ..., 'identifier': ...,
+        'value': ...}` (plus `season` and `episode` for episodes).
+
+        Episodes are ranked from `episode_ratings` when it is synced, using
+        its rating index, else by unwinding every series.
+        """
+        if metric == 'episode' and episodes.enabled() and min_seasons <= 1:
+            rows = FlatEpisodeRating._get_collection().find(
+                {'rating': {'$ne': None}},
+                {'_id': 0, 'series': 1, 'series_name': 1, 'season': 1,
+                 'episode': 1, 'rating': 1},
+            ).sort('rating', -1 if descending else 1).limit(k)
+            return [{'name': row['series_name'], 'identifier': row['series'],
+                     'season': row['season'], 'episode': row['episode'],
+                     'value': row['rating']} for row in rows]
+
+        results = []
+        for doc in TVSeries._get_collection().aggregate(
+                analytics.rankings_pipeline(metric, k, descending,
+                                            min_seasons)):
+            result = {'name': doc.get('name'), 'identifier': doc['_id'],
+                      'value': doc['value']}
+            if metric == 'episode':
+                result['season'] = doc['season']
+                result['episode'] = doc['episode']
+            results.append(result)
+        return results
+
     def add_from_dict(self, req: dict) -> bool:
+        tv_doc, err = self._build_document(req)
+        if tv_doc is None:
+            return False, err
+        tv_doc.save()
+        if episodes.enabled():
+            episodes.sync_replaced([tv_doc.to_mongo().to_dict()])
+        return True, err
+
+    def add_many_from_dicts(self, reqs: List[dict]) -> List[dict]:
+        """Creates or replaces many series with a single unordered bulk
+        write. Each item of `reqs` has the same format as in `add_from_dict`.
+
+        Returns the status of each item, in the order of `reqs`:
+        `{'name': ..., 'identifier': ..., 'status': ..., 'messages': [...]}`,
+        where status is `created`, `replaced`, `invalid` (not written) or
+        `error` (the write failed).
+        """
+        results, docs = self._prepare_many(reqs)
+        operations = []
+        op_indices = []
+        for i, doc in docs.items():
+            op_indices.append(i)
+            operations.append(ReplaceOne({'_id': doc['_id']}, doc,
+                                         upsert=True))
+
+        if not operations:
+            return results
+
+        write_errors = {}
+        try:
+            bulk_result = TVSeries._get_collection().bulk_write(
+                operations, ordered=False)
+            upserted = bulk_result.upserted_ids
+        except BulkWriteError as exc:
+            write_errors = {e['index']: e['errmsg']
+                            for e in exc.details['writeErrors']}
+            upserted = {u['index']: u['_id']
+                        for u in exc.details.get('upserted', [])}
+
+        for op_index, result_index in enumerate(op_indices):
+            result = results[result_index]
+            if op_index in write_errors:
+                result['status'] = 'error'
+                result['messages'] = [write_errors[op_index]]
+            elif op_index in upserted:
+                result['status'] = 'created'
+            else:
+                result['status'] = 'replaced'
+        if episodes.enabled():
+            episodes.sync_replaced(
+                docs[i] for i in op_indices
+                if results[i]['status'] in ('created', 'replaced'))
+        return results
+
+    def merge_many_from_dicts(self, reqs: List[dict]) -> List[dict]:
+        """Merges many series into the stored ones with targeted updates,
+        creating those that do not exist yet. Each item of `reqs` has the
+        same format as in `add_from_dict`.
+
+        Unlike `add_many_from_dicts`, only the fields, seasons and episodes
+        that changed are written (see `db.delta.diff_tv_series`), nothing
+        stored is removed, and `last_modified` only changes if the series
+        did.
+
+        Returns the status of each item as `add_many_from_dicts` does, with
+        status `created`, `updated`, `unchanged`, `invalid` or `error`, and
+        a summary of what was merged under `changes`.
+        """
+        results, pending = self._prepare_many(reqs)
+        docs = dict(pending)
+        for result in results:
+            result['changes'] = {}
+        for _ in range(MERGE_ATTEMPTS):
+            if not pending:
+                break
+            pending = self._merge_attempt(results, pending)
+        for i in pending:
+            results[i]['status'] = 'error'
+            results[i]['messages'] = [
+                'The series kept being modified concurrently']
+        if episodes.enabled():
+            episodes.sync_merged(
+                doc for i, doc in docs.items()
+                if results[i]['status'] in ('created', 'updated'))
+        return results
+
+    def _merge_attempt(self, results: List[dict],
+                       pending: Dict[int, dict]) -> Dict[int, dict]:
+        """Diffs and writes the `pending` documents (keyed by their index in
+        `results`) with one read and one unordered bulk write, plus one for
+        the `last_checked` of the unchanged documents.
+
+        Every update is conditional on the `last_modified` it was diffed
+        against, so a diff is never applied on top of a concurrent write.
+        Returns the documents that lost such a race, to be diffed again;
+        merging is idempotent, thus retrying is safe.
+        """
+        collection = TVSeries._get_collection()
+        stored = {doc['_id']: doc for doc in collection.find(
+            {'_id': {'$in': list({doc['_id'] for doc in pending.values()})}})}
+        # Mongo stores datetimes with millisecond precision
+        now = datetime.datetime.utcnow()
+        stamp = now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+        operations = []
+        op_indices = []
+        touches_operations = []
+        update_ids = []
+        retry = {}
+        written_ids = set()
+        for i, doc in pending.items():
+            if doc['_id'] in written_ids:
+                # the same series twice in a batch: diff it after this write
+                retry[i] = doc
+                continue
+            written_ids.add(doc['_id'])
+            current = stored.get(doc['_id'])
+            if current is None:
+                operations.append(InsertOne(dict(doc, last_modified=stamp)))
+                results[i]['status'] = 'created'
+            else:
+                sets, changes, touches = diff_tv_series(current, doc, stamp)
+                results[i]['changes'] = changes
+                if not sets:
+                    results[i]['status'] = 'unchanged'
+                    if touches:
+                        # losing these to a concurrent write is harmless
+                        touches_operations.append(UpdateOne(
+                            {'_id': doc['_id'],
+                             'last_modified': current.get('last_modified')},
+                            {'$set': touches}))
+                    continue
+                sets.update(touches)
+                sets['last_modified'] = stamp
+                operations.append(UpdateOne(
+                    {'_id': doc['_id'],
+                     'last_modified': current.get('last_modified')},
+                    {'$set': sets}))
+                update_ids.append(doc['_id'])
+                results[i]['status'] = 'updated'
+            op_indices.append(i)
+
+        if touches_operations:
+            # written apart, so that their matches are not mistaken for those
+            # of the conditional updates below
+            try:
+                collection.bulk_write(touches_operations, ordered=False)
+            except BulkWriteError:
+                # `last_checked` is only informative; failing to record it
+                # does not fail the merge
+                traceback.print_exc()
+        if not operations:
+            return retry
+
+        write_errors = {}
+        try:
+            matched = collection.bulk_write(
+                operations, ordered=False).matched_count
+        except BulkWriteError as exc:
+            write_errors = {e['index']: e
+                            for e in exc.details['writeErrors']}
+            matched = exc.details['nMatched']
+
+        applied = None
+        if matched < len(update_ids):
+            applied = {doc['_id'] for doc in collection.find(
+                {'_id': {'$in': update_ids}, 'last_modified': stamp},
+                {'_id': 1})}
+
+        for op_index, i in enumerate(op_indices):
+            error = write_errors.get(op_index)
+            if error is not None and error['code'] == DUPLICATE_KEY_ERROR:
+                # created concurrently, since it was read
+                retry[i] = pending[i]
+            elif error is not None:
+                results[i]['status'] = 'error'
+                results[i]['messages'] = [error['errmsg']]
+            elif (applied is not None and
+                  results[i]['status'] == 'updated' and
+                  pending[i]['_id'] not in applied):
+                retry[i] = pending[i]
+        return retry
+
+    def _prepare_many(self, reqs: List[dict]
+                      ) -> Tuple[List[dict], Dict[int, dict]]:
+        """Builds and validates the documents of a batch write.
+
+        Returns the per-item results, initially `invalid`, and the raw
+        documents of the valid items, keyed by their index in `reqs`.
+        """
+        results = []
+        docs = {}
+        for i, req in enumerate(reqs):
+            name = req.get('name') if isinstance(req, dict) else None
+            result = {'name': name,
+                      'identifier': (self._get_id(name)
+                                     if isinstance(name, str) else None),
+                      'status': 'invalid', 'messages': []}
+            results.append(result)
+            tv_doc, err = self._build_document(req)
+            if tv_doc is not None:
+                try:
+                    tv_doc.validate()
+                except mongoengine.ValidationError as exc:
+                    tv_doc, err = None, [str(exc)]
+            if tv_doc is None:
+                result['messages'] = err
+                continue
+            docs[i] = tv_doc.to_mongo().to_dict()
+        return results, docs
+
+    def _build_document(self, req: dict) -> Tuple[TVSeries, List[str]]:
+        """Builds (without saving) a `TVSeries` document from a dict in the
+        `POST /tv-series` format. Returns the document and error messages;
+        the document is None if `req` is malformed.
+        """
         err = []
 
         MISSING_KEY_MSG = 'Some of the following keys are missing in {}: {}'
@@ -46,16 +494,15 @@ class Database():
         required_season_level_keys = ('season', 'ratings')
         required_episode_keys = ('episode_number', 'rating')
 
-        tv_identifier = self._get_id(req['name'])
-
         try:
+            tv_identifier = self._get_id(req['name'])
             tv_doc = TVSeries(identifier=tv_identifier, name=req['name'],
                               seasons_count=len(req['episode_ratings']),
                               overall_rating=req['series_rating'])
-        except KeyError:
+        except (KeyError, TypeError):
             err.append(MISSING_KEY_MSG.format(
                 'root', required_root_level_keys))
-            return False, err
+            return None, err
 
         try:
             for season in req['episode_ratings']:
@@ -70,27 +517,23 @@ class Database():
                                 episode_number=episode['episode_number'],
                                 rating=episode['rating'])
                         )
-                except KeyError:
+                except (KeyError, TypeError):
                     err.append(MISSING_KEY_MSG.format(
                         'episode_ratings', required_episode_keys))
-                    return False, err
+                    return None, err
 
                 tv_doc.ratings.append(season_doc)
-
-            tv_doc.save()
-        except KeyError:
+        except (KeyError, TypeError):
             err.append(MISSING_KEY_MSG.format(
                 'season', required_season_level_keys))
-            return False, err
+            return None, err
 
-        return len(err) == 0, err
+        return tv_doc, err
+
+    @staticmethod
+    def _episode_summary(doc: dict) -> dict:
+        return {'season': doc['season'], 'episode': doc['episode'],
+                'rating': doc['rating']}
 
     def _get_id(self, name: str):
-        def process_char(c: str):
-            if c.isalnum():
-                return c.lower()
-            elif c == ' ':
-                return '_'
-            else:
-                return ''
-        return ''.join(process_char(c) for c in name)
+        return get_identifier(name)
@@ -0,0 +1,134 @@
+"""
+db/analytics.py
+---------------
+
+Aggregation pipelines that summarize series in Mongo, so that clients get
+statistics (season averages, trends, best and worst episodes, rankings)
+instead of whole documents to compute them from.
+"""
+
+from typing import List
+
+RANKING_METRICS = ('overall_rating', 'mean', 'slope', 'episode')
+
+
+def stats_pipeline(identifier: str, top: int) -> List[dict]:
+    """Returns the pipeline summarizing one series: its `series` fields, its
+    `seasons` (episode count, mean, min, max and standard deviation of the
+    ratings), the `trend` of its season means, and its `top` best and worst
+    episodes, each as a `$facet` of the single result document. The best
+    and worst episodes are left out if `top` is 0 (`$limit` must be
+    positive).
+    """
+    facets = {
+        'series': [{'$project': {'name': 1, 'overall_rating': 1,
+                                 'seasons_count': 1}}],
+        'seasons': [
+            {'$unwind': '$ratings'},
+            {'$project': {
+                '_id': 0,
+                'season': '$ratings._id',
+                'episodes': {'$size': '$ratings.ratings'},
+                'mean': {'$avg': '$ratings.ratings.rating'},
+                'min': {'$min': '$ratings.ratings.rating'},
+                'max': {'$max': '$ratings.ratings.rating'},
+                'stddev': {'$stdDevPop': '$ratings.ratings.rating'}}},
+            {'$sort': {'season': 1}}],
+        'trend': _season_means_stages() + _slope_stages(),
+    }
+    if top > 0:
+        facets['best_episodes'] = _episodes_stages() + [
+            {'$sort': {'rating': -1, 'season': 1, 'episode': 1}},
+            {'$limit': top}]
+        facets['worst_episodes'] = _episodes_stages() + [
+            {'$sort': {'rating': 1, 'season': 1, 'episode': 1}},
+            {'$limit': top}]
+    return [{'$match': {'_id': identifier}}, {'$facet': facets}]
+
+
+def rankings_pipeline(metric: str, k: int, descending: bool = True,
+                      min_seasons: int = 1) -> List[dict]:
+    """Returns the pipeline ranking series (or, for `episode`, episodes of
+    every series) by one of `RANKING_METRICS`, keeping the top `k` of the
+    series with at least `min_seasons` seasons. Results have `_id` (the
+    series identifier), `name` and `value`, and for episodes `season` and
+    `episode`.
+
+    - `overall_rating`: the series' overall rating (sorted by index)
+    - `mean`: the mean rating of all its episodes
+    - `slope`: the trend of its season means, per season
+    - `episode`: an episode's rating
+    """
+    order = -1 if descending else 1
+    stages = [{'$match': {'seasons_count': {'$gte': min_seasons}}}]
+    if metric == 'overall_rating':
+        stages += [
+            {'$match': {'overall_rating': {'$ne': None}}},
+            {'$sort': {'overall_rating': order}},
+            {'$limit': k},
+            {'$project': {'name': 1, 'value': '$overall_rating'}}]
+        return stages
+    if metric == 'mean':
+        stages += _episodes_stages() + [
+            {'$group': {'_id': '$_id', 'name': {'$first': '$name'},
+                        'value': {'$avg': '$rating'}}}]
+    elif metric == 'slope':
+        stages += _season_means_stages() + _slope_stages()
+    elif metric == 'episode':
+        stages += _episodes_stages() + [
+            {'$sort': {'rating': order, '_id': 1, 'season': 1,
+                       'episode': 1}},
+            {'$limit': k},
+            {'$project': {'name': 1, 'season': 1, 'episode': 1,
+                          'value': '$rating'}}]
+        return stages
+    else:
+        raise ValueError(f"`metric` must be one of {RANKING_METRICS}, "
+                         f"got {metric!r}")
+    return stages + [
+        {'$match': {'value': {'$ne': None}}},
+        {'$sort': {'value': order, '_id': 1}},
+        {'$limit': k}]
+
+
+def _episodes_stages() -> List[dict]:
+    """Unwinds series into one document per episode: `_id` (the series),
+    `name`, `season`, `episode` and `rating`."""
+    return [
+        {'$unwind': '$ratings'},
+        {'$unwind': '$ratings.ratings'},
+        {'$project': {'name': 1, 'season': '$ratings._id',
+                      'episode': '$ratings.ratings._id',
+                      'rating': '$ratings.ratings.rating'}}]
+
+
+def _season_means_stages() -> List[dict]:
+    """Unwinds series into one document per season: `_id` (the series),
+    `name`, `x` (the season number) and `y` (its mean rating)."""
+    return [
+        {'$unwind': '$ratings'},
+        {'$project': {'name': 1, 'x': '$ratings._id',
+                      'y': {'$avg': '$ratings.ratings.rating'}}},
+        {'$match': {'y': {'$ne': None}}}]
+
+
+def _slope_stages() -> List[dict]:
+    """Fits a least-squares line through the `(x, y)` documents of each
+    series; `value` is its slope, or None under two points."""
+    return [
+        {'$group': {
+            '_id': '$_id',
+            'name': {'$first': '$name'},
+            'n': {'$sum': 1},
+            'sx': {'$sum': '$x'},
+            'sy': {'$sum': '$y'},
+            'sxx': {'$sum': {'$multiply': ['$x', '$x']}},
+            'sxy': {'$sum': {'$multiply': ['$x', '$y']}}}},
+        {'$project': {'name': 1, 'value': {'$cond': [
+            {'$lt': ['$n', 2]},
+            None,
+            {'$divide': [
+                {'$subtract': [{'$multiply': ['$n', '$sxy']},
+                               {'$multiply': ['$sx', '$sy']}]},
+                {'$subtract': [{'$multiply': ['$n', '$sxx']},
+                               {'$multiply': ['$sx', '$sx']}]}]}]}}}]
@@ -0,0 +1,84 @@
+"""
+db/delta.py
+-----------
+
+Diffs incoming `TVSeries` data against the stored document, so that a refresh
+writes only what changed instead of replacing the whole document.
+"""
+
+import datetime
+from typing import Tuple
+
+
+def diff_tv_series(stored: dict, incoming: dict,
+                   stamp: datetime.datetime) -> Tuple[dict, dict, dict]:
+    """Diffs two raw `TVSeries` documents.
+
+    Returns the `$set` fields that merge `incoming` into `stored`, a summary
+    of the changes, and the `$set` fields that only record that the seasons
+    in `incoming` were checked at `stamp`; the first two are empty if
+    `incoming` changes nothing. Seasons that change get `last_modified` set
+    to `stamp`; the series' own `last_modified` is left to the caller.
+
+    The merge never removes data: seasons and episodes missing from
+    `incoming` are kept. Changed values are set in place, by array index.
+    New seasons and episodes are appended by setting the index one past the
+    end of their array: unlike `$push`, that can be combined in one update
+    with sets of elements inside the same array.
+    """
+    sets = {}
+    changes = {}
+    touches = {}
+
+    for field in ('name', 'overall_rating'):
+        if field in incoming and incoming[field] != stored.get(field):
+            sets[field] = incoming[field]
+            changes[field] = {'old': stored.get(field),
+                              'new': incoming[field]}
+
+    stored_seasons = stored.get('ratings', [])
+    season_indices = {season['_id']: i
+                      for i, season in enumerate(stored_seasons)}
+    seasons_count = len(stored_seasons)
+
+    for season in incoming.get('ratings', []):
+        i = season_indices.get(season['_id'])
+        if i is None:
+            sets[f'ratings.{seasons_count}'] = dict(
+                season, last_modified=stamp, last_checked=stamp)
+            seasons_count += 1
+            changes.setdefault('seasons_added', []).append(season['_id'])
+            continue
+
+        stored_episodes = stored_seasons[i].get('ratings', [])
+        episode_indices = {episode['_id']: j
+                           for j, episode in enumerate(stored_episodes)}
+        episodes_count = len(stored_episodes)
+        season_changed = False
+
+        for episode in season.get('ratings', []):
+            j = episode_indices.get(episode['_id'])
+            if j is None:
+                sets[f'ratings.{i}.ratings.{episodes_count}'] = episode
+                episodes_count += 1
+                season_changed = True
+                changes.setdefault('episodes_added', []).append(
+                    {'season': season['_id'], 'episode': episode['_id']})
+            elif episode.get('rating') != stored_episodes[j].get('rating'):
+                sets[f'ratings.{i}.ratings.{j}.rating'] = episode['rating']
+                season_changed = True
+                changes.setdefault('ratings_changed', []).append(
+                    {'season': season['_id'], 'episode': episode['_id'],
+                     'old': stored_episodes[j].get('rating'),
+                     'new': episode['rating']})
+
+        if episodes_count != stored_seasons[i].get('episodes_count'):
+            sets[f'ratings.{i}.episodes_count'] = episodes_count
+        if season_changed:
+            sets[f'ratings.{i}.last_modified'] = stamp
+        touches[f'ratings.{i}.last_checked'] = stamp
+
+    if seasons_count != stored.get('seasons_count'):
+        sets['seasons_count'] = seasons_count
+
+    return sets, changes, touches
@@ -0,0 +1,96 @@
+"""
+db/episodes.py
+--------------
+
+Keeps the flattened `episode_ratings` collection (one document per episode,
+see `db.models.FlatEpisodeRating`) in sync with `TVSeries`, so that queries
+across series, such as every episode rated above 9, can use an index instead
+of unwinding every series.
+"""
+
+import logging
+import logging.config
+from typing import Iterable, List
+
+from pymongo import DeleteMany, InsertOne, UpdateOne
+from pymongo.errors import PyMongoError
+
+from common import settings, utils
+from db.models import FlatEpisodeRating
+
+try:
+    logging.config.fileConfig(utils.get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+def enabled() -> bool:
+    return settings.EPISODE_RATINGS_SYNC
+
+
+def episode_rows(doc: dict) -> List[dict]:
+    """Flattens a raw `TVSeries` document into `episode_ratings` rows."""
+    return [{'series': doc['_id'], 'series_name': doc.get('name'),
+             'season': season['_id'], 'episode': episode['_id'],
+             'rating': episode.get('rating')}
+            for season in doc.get('ratings', [])
+            for episode in season.get('ratings', [])]
+
+
+def sync_replaced(docs: Iterable[dict]) -> None:
+    """Replaces the rows of series that were written as a whole (created or
+    replaced), with one bulk write."""
+    operations = []
+    for doc in docs:
+        operations.append(DeleteMany({'series': doc['_id']}))
+        operations.extend(InsertOne(row) for row in episode_rows(doc))
+    _write(operations, ordered=True)
+
+
+def sync_merged(docs: Iterable[dict]) -> None:
+    """Upserts the rows of the episodes in series that were merged. Merges
+    never remove episodes, so stored rows absent from `docs` are kept."""
+    operations = [
+        UpdateOne({'series': row['series'], 'season': row['season'],
+                   'episode': row['episode']},
+                  {'$set': row}, upsert=True)
+        for doc in docs for row in episode_rows(doc)]
+    _write(operations, ordered=False)
+
+
+def delete_series(identifier: str) -> None:
+    _write([DeleteMany({'series': identifier})], ordered=True)
+
+
+def rebuild(tv_series_collection, batch_size: int = 500) -> int:
+    """Rebuilds `episode_ratings` from every stored series, `batch_size`
+    series per bulk write, then drops the rows of series that no longer
+    exist. Returns the number of series synced."""
+    synced_ids = []
+    batch = []
+    for doc in tv_series_collection.find({}, {'name': 1, 'ratings._id': 1,
+                                              'ratings.ratings': 1}):
+        batch.append(doc)
+        if len(batch) == batch_size:
+            sync_replaced(batch)
+            synced_ids.extend(doc['_id'] for doc in batch)
+            batch = []
+    if batch:
+        sync_replaced(batch)
+        synced_ids.extend(doc['_id'] for doc in batch)
+    _write([DeleteMany({'series': {'$nin': synced_ids}})], ordered=True)
+    return len(synced_ids)
+
+
+def _write(operations: list, ordered: bool) -> None:
+    """Applies a bulk write to `episode_ratings`. Failures are logged, not
+    raised: `TVSeries` is the source of truth, and `rebuild` restores the
+    copy."""
+    if not operations:
+        return
+    try:
+        FlatEpisodeRating._get_collection().bulk_write(operations,
+                                                       ordered=ordered)
+    except PyMongoError as exc:
+        logger.error(f"Failed to sync episode_ratings: {exc!r}")
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from pymongo import monitoring
+
+from common.utils import singleton
+
+
+@singleton
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Collects connection pool metrics of the process-wide Mongo client.
+
+    Registered as a pymongo event listener by `db.init_db`. Checkout latency
+    is the time between a request asking the pool for a connection and
+    getting one, i.e. the time spent waiting on a full pool or on a new
+    connection's handshake.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__checkout_started = threading.local()
+        self.__checkouts = 0
+        self.__checkout_failures = 0
+        self.__checkout_secs_total = 0.0
+        self.__checkout_secs_max = 0.0
+        self.__connections_created = 0
+        self.__connections_closed = 0
+        self.__checked_out = 0
+
+    def snapshot(self) -> dict:
+        """Returns the metrics collected so far."""
+        with self.__lock:
+            return {
+                'checkouts': self.__checkouts,
+                'checkout_failures': self.__checkout_failures,
+                'checkout_latency_ms_mean': (
+                    1000 * self.__checkout_secs_total / self.__checkouts
+                    if self.__checkouts else 0.0),
+                'checkout_latency_ms_max': 1000 * self.__checkout_secs_max,
+                'connections_checked_out': self.__checked_out,
+                'connections_open': (self.__connections_created -
+                                     self.__connections_closed),
+                'connections_created': self.__connections_created,
+            }
+
+    def connection_check_out_started(self, event):
+        self.__checkout_started.time = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        latency = self._checkout_latency()
+        with self.__lock:
+            self.__checkouts += 1
+            self.__checked_out += 1
+            self.__checkout_secs_total += latency
+            self.__checkout_secs_max = max(self.__checkout_secs_max, latency)
+
+    def connection_check_out_failed(self, event):
+        self._checkout_latency()
+        with self.__lock:
+            self.__checkout_failures += 1
+
+    def connection_checked_in(self, event):
+        with self.__lock:
+            self.__checked_out -= 1
+
+    def connection_created(self, event):
+        with self.__lock:
+            self.__connections_created += 1
+
+    def connection_closed(self, event):
+        with self.__lock:
+            self.__connections_closed += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def _checkout_latency(self) -> float:
+        started = getattr(self.__checkout_started, 'time', None)
+        self.__checkout_started.time = None
+        return 0.0 if started is None else time.perf_counter() - started
@@ -25,10 +25,14 @@ class SeasonRatings(EmbeddedDocument):
         `@season_number` [pk]: season number
         `@episodes_count`: number of episodes in this season
         `@ratings`: a list of `EpisodeRating` defines ratings in this season
+        `@last_modified`: when this season's ratings last changed
+        `@last_checked`: when this season was last extracted, changed or not
     """
     season_number = IntField(min_value=1, primary_key=True)
     episodes_count = IntField(min_value=1)
     ratings = EmbeddedDocumentListField(document_type=EpisodeRating)
+    last_modified = DateTimeField(default=datetime.datetime.utcnow)
+    last_checked = DateTimeField(default=datetime.datetime.utcnow)
 
 
 class TVSeries(Document):
@@ -41,10 +45,45 @@ class TVSeries(Document):
         `@season_count`: number of seasons
         `@overall_rating`: a _float_ definining the season's overall rating (0~10)
         `@ratings`: a list of `SeasonRatings` stores all episode ratings
+
+    Indexed by `name`, `overall_rating` and `last_modified`, for queries
+    across series (e.g. all series rated above 8.5, or recently modified).
     """
+    meta = {
+        'indexes': ['name', '-overall_rating', '-last_modified'],
+    }
+
     identifier = StringField(max_length=120, required=True, primary_key=True)
     name = StringField(max_length=120, required=True)
     last_modified = DateTimeField(default=datetime.datetime.utcnow)
     seasons_count = IntField(min_value=1)
     overall_rating = FloatField(min_value=0, max_value=10)
     ratings = EmbeddedDocumentListField(document_type=SeasonRatings)
+
+
+class FlatEpisodeRating(Document):
+    """Model for the flattened `episode_ratings` collection: one document per
+    episode, copied from `TVSeries` (see `db.episodes`), for queries across
+    the episodes of every series.
+
+    Attributes
+    ----------
+        `@series`: identifier of the `TVSeries` the episode belongs to
+        `@series_name`: name of that series
+        `@season`: season number
+        `@episode`: episode number
+        `@rating`: a _float_ defining this episode's rating (min: 0, max: 10)
+    """
+    meta = {
+        'collection': 'episode_ratings',
+        'indexes': [
+            {'fields': ['series', 'season', 'episode'], 'unique': True},
+            '-rating',
+        ],
+    }
+
+    series = StringField(max_length=120, required=True)
+    series_name = StringField(max_length=120)
+    season = IntField(min_value=1, required=True)
+    episode = IntField(min_value=1, required=True)
+    rating = FloatField(min_value=0, max_value=10)
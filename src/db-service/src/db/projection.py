@@ -0,0 +1,137 @@
+"""
+db/projection.py
+----------------
+
+Builds the aggregations that read part of a `TVSeries` document: some of its
+fields, a range of its seasons (`$slice`), and pages of its episodes, so that
+long series are not sent whole to serve a part of them.
+
+Seasons and episodes are addressed by their position in the stored arrays
+(seasons in the order they were added, normally season order), which is what
+`$slice` works with. Episode pages are walked with a cursor, the position of
+the next episode as `<season position>:<episode position>`.
+"""
+
+from typing import List, Tuple
+
+FIELDS = ('name', 'last_modified', 'seasons_count', 'overall_rating',
+          'ratings')
+SUMMARY = 'summary'
+# served fields of a season, without the bookkeeping `db.SEASON_STAMPS`
+SEASON_FIELDS = ('_id', 'episodes_count')
+# `$slice` count reaching the end of any array
+ALL = 2**31 - 1
+
+
+def parse_fields(fields: str) -> Tuple[List[str], bool]:
+    """Parses a comma-separated list of `FIELDS` (or `summary`, every field
+    but with seasons stripped of their episodes). Returns the top-level
+    fields to include and whether seasons keep their episodes.
+
+    Raises
+    ------
+        ValueError: if a field is unknown
+    """
+    names = [name.strip() for name in fields.split(',') if name.strip()]
+    unknown = [name for name in names
+               if name not in FIELDS and name != SUMMARY]
+    if unknown or not names:
+        raise ValueError(f"`fields` must be some of {FIELDS + (SUMMARY,)}")
+    if SUMMARY in names:
+        return list(FIELDS), 'ratings' in names
+    return names, 'ratings' in names
+
+
+def encode_cursor(season: int, episode: int) -> str:
+    return f'{season}:{episode}'
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """Raises
+    ------
+        ValueError: if `cursor` is malformed
+    """
+    try:
+        season, episode = (int(part) for part in cursor.split(':'))
+    except ValueError:
+        raise ValueError(f"Malformed cursor {cursor!r}") from None
+    if season < 0 or episode < 0:
+        raise ValueError(f"Malformed cursor {cursor!r}")
+    return season, episode
+
+
+def episode_counts_pipeline(identifier: str) -> List[dict]:
+    """Returns the pipeline reading only the number of episodes of each
+    season of a series, as `counts`."""
+    return [
+        {'$match': {'_id': identifier}},
+        {'$project': {'counts': {'$map': {
+            'input': '$ratings', 'as': 'season',
+            'in': {'$size': '$$season.ratings'}}}}},
+    ]
+
+
+def plan_page(counts: List[int], season_offset: int, season_limit: int,
+              start: Tuple[int, int], limit: int
+              ) -> Tuple[List[Tuple[int, int, int]], Tuple[int, int]]:
+    """Plans a page of up to `limit` episodes from the `start` position,
+    within the seasons `[season_offset, season_offset + season_limit)`
+    (`season_limit` None for all the following seasons), given the
+    episode `counts` of every season.
+
+    Returns the `(season position, first episode position, episodes count)`
+    slices of the page, and the position following it, or None if the page
+    ends the range.
+    """
+    end = len(counts) if season_limit is None else min(
+        len(counts), season_offset + season_limit)
+    season, episode = max(start, (season_offset, 0))
+    slices = []
+    while season < end and limit > 0:
+        take = min(limit, counts[season] - episode)
+        if take > 0:
+            slices.append((season, episode, take))
+            limit -= take
+            episode += take
+        if episode >= counts[season]:
+            season, episode = season + 1, 0
+    while season < end and episode >= counts[season]:
+        season, episode = season + 1, 0
+    return slices, ((season, episode) if season < end else None)
+
+
+def partial_pipeline(identifier: str, fields: List[str], episodes: bool,
+                     season_offset: int = 0, season_limit: int = None,
+                     page: List[Tuple[int, int, int]] = None) -> List[dict]:
+    """Returns the pipeline reading the `fields` of a series. If `ratings`
+    is one of them, only the seasons in the range of `season_offset` and
+    `season_limit` are read, or only the episode slices of `page` (see
+    `plan_page`) if provided, and seasons keep their episodes if `episodes`.
+    """
+    projection = {field: 1 for field in fields if field != 'ratings'}
+    if 'ratings' in fields:
+        if page is not None:
+            projection['ratings'] = {'$concatArrays': [
+                _seasons_expression(
+                    {'$slice': ['$ratings', season, 1]},
+                    {'$slice': ['$$season.ratings', first, count]})
+                for season, first, count in page]}
+        else:
+            seasons = '$ratings'
+            if season_offset or season_limit is not None:
+                seasons = {'$slice': [
+                    '$ratings', season_offset,
+                    season_limit if season_limit is not None else ALL]}
+            projection['ratings'] = _seasons_expression(
+                seasons, '$$season.ratings' if episodes else None)
+    return [{'$match': {'_id': identifier}}, {'$project': projection}]
+
+
+def _seasons_expression(seasons, episodes=None) -> dict:
+    """Returns an expression mapping the array of `seasons` to their
+    `SEASON_FIELDS`, with `episodes` as their ratings if provided (an
+    expression of the season, bound to `$$season`)."""
+    fields = {field: f'$$season.{field}' for field in SEASON_FIELDS}
+    if episodes is not None:
+        fields['ratings'] = episodes
+    return {'$map': {'input': seasons, 'as': 'season', 'in': fields}}
@@ -0,0 +1,55 @@
+"""
+db/serializers.py
+-----------------
+
+Encodes raw `TVSeries` documents (as returned by pymongo) straight to JSON
+bytes, without hydrating mongoengine documents or re-parsing JSON.
+
+Uses `orjson` when it is installed, and the standard library otherwise.
+"""
+
+import calendar
+import datetime
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_datetime(dt: datetime.datetime) -> dict:
+    """Encodes a datetime the way `bson.json_util` (legacy mode) does:
+    `{"$date": <epoch millis>}`. None is left as is.
+    """
+    if dt is None:
+        return None
+    millis = (calendar.timegm(dt.utctimetuple()) * 1000 +
+              dt.microsecond // 1000)
+    return {'$date': millis}
+
+
+def _json_default(obj):
+    """Encodes BSON values the way `bson.json_util` (legacy mode) does, so
+    responses keep the shape of `TVSeries.to_json()`.
+    """
+    if isinstance(obj, datetime.datetime):
+        return encode_datetime(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} "
+                    "is not JSON serializable")
+
+
+def encode_tv_series(doc: dict) -> bytes:
+    """Encodes a raw `TVSeries` document to JSON bytes.
+
+    The output has the same keys and values as
+    `jsonify(json.loads(TVSeries.to_json()))`: `_id` is the identifier,
+    `last_modified` is `{"$date": <epoch millis>}`, keys are sorted.
+    """
+    if orjson is not None:
+        # orjson encodes datetimes natively (as ISO strings) unless told not to
+        return orjson.dumps(doc, default=_json_default,
+                            option=(orjson.OPT_SORT_KEYS |
+                                    orjson.OPT_PASSTHROUGH_DATETIME))
+    return json.dumps(doc, default=_json_default, sort_keys=True,
+                      separators=(',', ':')).encode('utf-8')
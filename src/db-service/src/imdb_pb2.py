@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: imdb.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -15,881 +13,57 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='imdb.proto',
-  package='imdb',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n\nimdb.proto\x12\x04imdb\"%\n\x12GenericShowRequest\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"&\n\x11\x43reateShowRequest\x12\x11\n\titem_name\x18\x01 \x01(\t\"L\n\x12\x43reateShowResponse\x12\x0f\n\x07\x63reated\x18\x01 \x01(\x08\x12\x0f\n\x07item_id\x18\x02 \x01(\t\x12\x14\n\x0ctime_created\x18\x03 \x01(\t\"\x17\n\x04Show\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"\x07\n\x05\x45mpty\"&\n\x11\x45xtractionRequest\x12\x11\n\titem_name\x18\x01 \x01(\t\";\n\x12\x45xtractionResponse\x12\x11\n\titem_name\x18\x01 \x01(\t\x12\x12\n\nsuccessful\x18\x02 \x01(\x08\"A\n\x10\x43reateJobRequest\x12\x13\n\x0btarget_name\x18\x01 \x01(\t\x12\x18\n\x10is_high_priority\x18\x02 \x01(\x08\"?\n\x11\x43reateJobResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\x12\x16\n\x03job\x18\x02 \x01(\x0b\x32\t.imdb.Job\"\x1e\n\x10\x44\x65leteJobRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\'\n\x11\x44\x65leteJobResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\x1b\n\rGetJobRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"N\n\x16JobStatusQueryResponse\x12 \n\x06status\x18\x01 \x01(\x0e\x32\x10.imdb.Job.Status\x12\x12\n\nstatus_msg\x18\x02 \x01(\t\"\xa3\x01\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0btarget_name\x18\x02 \x01(\t\x12 \n\x06status\x18\x03 \x01(\x0e\x32\x10.imdb.Job.Status\"Y\n\x06Status\x12\x11\n\rNOT_PROCESSED\x10\x00\x12\x0e\n\nPROCESSING\x10\x01\x12\x15\n\x11\x43OMPLETED_SUCCESS\x10\x02\x12\x15\n\x11\x43OMPLETED_FAILURE\x10\x03\"$\n\x11PredictionRequest\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"/\n\x12PredictionResponse\x12\x19\n\x11is_resource_valid\x18\x01 \x01(\x08\x32\xbe\x01\n\x0f\x44\x61tabaseService\x12\x31\n\x07GetShow\x12\x18.imdb.GenericShowRequest\x1a\n.imdb.Show\"\x00\x12\x41\n\nCreateShow\x12\x17.imdb.CreateShowRequest\x1a\x18.imdb.CreateShowResponse\"\x00\x12\x35\n\nDeleteShow\x12\x18.imdb.GenericShowRequest\x1a\x0b.imdb.Empty\"\x00\x32]\n\x10\x45xtractorService\x12I\n\x12InitiateExtraction\x12\x17.imdb.ExtractionRequest\x1a\x18.imdb.ExtractionResponse\"\x00\x32\xfd\x01\n\nJobService\x12>\n\tCreateJob\x12\x16.imdb.CreateJobRequest\x1a\x17.imdb.CreateJobResponse\"\x00\x12*\n\x06GetJob\x12\x13.imdb.GetJobRequest\x1a\t.imdb.Job\"\x00\x12\x43\n\x0cGetJobStatus\x12\x13.imdb.GetJobRequest\x1a\x1c.imdb.JobStatusQueryResponse\"\x00\x12>\n\tDeleteJob\x12\x16.imdb.DeleteJobRequest\x1a\x17.imdb.DeleteJobResponse\"\x00\x32\x17\n\x15RecommendationService2_\n\x17RatingPredictionService\x12\x44\n\rPredictRating\x12\x17.imdb.PredictionRequest\x1a\x18.imdb.PredictionResponse\"\x00\x62\x06proto3')
-)
-
-
-
-_JOB_STATUS = _descriptor.EnumDescriptor(
-  name='Status',
-  full_name='imdb.Job.Status',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NOT_PROCESSED', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PROCESSING', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COMPLETED_SUCCESS', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COMPLETED_FAILURE', index=3, number=3,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=701,
-  serialized_end=790,
-)
-_sym_db.RegisterEnumDescriptor(_JOB_STATUS)
-
-
-_GENERICSHOWREQUEST = _descriptor.Descriptor(
-  name='GenericShowRequest',
-  full_name='imdb.GenericShowRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_id', full_name='imdb.GenericShowRequest.item_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=20,
-  serialized_end=57,
-)
-
-
-_CREATESHOWREQUEST = _descriptor.Descriptor(
-  name='CreateShowRequest',
-  full_name='imdb.CreateShowRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_name', full_name='imdb.CreateShowRequest.item_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=59,
-  serialized_end=97,
-)
-
-
-_CREATESHOWRESPONSE = _descriptor.Descriptor(
-  name='CreateShowResponse',
-  full_name='imdb.CreateShowResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='created', full_name='imdb.CreateShowResponse.created', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='item_id', full_name='imdb.CreateShowResponse.item_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='time_created', full_name='imdb.CreateShowResponse.time_created', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=99,
-  serialized_end=175,
-)
-
-
-_SHOW = _descriptor.Descriptor(
-  name='Show',
-  full_name='imdb.Show',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_id', full_name='imdb.Show.item_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=177,
-  serialized_end=200,
-)
-
-
-_EMPTY = _descriptor.Descriptor(
-  name='Empty',
-  full_name='imdb.Empty',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=202,
-  serialized_end=209,
-)
-
-
-_EXTRACTIONREQUEST = _descriptor.Descriptor(
-  name='ExtractionRequest',
-  full_name='imdb.ExtractionRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_name', full_name='imdb.ExtractionRequest.item_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=211,
-  serialized_end=249,
-)
-
-
-_EXTRACTIONRESPONSE = _descriptor.Descriptor(
-  name='ExtractionResponse',
-  full_name='imdb.ExtractionResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_name', full_name='imdb.ExtractionResponse.item_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='successful', full_name='imdb.ExtractionResponse.successful', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=251,
-  serialized_end=310,
-)
-
-
-_CREATEJOBREQUEST = _descriptor.Descriptor(
-  name='CreateJobRequest',
-  full_name='imdb.CreateJobRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='target_name', full_name='imdb.CreateJobRequest.target_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='is_high_priority', full_name='imdb.CreateJobRequest.is_high_priority', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=312,
-  serialized_end=377,
-)
-
-
-_CREATEJOBRESPONSE = _descriptor.Descriptor(
-  name='CreateJobResponse',
-  full_name='imdb.CreateJobResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='successful', full_name='imdb.CreateJobResponse.successful', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='job', full_name='imdb.CreateJobResponse.job', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=379,
-  serialized_end=442,
-)
-
-
-_DELETEJOBREQUEST = _descriptor.Descriptor(
-  name='DeleteJobRequest',
-  full_name='imdb.DeleteJobRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='imdb.DeleteJobRequest.id', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=444,
-  serialized_end=474,
-)
-
-
-_DELETEJOBRESPONSE = _descriptor.Descriptor(
-  name='DeleteJobResponse',
-  full_name='imdb.DeleteJobResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='successful', full_name='imdb.DeleteJobResponse.successful', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=476,
-  serialized_end=515,
-)
-
-
-_GETJOBREQUEST = _descriptor.Descriptor(
-  name='GetJobRequest',
-  full_name='imdb.GetJobRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='imdb.GetJobRequest.id', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=517,
-  serialized_end=544,
-)
-
-
-_JOBSTATUSQUERYRESPONSE = _descriptor.Descriptor(
-  name='JobStatusQueryResponse',
-  full_name='imdb.JobStatusQueryResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='imdb.JobStatusQueryResponse.status', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='status_msg', full_name='imdb.JobStatusQueryResponse.status_msg', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=546,
-  serialized_end=624,
-)
-
-
-_JOB = _descriptor.Descriptor(
-  name='Job',
-  full_name='imdb.Job',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='imdb.Job.id', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='target_name', full_name='imdb.Job.target_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='status', full_name='imdb.Job.status', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _JOB_STATUS,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=627,
-  serialized_end=790,
-)
-
-
-_PREDICTIONREQUEST = _descriptor.Descriptor(
-  name='PredictionRequest',
-  full_name='imdb.PredictionRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item_id', full_name='imdb.PredictionRequest.item_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=792,
-  serialized_end=828,
-)
-
-
-_PREDICTIONRESPONSE = _descriptor.Descriptor(
-  name='PredictionResponse',
-  full_name='imdb.PredictionResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='is_resource_valid', full_name='imdb.PredictionResponse.is_resource_valid', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=830,
-  serialized_end=877,
-)
-
-_CREATEJOBRESPONSE.fields_by_name['job'].message_type = _JOB
-_JOBSTATUSQUERYRESPONSE.fields_by_name['status'].enum_type = _JOB_STATUS
-_JOB.fields_by_name['status'].enum_type = _JOB_STATUS
-_JOB_STATUS.containing_type = _JOB
-DESCRIPTOR.message_types_by_name['GenericShowRequest'] = _GENERICSHOWREQUEST
-DESCRIPTOR.message_types_by_name['CreateShowRequest'] = _CREATESHOWREQUEST
-DESCRIPTOR.message_types_by_name['CreateShowResponse'] = _CREATESHOWRESPONSE
-DESCRIPTOR.message_types_by_name['Show'] = _SHOW
-DESCRIPTOR.message_types_by_name['Empty'] = _EMPTY
-DESCRIPTOR.message_types_by_name['ExtractionRequest'] = _EXTRACTIONREQUEST
-DESCRIPTOR.message_types_by_name['ExtractionResponse'] = _EXTRACTIONRESPONSE
-DESCRIPTOR.message_types_by_name['CreateJobRequest'] = _CREATEJOBREQUEST
-DESCRIPTOR.message_types_by_name['CreateJobResponse'] = _CREATEJOBRESPONSE
-DESCRIPTOR.message_types_by_name['DeleteJobRequest'] = _DELETEJOBREQUEST
-DESCRIPTOR.message_types_by_name['DeleteJobResponse'] = _DELETEJOBRESPONSE
-DESCRIPTOR.message_types_by_name['GetJobRequest'] = _GETJOBREQUEST
-DESCRIPTOR.message_types_by_name['JobStatusQueryResponse'] = _JOBSTATUSQUERYRESPONSE
-DESCRIPTOR.message_types_by_name['Job'] = _JOB
-DESCRIPTOR.message_types_by_name['PredictionRequest'] = _PREDICTIONREQUEST
-DESCRIPTOR.message_types_by_name['PredictionResponse'] = _PREDICTIONRESPONSE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-GenericShowRequest = _reflection.GeneratedProtocolMessageType('GenericShowRequest', (_message.Message,), {
-  'DESCRIPTOR' : _GENERICSHOWREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.GenericShowRequest)
-  })
-_sym_db.RegisterMessage(GenericShowRequest)
-
-CreateShowRequest = _reflection.GeneratedProtocolMessageType('CreateShowRequest', (_message.Message,), {
-  'DESCRIPTOR' : _CREATESHOWREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.CreateShowRequest)
-  })
-_sym_db.RegisterMessage(CreateShowRequest)
-
-CreateShowResponse = _reflection.GeneratedProtocolMessageType('CreateShowResponse', (_message.Message,), {
-  'DESCRIPTOR' : _CREATESHOWRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.CreateShowResponse)
-  })
-_sym_db.RegisterMessage(CreateShowResponse)
-
-Show = _reflection.GeneratedProtocolMessageType('Show', (_message.Message,), {
-  'DESCRIPTOR' : _SHOW,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.Show)
-  })
-_sym_db.RegisterMessage(Show)
-
-Empty = _reflection.GeneratedProtocolMessageType('Empty', (_message.Message,), {
-  'DESCRIPTOR' : _EMPTY,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.Empty)
-  })
-_sym_db.RegisterMessage(Empty)
-
-ExtractionRequest = _reflection.GeneratedProtocolMessageType('ExtractionRequest', (_message.Message,), {
-  'DESCRIPTOR' : _EXTRACTIONREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.ExtractionRequest)
-  })
-_sym_db.RegisterMessage(ExtractionRequest)
-
-ExtractionResponse = _reflection.GeneratedProtocolMessageType('ExtractionResponse', (_message.Message,), {
-  'DESCRIPTOR' : _EXTRACTIONRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.ExtractionResponse)
-  })
-_sym_db.RegisterMessage(ExtractionResponse)
-
-CreateJobRequest = _reflection.GeneratedProtocolMessageType('CreateJobRequest', (_message.Message,), {
-  'DESCRIPTOR' : _CREATEJOBREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.CreateJobRequest)
-  })
-_sym_db.RegisterMessage(CreateJobRequest)
-
-CreateJobResponse = _reflection.GeneratedProtocolMessageType('CreateJobResponse', (_message.Message,), {
-  'DESCRIPTOR' : _CREATEJOBRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.CreateJobResponse)
-  })
-_sym_db.RegisterMessage(CreateJobResponse)
-
-DeleteJobRequest = _reflection.GeneratedProtocolMessageType('DeleteJobRequest', (_message.Message,), {
-  'DESCRIPTOR' : _DELETEJOBREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.DeleteJobRequest)
-  })
-_sym_db.RegisterMessage(DeleteJobRequest)
-
-DeleteJobResponse = _reflection.GeneratedProtocolMessageType('DeleteJobResponse', (_message.Message,), {
-  'DESCRIPTOR' : _DELETEJOBRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.DeleteJobResponse)
-  })
-_sym_db.RegisterMessage(DeleteJobResponse)
-
-GetJobRequest = _reflection.GeneratedProtocolMessageType('GetJobRequest', (_message.Message,), {
-  'DESCRIPTOR' : _GETJOBREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.GetJobRequest)
-  })
-_sym_db.RegisterMessage(GetJobRequest)
-
-JobStatusQueryResponse = _reflection.GeneratedProtocolMessageType('JobStatusQueryResponse', (_message.Message,), {
-  'DESCRIPTOR' : _JOBSTATUSQUERYRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.JobStatusQueryResponse)
-  })
-_sym_db.RegisterMessage(JobStatusQueryResponse)
-
-Job = _reflection.GeneratedProtocolMessageType('Job', (_message.Message,), {
-  'DESCRIPTOR' : _JOB,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.Job)
-  })
-_sym_db.RegisterMessage(Job)
-
-PredictionRequest = _reflection.GeneratedProtocolMessageType('PredictionRequest', (_message.Message,), {
-  'DESCRIPTOR' : _PREDICTIONREQUEST,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.PredictionRequest)
-  })
-_sym_db.RegisterMessage(PredictionRequest)
-
-PredictionResponse = _reflection.GeneratedProtocolMessageType('PredictionResponse', (_message.Message,), {
-  'DESCRIPTOR' : _PREDICTIONRESPONSE,
-  '__module__' : 'imdb_pb2'
-  # @@protoc_insertion_point(class_scope:imdb.PredictionResponse)
-  })
-_sym_db.RegisterMessage(PredictionResponse)
-
-
-
-_DATABASESERVICE = _descriptor.ServiceDescriptor(
-  name='DatabaseService',
-  full_name='imdb.DatabaseService',
-  file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
-  serialized_start=880,
-  serialized_end=1070,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='GetShow',
-    full_name='imdb.DatabaseService.GetShow',
-    index=0,
-    containing_service=None,
-    input_type=_GENERICSHOWREQUEST,
-    output_type=_SHOW,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='CreateShow',
-    full_name='imdb.DatabaseService.CreateShow',
-    index=1,
-    containing_service=None,
-    input_type=_CREATESHOWREQUEST,
-    output_type=_CREATESHOWRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='DeleteShow',
-    full_name='imdb.DatabaseService.DeleteShow',
-    index=2,
-    containing_service=None,
-    input_type=_GENERICSHOWREQUEST,
-    output_type=_EMPTY,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_DATABASESERVICE)
-
-DESCRIPTOR.services_by_name['DatabaseService'] = _DATABASESERVICE
-
-
-_EXTRACTORSERVICE = _descriptor.ServiceDescriptor(
-  name='ExtractorService',
-  full_name='imdb.ExtractorService',
-  file=DESCRIPTOR,
-  index=1,
-  serialized_options=None,
-  serialized_start=1072,
-  serialized_end=1165,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='InitiateExtraction',
-    full_name='imdb.ExtractorService.InitiateExtraction',
-    index=0,
-    containing_service=None,
-    input_type=_EXTRACTIONREQUEST,
-    output_type=_EXTRACTIONRESPONSE,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_EXTRACTORSERVICE)
-
-DESCRIPTOR.services_by_name['ExtractorService'] = _EXTRACTORSERVICE
-
-
-_JOBSERVICE = _descriptor.ServiceDescriptor(
-  name='JobService',
-  full_name='imdb.JobService',
-  file=DESCRIPTOR,
-  index=2,
-  serialized_options=None,
-  serialized_start=1168,
-  serialized_end=1421,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='CreateJob',
-    full_name='imdb.JobService.CreateJob',
-    index=0,
-    containing_service=None,
-    input_type=_CREATEJOBREQUEST,
-    output_type=_CREATEJOBRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='GetJob',
-    full_name='imdb.JobService.GetJob',
-    index=1,
-    containing_service=None,
-    input_type=_GETJOBREQUEST,
-    output_type=_JOB,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='GetJobStatus',
-    full_name='imdb.JobService.GetJobStatus',
-    index=2,
-    containing_service=None,
-    input_type=_GETJOBREQUEST,
-    output_type=_JOBSTATUSQUERYRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='DeleteJob',
-    full_name='imdb.JobService.DeleteJob',
-    index=3,
-    containing_service=None,
-    input_type=_DELETEJOBREQUEST,
-    output_type=_DELETEJOBRESPONSE,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_JOBSERVICE)
-
-DESCRIPTOR.services_by_name['JobService'] = _JOBSERVICE
-
-
-_RECOMMENDATIONSERVICE = _descriptor.ServiceDescriptor(
-  name='RecommendationService',
-  full_name='imdb.RecommendationService',
-  file=DESCRIPTOR,
-  index=3,
-  serialized_options=None,
-  serialized_start=1423,
-  serialized_end=1446,
-  methods=[
-])
-_sym_db.RegisterServiceDescriptor(_RECOMMENDATIONSERVICE)
-
-DESCRIPTOR.services_by_name['RecommendationService'] = _RECOMMENDATIONSERVICE
-
-
-_RATINGPREDICTIONSERVICE = _descriptor.ServiceDescriptor(
-  name='RatingPredictionService',
-  full_name='imdb.RatingPredictionService',
-  file=DESCRIPTOR,
-  index=4,
-  serialized_options=None,
-  serialized_start=1448,
-  serialized_end=1543,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='PredictRating',
-    full_name='imdb.RatingPredictionService.PredictRating',
-    index=0,
-    containing_service=None,
-    input_type=_PREDICTIONREQUEST,
-    output_type=_PREDICTIONRESPONSE,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_RATINGPREDICTIONSERVICE)
-
-DESCRIPTOR.services_by_name['RatingPredictionService'] = _RATINGPREDICTIONSERVICE
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nimdb.proto\x12\x04imdb\"%\n\x12GenericShowRequest\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"&\n\x11\x43reateShowRequest\x12\x11\n\titem_name\x18\x01 \x01(\t\"L\n\x12\x43reateShowResponse\x12\x0f\n\x07\x63reated\x18\x01 \x01(\x08\x12\x0f\n\x07item_id\x18\x02 \x01(\t\x12\x14\n\x0ctime_created\x18\x03 \x01(\t\"\x17\n\x04Show\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"\x07\n\x05\x45mpty\"&\n\x11\x45xtractionRequest\x12\x11\n\titem_name\x18\x01 \x01(\t\";\n\x12\x45xtractionResponse\x12\x11\n\titem_name\x18\x01 \x01(\t\x12\x12\n\nsuccessful\x18\x02 \x01(\x08\"\x8f\x01\n\x12\x45xtractionProgress\x12\x11\n\titem_name\x18\x01 \x01(\t\x12\x15\n\rseason_number\x18\x02 \x01(\x05\x12\x15\n\rseasons_count\x18\x03 \x01(\x05\x12\x16\n\x0e\x65pisodes_count\x18\x04 \x01(\x05\x12\x0c\n\x04\x64one\x18\x05 \x01(\x08\x12\x12\n\nsuccessful\x18\x06 \x01(\x08\"A\n\x10\x43reateJobRequest\x12\x13\n\x0btarget_name\x18\x01 \x01(\t\x12\x18\n\x10is_high_priority\x18\x02 \x01(\x08\"<\n\x11\x43reateJobResponse\x12\x0f\n\x07\x63reated\x18\x01 \x01(\x08\x12\x16\n\x03job\x18\x02 \x01(\x0b\x32\t.imdb.Job\"\x1e\n\x10\x44\x65leteJobRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\'\n\x11\x44\x65leteJobResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\x1b\n\rGetJobRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"N\n\x16JobStatusQueryResponse\x12 \n\x06status\x18\x01 \x01(\x0e\x32\x10.imdb.Job.Status\x12\x12\n\nstatus_msg\x18\x02 \x01(\t\"\xa3\x01\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0btarget_name\x18\x02 \x01(\t\x12 \n\x06status\x18\x03 \x01(\x0e\x32\x10.imdb.Job.Status\"Y\n\x06Status\x12\x11\n\rNOT_PROCESSED\x10\x00\x12\x0e\n\nPROCESSING\x10\x01\x12\x15\n\x11\x43OMPLETED_SUCCESS\x10\x02\x12\x15\n\x11\x43OMPLETED_FAILURE\x10\x03\"$\n\x11PredictionRequest\x12\x0f\n\x07item_id\x18\x01 \x01(\t\"/\n\x12PredictionResponse\x12\x19\n\x11is_resource_valid\x18\x01 \x01(\x08\x32\xbe\x01\n\x0f\x44\x61tabaseService\x12\x31\n\x07GetShow\x12\x18.imdb.GenericShowRequest\x1a\n.imdb.Show\"\x00\x12\x41\n\nCreateShow\x12\x17.imdb.CreateShowRequest\x1a\x18.imdb.CreateShowResponse\"\x00\x12\x35\n\nDeleteShow\x12\x18.imdb.GenericShowRequest\x1a\x0b.imdb.Empty\"\x00\x32\xa8\x01\n\x10\x45xtractorService\x12I\n\x12InitiateExtraction\x12\x17.imdb.ExtractionRequest\x1a\x18.imdb.ExtractionResponse\"\x00\x12I\n\x10StreamExtraction\x12\x17.imdb.ExtractionRequest\x1a\x18.imdb.ExtractionProgress\"\x00\x30\x01\x32\xfd\x01\n\nJobService\x12>\n\tCreateJob\x12\x16.imdb.CreateJobRequest\x1a\x17.imdb.CreateJobResponse\"\x00\x12*\n\x06GetJob\x12\x13.imdb.GetJobRequest\x1a\t.imdb.Job\"\x00\x12\x43\n\x0cGetJobStatus\x12\x13.imdb.GetJobRequest\x1a\x1c.imdb.JobStatusQueryResponse\"\x00\x12>\n\tDeleteJob\x12\x16.imdb.DeleteJobRequest\x1a\x17.imdb.DeleteJobResponse\"\x00\x32\x17\n\x15RecommendationService2_\n\x17RatingPredictionService\x12\x44\n\rPredictRating\x12\x17.imdb.PredictionRequest\x1a\x18.imdb.PredictionResponse\"\x00\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'imdb_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _GENERICSHOWREQUEST._serialized_start=20
+  _GENERICSHOWREQUEST._serialized_end=57
+  _CREATESHOWREQUEST._serialized_start=59
+  _CREATESHOWREQUEST._serialized_end=97
+  _CREATESHOWRESPONSE._serialized_start=99
+  _CREATESHOWRESPONSE._serialized_end=175
+  _SHOW._serialized_start=177
+  _SHOW._serialized_end=200
+  _EMPTY._serialized_start=202
+  _EMPTY._serialized_end=209
+  _EXTRACTIONREQUEST._serialized_start=211
+  _EXTRACTIONREQUEST._serialized_end=249
+  _EXTRACTIONRESPONSE._serialized_start=251
+  _EXTRACTIONRESPONSE._serialized_end=310
+  _EXTRACTIONPROGRESS._serialized_start=313
+  _EXTRACTIONPROGRESS._serialized_end=456
+  _CREATEJOBREQUEST._serialized_start=458
+  _CREATEJOBREQUEST._serialized_end=523
+  _CREATEJOBRESPONSE._serialized_start=525
+  _CREATEJOBRESPONSE._serialized_end=585
+  _DELETEJOBREQUEST._serialized_start=587
+  _DELETEJOBREQUEST._serialized_end=617
+  _DELETEJOBRESPONSE._serialized_start=619
+  _DELETEJOBRESPONSE._serialized_end=658
+  _GETJOBREQUEST._serialized_start=660
+  _GETJOBREQUEST._serialized_end=687
+  _JOBSTATUSQUERYRESPONSE._serialized_start=689
+  _JOBSTATUSQUERYRESPONSE._serialized_end=767
+  _JOB._serialized_start=770
+  _JOB._serialized_end=933
+  _JOB_STATUS._serialized_start=844
+  _JOB_STATUS._serialized_end=933
+  _PREDICTIONREQUEST._serialized_start=935
+  _PREDICTIONREQUEST._serialized_end=971
+  _PREDICTIONRESPONSE._serialized_start=973
+  _PREDICTIONRESPONSE._serialized_end=1020
+  _DATABASESERVICE._serialized_start=1023
+  _DATABASESERVICE._serialized_end=1213
+  _EXTRACTORSERVICE._serialized_start=1216
+  _EXTRACTORSERVICE._serialized_end=1384
+  _JOBSERVICE._serialized_start=1387
+  _JOBSERVICE._serialized_end=1640
+  _RECOMMENDATIONSERVICE._serialized_start=1642
+  _RECOMMENDATIONSERVICE._serialized_end=1665
+  _RATINGPREDICTIONSERVICE._serialized_start=1667
+  _RATINGPREDICTIONSERVICE._serialized_end=1762
 # @@protoc_insertion_point(module_scope)
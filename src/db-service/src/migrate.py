@@ -0,0 +1,72 @@
+"""
+migrate.py
+----------
+
+Schema migrations, run from the service's root:
+
+    python3 src/migrate.py indexes        # build the declared indexes
+    python3 src/migrate.py episodes       # (re)build `episode_ratings`
+    python3 src/migrate.py drop-episodes  # drop `episode_ratings`
+
+Every command is idempotent. Set `EPISODE_RATINGS_SYNC` before running
+`episodes`, so that writes made during and after the rebuild are synced.
+"""
+
+import argparse
+import logging
+import logging.config
+import sys
+import time
+
+from common import utils
+from db import episodes, init_db
+from db.models import FlatEpisodeRating, TVSeries
+
+try:
+    logging.config.fileConfig(utils.get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+def build_indexes():
+    for model in (TVSeries, FlatEpisodeRating):
+        start = time.perf_counter()
+        model.ensure_indexes()
+        names = sorted(model._get_collection().index_information())
+        logger.info(f"{model._get_collection_name()}: indexes {names} "
+                    f"({time.perf_counter() - start:.1f}s)")
+
+
+def rebuild_episodes(batch_size: int):
+    FlatEpisodeRating.ensure_indexes()
+    start = time.perf_counter()
+    count = episodes.rebuild(TVSeries._get_collection(), batch_size)
+    logger.info(f"episode_ratings: synced {count} series "
+                f"({time.perf_counter() - start:.1f}s)")
+
+
+def drop_episodes():
+    FlatEpisodeRating.drop_collection()
+    logger.info("episode_ratings: dropped")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="db-service migrations.")
+    parser.add_argument('command',
+                        choices=('indexes', 'episodes', 'drop-episodes'))
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help="series per bulk write, for `episodes`")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    init_db()
+    if args.command == 'indexes':
+        build_indexes()
+    elif args.command == 'episodes':
+        rebuild_episodes(args.batch_size)
+    else:
+        drop_episodes()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import logging
+import logging.config
+
+from flask_restful import Resource, reqparse
+
+from common import utils
+from db import Database
+from db.analytics import RANKING_METRICS
+
+try:
+    logging.config.fileConfig(utils.get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+MAX_K = 100
+
+
+class TVSeriesStats(Resource):
+    """Summary of a series, computed by Mongo: per-season episode count, mean,
+    min, max and standard deviation, the trend (slope per season) of the
+    season means, and the `top` best and worst episodes.
+
+    `GET /tv-series/stats?name=...&top=5`
+    """
+
+    def __init__(self):
+        self._parser = reqparse.RequestParser()
+        self._parser.add_argument('name', type=str, required=True,
+                                  location='args')
+        self._parser.add_argument('top', type=utils.bounded_int(0, MAX_K),
+                                  default=5, location='args')
+
+    def get(self):
+        args = self._parser.parse_args()
+        identifier = args['name']
+        logger.info(f"Initiating GET stats of `{identifier}`")
+
+        with Database() as db:
+            stats = db.series_stats(identifier, args['top'])
+        if stats is None:
+            return {"message": f"TVSeries '{identifier}' not found"}, 404
+        return stats
+
+
+class TVSeriesRankings(Resource):
+    """Top `k` series across the database by `metric`: `overall_rating`,
+    `mean` (of all episodes), `slope` (trend of the season means), or
+    `episode` to rank episodes of every series instead.
+
+    `GET /tv-series/rankings?metric=mean&k=10&order=desc&min_seasons=1`
+    """
+
+    def __init__(self):
+        self._parser = reqparse.RequestParser()
+        self._parser.add_argument('metric', type=str, location='args',
+                                  default='overall_rating',
+                                  choices=RANKING_METRICS)
+        self._parser.add_argument('k', type=utils.bounded_int(1, MAX_K),
+                                  default=10, location='args')
+        self._parser.add_argument('order', type=str, location='args',
+                                  default='desc', choices=('asc', 'desc'))
+        self._parser.add_argument('min_seasons',
+                                  type=utils.bounded_int(1, 1000),
+                                  default=1, location='args')
+
+    def get(self):
+        args = self._parser.parse_args()
+        logger.info(f"Initiating GET rankings by `{args['metric']}`")
+
+        with Database() as db:
+            results = db.rankings(args['metric'], args['k'],
+                                  descending=args['order'] == 'desc',
+                                  min_seasons=args['min_seasons'])
+        return {'metric': args['metric'], 'order': args['order'],
+                'results': results}
@@ -0,0 +1,100 @@
+"""
+resources/conditional.py
+------------------------
+
+Validators (`ETag`, `Last-Modified`) and `Cache-Control` of `GET` responses,
+and the checks of conditional requests (`If-None-Match`,
+`If-Modified-Since`) against them, which can run before the response is
+built.
+"""
+
+import datetime
+import zlib
+
+from flask import Response, request
+
+from common import compression, settings
+
+
+def make_etag(identifier: str, changed_at: datetime.datetime,
+              variant: str = None) -> str:
+    """Returns the (unquoted) strong ETag of a series representation: its
+    identifier, when it last changed, and a hash of the `variant` (e.g. the
+    query selecting part of the series) if any. None if `changed_at` is.
+    """
+    if changed_at is None:
+        return None
+    millis = int((changed_at - datetime.datetime(1970, 1, 1)) /
+                 datetime.timedelta(milliseconds=1))
+    etag = f'{identifier}-{millis:x}'
+    if variant:
+        etag += f'-{zlib.crc32(variant.encode("utf-8")):08x}'
+    return etag
+
+
+def encoded_etag(etag: str, encoding: str = None) -> str:
+    """Returns the ETag of the representation of `etag` compressed with
+    `encoding` (a distinct representation, thus a distinct strong ETag)."""
+    if etag is None or encoding is None:
+        return etag
+    return f'{etag}-{encoding}'
+
+
+def is_conditional() -> bool:
+    return bool(request.if_none_match) or (
+        request.if_modified_since is not None)
+
+
+def is_not_modified(etag: str, last_modified: datetime.datetime) -> bool:
+    """Returns whether the client's copy is current: its `If-None-Match`
+    matches `etag` (in any encoding) or, without `If-None-Match`,
+    `last_modified` is not after its `If-Modified-Since`.
+    """
+    if request.if_none_match:
+        return _matched_etag(etag) is not None
+    since = request.if_modified_since
+    if since is None or last_modified is None:
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    # HTTP dates have a precision of a second
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(etag: str, last_modified: datetime.datetime) -> Response:
+    """Returns a `304 Not Modified`, with the ETag the client matched."""
+    return with_validators(Response(status=304),
+                           _matched_etag(etag) or etag, last_modified)
+
+
+def with_validators(response: Response, etag: str,
+                    last_modified: datetime.datetime) -> Response:
+    """Sets the validators, `Vary` and `Cache-Control` of a response: shared
+    caches (a reverse proxy) and browsers may reuse it, for clients
+    accepting the same encodings, for `HTTP_CACHE_MAX_AGE_SECS`, then
+    revalidate it.
+    """
+    if etag is not None:
+        response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified.replace(
+            tzinfo=datetime.timezone.utc)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    if settings.HTTP_CACHE_MAX_AGE_SECS > 0:
+        response.cache_control.max_age = settings.HTTP_CACHE_MAX_AGE_SECS
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
+def _matched_etag(etag: str) -> str:
+    """Returns the ETag of `If-None-Match` matching `etag` (in any
+    encoding), or None."""
+    if etag is None:
+        return None
+    for encoding in (None,) + compression.ENCODINGS:
+        candidate = encoded_etag(etag, encoding)
+        if request.if_none_match.contains_weak(candidate):
+            return candidate
+    return None
@@ -0,0 +1,30 @@
+"""
+resources/encoding.py
+---------------------
+
+Negotiates the content coding of JSON responses with `Accept-Encoding`, and
+builds them (see `common.compression`).
+"""
+
+from flask import Response, request
+
+from common import compression, settings
+
+
+def negotiate(size: int) -> str:
+    """Returns the preferred encoding of `compression.ENCODINGS` the client
+    accepts for a body of `size` bytes, or None to send it as is (also when
+    it is under `COMPRESSION_MIN_BYTES`, not worth compressing).
+    """
+    if size < settings.COMPRESSION_MIN_BYTES:
+        return None
+    return request.accept_encodings.best_match(compression.ENCODINGS)
+
+
+def json_response(body: bytes, encoding: str = None) -> Response:
+    """Returns a JSON response of `body`, already compressed with `encoding`
+    if provided."""
+    response = Response(body, mimetype='application/json')
+    if encoding is not None:
+        response.content_encoding = encoding
+    return response
@@ -0,0 +1,22 @@
+import logging
+import logging.config
+
+from flask_restful import Resource
+
+from common import utils
+from db.metrics import PoolMetrics
+from resources.tvseries import response_cache
+
+try:
+    logging.config.fileConfig(utils.get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+class Metrics(Resource):
+    def get(self):
+        return {
+            'mongo_pool': PoolMetrics().snapshot(),
+            'response_cache': response_cache.stats(),
+        }
@@ -1,16 +1,20 @@
-import json
 import logging
 import logging.config
 import threading
+from typing import List
+
 import requests
 
 import grpc
 
-from flask import jsonify, request
+from flask import Response, request
 from flask_restful import Resource, reqparse
 
-from common import settings, utils
-from db import Database
+from common import compression, settings, utils
+from common.cache import CachedResponse, ResponseCache
+from db import Database, get_identifier, projection
+from resources import conditional, encoding
+from db.serializers import encode_datetime, encode_tv_series
 
 import imdb_pb2
 import imdb_pb2_grpc
@@ -22,6 +26,11 @@ except FileNotFoundError as e:
     print(e)
 logger = logging.getLogger(__name__)
 
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl_secs=settings.RESPONSE_CACHE_TTL_SECS)
+
 
 def schedule_extraction_job(series_name: str):
     logger.info(("Attempting to schedule a extraction job "
@@ -36,17 +45,51 @@ def schedule_extraction_job(series_name: str):
 
 
 class TVSeries(Resource):
+    PARTIAL_ARGS = ('fields', 'season_offset', 'season_limit', 'cursor',
+                    'episode_limit')
+    MAX_EPISODE_LIMIT = 5000
+
     def __init__(self):
         self._parser = reqparse.RequestParser()
         self._parser.add_argument('name', type=str, required=True)
+        self._parser.add_argument('fields', type=str, location='args')
+        self._parser.add_argument('season_offset', location='args',
+                                  type=utils.bounded_int(0, 10**6))
+        self._parser.add_argument('season_limit', location='args',
+                                  type=utils.bounded_int(1, 10**6))
+        self._parser.add_argument('cursor', type=str, location='args')
+        self._parser.add_argument(
+            'episode_limit', location='args',
+            type=utils.bounded_int(1, self.MAX_EPISODE_LIMIT))
 
     def get(self):
         args = self._parser.parse_args()
         identifier = args['name']
         logger.info(f"Initiating GET `{identifier}`")
 
+        if any(args[arg] is not None for arg in self.PARTIAL_ARGS):
+            return self._get_partial(args)
+
+        cache_key = get_identifier(identifier)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"{identifier} found in response cache.")
+            return self._respond(cache_key, cached)
+
+        if conditional.is_conditional():
+            # answer revalidations without reading the whole series
+            with Database() as db:
+                try:
+                    changed_at = db.find_last_modified(identifier)
+                except KeyError:
+                    changed_at = None
+            etag = conditional.make_etag(cache_key, changed_at)
+            if conditional.is_not_modified(etag, changed_at):
+                return conditional.not_modified(etag, changed_at)
+
+        version = response_cache.version()
         with Database() as db:
-            resp = db.find(identifier)
+            resp = db.find_raw(identifier)
 
         if resp is None:
             logger.error(f"`{identifier}` could not be found in the database.")
@@ -62,15 +105,99 @@ class TVSeries(Resource):
         else:
             logger.info((f"{identifier} found in database; "
                          "Returning the series' data."))
-            return jsonify(json.loads(resp.to_json()))
+            changed_at = resp.get('last_modified')
+            cached = CachedResponse(
+                encode_tv_series(resp),
+                conditional.make_etag(cache_key, changed_at), changed_at, {})
+            response_cache.put(cache_key, cached, version)
+            return self._respond(cache_key, cached)
+
+    def _respond(self, cache_key: str, cached: CachedResponse) -> Response:
+        """Serves a cached response, compressed if the client accepts it;
+        compressed bodies are cached with the response.
+        """
+        if conditional.is_not_modified(cached.etag, cached.last_modified):
+            return conditional.not_modified(cached.etag, cached.last_modified)
+        content_encoding = encoding.negotiate(len(cached.body))
+        body = cached.body
+        if content_encoding is not None:
+            body = cached.encoded.get(content_encoding)
+            if body is None:
+                body = compression.compress(cached.body, content_encoding)
+                response_cache.put_encoded(cache_key, cached,
+                                           content_encoding, body)
+        return conditional.with_validators(
+            encoding.json_response(body, content_encoding),
+            conditional.encoded_etag(cached.etag, content_encoding),
+            cached.last_modified)
+
+    def _get_partial(self, args: dict):
+        """Serves part of a series (see `Database.find_partial`), uncached.
+        Its timestamps are read first, to answer revalidations without
+        reading the part.
+        """
+        identifier = args['name']
+        variant = '&'.join(f'{arg}={args[arg]}' for arg in self.PARTIAL_ARGS
+                           if args[arg] is not None)
+        try:
+            fields, episodes = projection.parse_fields(
+                args['fields'] or ','.join(projection.FIELDS))
+            with Database() as db:
+                try:
+                    changed_at = db.find_last_modified(identifier)
+                except KeyError:
+                    return ({"message": f"TVSeries '{identifier}' not found"},
+                            404)
+                etag = conditional.make_etag(get_identifier(identifier),
+                                             changed_at, variant)
+                if conditional.is_not_modified(etag, changed_at):
+                    return conditional.not_modified(etag, changed_at)
+                doc = db.find_partial(
+                    identifier, fields, episodes,
+                    season_offset=args['season_offset'] or 0,
+                    season_limit=args['season_limit'],
+                    cursor=args['cursor'],
+                    episode_limit=args['episode_limit'])
+        except ValueError as exc:
+            return {'message': str(exc)}, 400
+
+        if doc is None:
+            return {"message": f"TVSeries '{identifier}' not found"}, 404
+        body = encode_tv_series(doc)
+        content_encoding = encoding.negotiate(len(body))
+        if content_encoding is not None:
+            body = compression.compress(body, content_encoding)
+        return conditional.with_validators(
+            encoding.json_response(body, content_encoding),
+            conditional.encoded_etag(etag, content_encoding), changed_at)
 
     def post(self):
+        req = request.get_json(silent=True)
+        if not isinstance(req, dict) or not isinstance(req.get('name'), str):
+            return {'Messages': ['Expected a JSON object with a string '
+                                 '`name`']}, 400
+
         with Database() as db:
-            resp, msgs = db.add_from_dict(request.json)
+            resp, msgs = db.add_from_dict(req)
+        response_cache.invalidate(get_identifier(req['name']))
 
         if resp == False:
             return {'Messages': msgs}, 400
-        return request.json
+        return req
+
+    def put(self):
+        """Merges the series into the stored one, writing only what changed.
+        """
+        with Database() as db:
+            result, = db.merge_many_from_dicts([request.get_json(silent=True)])
+        if result['status'] in ('created', 'updated'):
+            response_cache.invalidate(result['identifier'])
+
+        if result['status'] == 'invalid':
+            return {'Messages': result['messages']}, 400
+        if result['status'] == 'error':
+            return {'Messages': result['messages']}, 500
+        return result
 
     def delete(self):
         args = self._parser.parse_args()
@@ -78,6 +205,7 @@ class TVSeries(Resource):
 
         with Database() as db:
             status = db.delete(identifier)
+        response_cache.invalidate(get_identifier(identifier))
 
         if status == False:
             return {"message": f"TVSeries '{identifier}' not found"}, 404
@@ -97,3 +225,77 @@ class TVSeries(Resource):
         else:
             logger.info(("Start a background thread for extraction "
                          f"job scheduling, TID={t.ident}"))
+
+
+class TVSeriesBatch(Resource):
+    """Existence checks and writes of many series per request.
+
+    `GET /tv-series/batch?name=a&name=b` answers, in one query, which of the
+    series exist. `POST /tv-series/batch` takes a list of series, in the
+    format of `POST /tv-series`, and creates or replaces them in one bulk
+    write; with `?mode=merge`, it merges them into the stored series as
+    `PUT /tv-series` does instead. Each item gets its own status, so one bad
+    item does not fail the others.
+    """
+
+    WRITE_MODES = ('replace', 'merge')
+
+    def __init__(self):
+        self._parser = reqparse.RequestParser()
+        self._parser.add_argument('name', type=str, required=True,
+                                  action='append', location='args')
+        self._parser.add_argument('include', type=str, location='args',
+                                  choices=('seasons',))
+
+    def get(self):
+        args = self._parser.parse_args()
+        names = args['name']
+        logger.info(f"Initiating batch GET of {len(names)} series")
+        if args['include'] == 'seasons':
+            return {'results': self._season_summaries(names)}
+
+        with Database() as db:
+            exists = db.exist_many(names)
+        return {'results': [{'name': name,
+                             'identifier': get_identifier(name),
+                             'exists': exists[name]} for name in names]}
+
+    def post(self):
+        mode = request.args.get('mode', 'replace')
+        if mode not in self.WRITE_MODES:
+            return {'Messages': [
+                f"`mode` must be one of {self.WRITE_MODES}"]}, 400
+        reqs = request.get_json(silent=True)
+        if not isinstance(reqs, list):
+            return {'Messages': ['Expected a JSON list of TV series']}, 400
+        logger.info(f"Initiating batch POST ({mode}) of {len(reqs)} series")
+
+        with Database() as db:
+            if mode == 'merge':
+                results = db.merge_many_from_dicts(reqs)
+            else:
+                results = db.add_many_from_dicts(reqs)
+        for result in results:
+            if result['status'] in ('created', 'replaced', 'updated'):
+                response_cache.invalidate(result['identifier'])
+        return {'results': results}
+
+    def _season_summaries(self, names: List[str]) -> List[dict]:
+        with Database() as db:
+            summaries = db.season_summaries(names)
+        results = []
+        for name in names:
+            result = {'name': name, 'identifier': get_identifier(name),
+                      'exists': summaries[name] is not None}
+            if result['exists']:
+                summary = summaries[name]
+                result['last_modified'] = encode_datetime(
+                    summary['last_modified'])
+                result['seasons'] = [
+                    dict(season,
+                         last_modified=encode_datetime(
+                             season['last_modified']),
+                         last_checked=encode_datetime(season['last_checked']))
+                    for season in summary['seasons']]
+            results.append(result)
+        return results
@@ -0,0 +1,130 @@
+import time
+
+from tests.context import common
+from common.cache import CachedResponse, ResponseCache
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.put('a', CachedResponse(b'a'))
+    cache.put('b', CachedResponse(b'b'))
+    cache.get('a')
+    cache.put('c', CachedResponse(b'c'))
+
+    assert cache.get('b') is None
+    assert cache.get('a').body == b'a'
+    assert cache.get('c').body == b'c'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_max_bytes():
+    cache = ResponseCache(max_bytes=25)
+    cache.put('a', CachedResponse(b'x' * 10))
+    cache.put('b', CachedResponse(b'x' * 10))
+    cache.put('c', CachedResponse(b'x' * 10))
+    cache.put('d', CachedResponse(b'x' * 30))
+
+    assert cache.get('a') is None
+    assert cache.get('b') is not None
+    assert cache.get('c') is not None
+    assert cache.get('d') is None
+    assert cache.stats()['bytes'] == 22
+
+
+def test_ttl():
+    cache = ResponseCache(ttl_secs=0.05)
+    cache.put('a', CachedResponse(b'a'))
+    assert cache.get('a') is not None
+    time.sleep(0.06)
+
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    cache.put('a', CachedResponse(b'a'))
+    cache.invalidate('a')
+
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def test_put_read_before_invalidation_dropped():
+    cache = ResponseCache()
+    version = cache.version()
+    cache.invalidate('a')
+    cache.put('a', CachedResponse(b'stale'), version)
+    cache.put('b', CachedResponse(b'b'), version)
+
+    assert cache.get('a') is None
+    assert cache.get('b').body == b'b'
+
+    cache.put('a', CachedResponse(b'fresh'), cache.version())
+    assert cache.get('a').body == b'fresh'
+
+
+def test_forgotten_invalidations_drop_older_reads():
+    cache = ResponseCache(max_entries=1)
+    version = cache.version()
+    for key in 'abcde':
+        cache.invalidate(key)
+
+    cache.put('z', CachedResponse(b'z'), version)
+    assert cache.get('z') is None
+
+
+def test_put_encoded():
+    cache = ResponseCache(max_bytes=100)
+    response = CachedResponse(b'x' * 30, encoded={})
+    cache.put('a', response)
+    cache.put_encoded('a', response, 'gzip', b'z' * 10)
+
+    assert cache.get('a').encoded == {'gzip': b'z' * 10}
+    assert cache.stats()['bytes'] == 41
+
+
+def test_put_encoded_evicts_others():
+    cache = ResponseCache(max_bytes=100)
+    response = CachedResponse(b'x' * 30, encoded={})
+    cache.put('a', response)
+    cache.put('b', CachedResponse(b'y' * 30, encoded={}))
+    cache.put_encoded('a', response, 'gzip', b'z' * 40)
+
+    assert cache.get('b') is None
+    assert cache.get('a').encoded == {'gzip': b'z' * 40}
+    assert cache.stats()['bytes'] == 71
+
+
+def test_put_encoded_over_max_bytes():
+    cache = ResponseCache(max_bytes=100)
+    response = CachedResponse(b'x' * 30, encoded={})
+    cache.put('a', response)
+    cache.put('b', CachedResponse(b'y' * 30, encoded={}))
+    cache.put_encoded('a', response, 'gzip', b'z' * 70)
+
+    assert cache.get('a').encoded == {}
+    assert cache.get('b') is not None
+    assert cache.stats()['bytes'] <= 100
+
+
+def test_put_encoded_after_invalidation():
+    cache = ResponseCache()
+    response = CachedResponse(b'x' * 30, encoded={})
+    cache.put('a', response)
+    cache.invalidate('a')
+    cache.put_encoded('a', response, 'gzip', b'z' * 10)
+
+    assert cache.stats()['bytes'] == 0
+
+
+def test_put_encoded_stale_response():
+    cache = ResponseCache()
+    stale = CachedResponse(b'x' * 30, encoded={})
+    cache.put('a', stale)
+    cache.invalidate('a')
+    cache.put('a', CachedResponse(b'y' * 30, encoded={}))
+    cache.put_encoded('a', stale, 'gzip', b'z' * 10)
+
+    assert cache.get('a').encoded == {}
+    assert stale.encoded == {}
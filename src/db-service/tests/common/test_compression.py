@@ -0,0 +1,21 @@
+import gzip
+
+import pytest
+
+from tests.context import common
+from common import compression
+
+
+def test_gzip():
+    body = b'{"name": "Game of Thrones"}' * 100
+    compressed = compression.compress(body, 'gzip')
+
+    assert gzip.decompress(compressed) == body
+    # the same body compresses to the same bytes, for a stable ETag
+    assert compression.compress(body, 'gzip') == compressed
+    assert 'gzip' in compression.ENCODINGS
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        compression.compress(b'{}', 'deflate')
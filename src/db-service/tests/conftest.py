@@ -0,0 +1,57 @@
+import mongoengine
+import pytest
+
+from tests.context import db
+
+
+@pytest.fixture(scope='session')
+def mongo():
+    """Connects the service to an in-memory `mongomock` database in place of
+    Mongo (see `db.init_db`), for the whole session."""
+    mongomock = pytest.importorskip('mongomock')
+    _drop_bulk_sort(mongomock)
+    db._client = mongoengine.connect(
+        db='imdb_test', host='mongodb://localhost',
+        mongo_client_class=mongomock.MongoClient)
+    yield db._client
+    mongoengine.disconnect()
+    db._client = None
+
+
+@pytest.fixture
+def client(mongo):
+    """Yields a test client of the app, with an empty database and response
+    cache."""
+    import app
+    from resources.tvseries import response_cache
+    from db.models import TVSeries
+
+    TVSeries._get_collection().delete_many({})
+    response_cache.clear()
+    yield app.app.test_client()
+    response_cache.clear()
+
+
+@pytest.fixture
+def series():
+    """A series, as posted to `POST /tv-series`."""
+    return {'name': 'Game of Thrones', 'series_rating': 9.4,
+            'episode_ratings': [
+                {'season': 1, 'ratings': [
+                    {'episode_number': 1, 'rating': 9.1},
+                    {'episode_number': 2, 'rating': 8.8}]},
+                {'season': 2, 'ratings': [
+                    {'episode_number': 1, 'rating': 8.8}]}]}
+
+
+def _drop_bulk_sort(mongomock):
+    """pymongo >= 4.9 passes a `sort` (None unless set) with every bulk
+    update, which mongomock does not take; the service never sorts them.
+    """
+    builder = mongomock.collection.BulkOperationBuilder
+    for name in ('add_update', 'add_replace'):
+        add = getattr(builder, name)
+
+        def add_unsorted(self, *args, _add=add, sort=None, **kwargs):
+            return _add(self, *args, **kwargs)
+        setattr(builder, name, add_unsorted)
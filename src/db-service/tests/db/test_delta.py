@@ -0,0 +1,79 @@
+import datetime
+
+from tests.context import db
+from db.delta import diff_tv_series
+
+STORED_AT = datetime.datetime(2019, 7, 1)
+STAMP = datetime.datetime(2019, 8, 1)
+
+
+def make_stored():
+    return {
+        '_id': 'game_of_thrones', 'name': 'Game of Thrones',
+        'overall_rating': 9.4, 'seasons_count': 1,
+        'ratings': [{'_id': 1, 'episodes_count': 2,
+                     'last_modified': STORED_AT, 'last_checked': STORED_AT,
+                     'ratings': [{'_id': 1, 'rating': 9.1},
+                                 {'_id': 2, 'rating': 8.8}]}],
+    }
+
+
+def test_unchanged():
+    stored = make_stored()
+    incoming = {'name': 'Game of Thrones', 'overall_rating': 9.4,
+                'ratings': [{'_id': 1, 'ratings': [{'_id': 1, 'rating': 9.1},
+                                                   {'_id': 2, 'rating': 8.8}]}]}
+
+    sets, changes, touches = diff_tv_series(stored, incoming, STAMP)
+
+    assert sets == {}
+    assert changes == {}
+    assert touches == {'ratings.0.last_checked': STAMP}
+
+
+def test_rating_changed():
+    incoming = {'ratings': [{'_id': 1, 'ratings': [{'_id': 2,
+                                                    'rating': 8.9}]}]}
+
+    sets, changes, touches = diff_tv_series(make_stored(), incoming, STAMP)
+
+    assert sets == {'ratings.0.ratings.1.rating': 8.9,
+                    'ratings.0.last_modified': STAMP}
+    assert changes == {'ratings_changed': [
+        {'season': 1, 'episode': 2, 'old': 8.8, 'new': 8.9}]}
+    assert touches == {'ratings.0.last_checked': STAMP}
+
+
+def test_episode_and_season_appended():
+    incoming = {'overall_rating': 9.3, 'ratings': [
+        {'_id': 1, 'ratings': [{'_id': 3, 'rating': 9.0}]},
+        {'_id': 2, 'ratings': [{'_id': 1, 'rating': 8.8}]}]}
+
+    sets, changes, _ = diff_tv_series(make_stored(), incoming, STAMP)
+
+    assert sets == {
+        'overall_rating': 9.3,
+        'ratings.0.ratings.2': {'_id': 3, 'rating': 9.0},
+        'ratings.0.episodes_count': 3,
+        'ratings.0.last_modified': STAMP,
+        'ratings.1': {'_id': 2, 'ratings': [{'_id': 1, 'rating': 8.8}],
+                      'last_modified': STAMP, 'last_checked': STAMP},
+        'seasons_count': 2,
+    }
+    assert changes == {
+        'overall_rating': {'old': 9.4, 'new': 9.3},
+        'episodes_added': [{'season': 1, 'episode': 3}],
+        'seasons_added': [2],
+    }
+
+
+def test_missing_data_kept():
+    """Seasons and episodes missing from the incoming series are not removed.
+    """
+    incoming = {'ratings': [{'_id': 1, 'ratings': [{'_id': 1,
+                                                    'rating': 9.1}]}]}
+
+    sets, changes, _ = diff_tv_series(make_stored(), incoming, STAMP)
+
+    assert sets == {}
+    assert changes == {}
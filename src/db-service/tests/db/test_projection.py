@@ -0,0 +1,51 @@
+import pytest
+
+from tests.context import db
+from db import projection
+
+
+def test_parse_fields():
+    assert projection.parse_fields('name, overall_rating') == (
+        ['name', 'overall_rating'], False)
+    assert projection.parse_fields('name,ratings') == (
+        ['name', 'ratings'], True)
+    assert projection.parse_fields('summary') == (
+        list(projection.FIELDS), False)
+
+
+@pytest.mark.parametrize('fields', ['', ',', 'name,episodes'])
+def test_parse_invalid_fields(fields):
+    with pytest.raises(ValueError):
+        projection.parse_fields(fields)
+
+
+def test_cursor_round_trip():
+    assert projection.decode_cursor(projection.encode_cursor(3, 120)) == (
+        3, 120)
+
+
+@pytest.mark.parametrize('cursor', ['', '3', '3:', 'a:1', '1:2:3', '-1:0'])
+def test_malformed_cursor(cursor):
+    with pytest.raises(ValueError):
+        projection.decode_cursor(cursor)
+
+
+def test_plan_page_across_seasons():
+    assert projection.plan_page([3, 2, 4], 0, None, (0, 1), 4) == (
+        [(0, 1, 2), (1, 0, 2)], (2, 0))
+
+
+def test_plan_last_page():
+    assert projection.plan_page([3, 2, 4], 0, None, (2, 1), 10) == (
+        [(2, 1, 3)], None)
+
+
+def test_plan_page_within_season_range():
+    """Pages start at the range's first season, and end with its last."""
+    assert projection.plan_page([3, 2, 4], 1, 1, (0, 0), 10) == (
+        [(1, 0, 2)], None)
+
+
+def test_plan_page_skips_empty_seasons():
+    assert projection.plan_page([2, 0, 0, 1], 0, None, (0, 0), 2) == (
+        [(0, 0, 2)], (3, 0))
@@ -0,0 +1,72 @@
+from tests.context import resources
+
+
+def test_exists(client, series):
+    client.post('/tv-series', json=series)
+
+    resp = client.get('/tv-series/batch?name=Succession&name=Game of Thrones')
+
+    assert resp.get_json() == {'results': [
+        {'name': 'Succession', 'identifier': 'succession', 'exists': False},
+        {'name': 'Game of Thrones', 'identifier': 'game_of_thrones',
+         'exists': True}]}
+
+
+def test_season_summaries(client, series):
+    client.post('/tv-series', json=series)
+
+    dark, got = client.get('/tv-series/batch?name=Dark&name=Game of Thrones'
+                           '&include=seasons').get_json()['results']
+
+    assert dark == {'name': 'Dark', 'identifier': 'dark', 'exists': False}
+    assert got['exists']
+    assert [(season['season'], season['episodes_count'])
+            for season in got['seasons']] == [(1, 2), (2, 1)]
+    assert 'last_checked' in got['seasons'][0]
+
+
+def test_post_statuses(client, series):
+    client.post('/tv-series', json=series)
+    dark = dict(series, name='Dark')
+
+    # mongomock numbers upserts among upserts only, so they come first
+    resp = client.post('/tv-series/batch',
+                       json=[dark, series, {'name': 'Succession'}, 'Chernobyl'])
+
+    assert resp.status_code == 200
+    assert [(result['identifier'], result['status'])
+            for result in resp.get_json()['results']] == [
+        ('dark', 'created'), ('game_of_thrones', 'replaced'),
+        ('succession', 'invalid'), (None, 'invalid')]
+    assert resp.get_json()['results'][2]['messages']
+
+
+def test_post_replaces_cached(client, series):
+    client.post('/tv-series', json=series)
+    client.get('/tv-series?name=Game of Thrones', json={})
+    series['series_rating'] = 9.3
+
+    client.post('/tv-series/batch', json=[series])
+
+    doc = client.get('/tv-series?name=Game of Thrones', json={}).get_json()
+    assert doc['overall_rating'] == 9.3
+
+
+def test_post_not_a_list(client, series):
+    resp = client.post('/tv-series/batch', json=series)
+    assert resp.status_code == 400
+
+
+def test_post_malformed_seasons(client, series):
+    bad_season = dict(series, name='Dark', episode_ratings=['season 1'])
+    bad_episode = dict(series, name='Chernobyl', episode_ratings=[
+        {'season': 1, 'ratings': [9.4]}])
+
+    resp = client.post('/tv-series/batch',
+                       json=[series, bad_season, bad_episode])
+
+    assert resp.status_code == 200
+    results = resp.get_json()['results']
+    assert [result['status'] for result in results] == [
+        'created', 'invalid', 'invalid']
+    assert all(result['messages'] for result in results[1:])
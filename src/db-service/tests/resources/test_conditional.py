@@ -0,0 +1,102 @@
+import datetime
+
+from tests.context import resources
+from resources import conditional
+from resources.tvseries import response_cache
+
+CHANGED_AT = datetime.datetime(2019, 7, 30, 12, 0, 0, 123000)
+
+
+def get(client, query='', **kwargs):
+    return client.get(f'/tv-series?name=Game of Thrones{query}', json={},
+                      **kwargs)
+
+
+def test_make_etag():
+    etag = conditional.make_etag('dark', CHANGED_AT)
+
+    assert etag == 'dark-16c42c0627b'
+    assert conditional.make_etag('dark', CHANGED_AT, 'fields=name') not in (
+        etag, conditional.make_etag('dark', CHANGED_AT, 'fields=ratings'))
+    assert conditional.make_etag(
+        'dark', CHANGED_AT + datetime.timedelta(milliseconds=1)) != etag
+    assert conditional.make_etag('dark', None) is None
+
+
+def test_encoded_etag():
+    assert conditional.encoded_etag('dark-1', 'gzip') == 'dark-1-gzip'
+    assert conditional.encoded_etag('dark-1') == 'dark-1'
+    assert conditional.encoded_etag(None, 'gzip') is None
+
+
+def test_validators(client, series):
+    client.post('/tv-series', json=series)
+
+    resp = get(client)
+
+    assert resp.headers['ETag'].startswith('"game_of_thrones-')
+    assert resp.last_modified is not None
+    assert resp.cache_control.public
+    assert resp.cache_control.max_age == 60
+
+
+def test_if_none_match(client, series):
+    client.post('/tv-series', json=series)
+    etag = get(client).headers['ETag']
+
+    cached = get(client, headers={'If-None-Match': etag})
+    # on a cache miss, only the series' timestamps are read
+    response_cache.clear()
+    uncached = get(client, headers={'If-None-Match': etag})
+
+    for resp in (cached, uncached):
+        assert resp.status_code == 304
+        assert resp.data == b''
+        assert resp.headers['ETag'] == etag
+
+
+def test_if_none_match_changed(client, series):
+    client.post('/tv-series', json=series)
+    etag = get(client).headers['ETag']
+    series['series_rating'] = 9.3
+    client.post('/tv-series', json=series)
+
+    resp = get(client, headers={'If-None-Match': etag})
+
+    assert resp.status_code == 200
+    assert resp.headers['ETag'] != etag
+
+
+def test_if_modified_since(client, series):
+    client.post('/tv-series', json=series)
+    last_modified = get(client).headers['Last-Modified']
+
+    assert get(client, headers={
+        'If-Modified-Since': last_modified}).status_code == 304
+    assert get(client, headers={
+        'If-Modified-Since': 'Sat, 01 Jan 2000 00:00:00 GMT'}
+    ).status_code == 200
+
+
+def test_partial_if_none_match(client, series):
+    client.post('/tv-series', json=series)
+    etag = get(client, '&fields=name').headers['ETag']
+
+    assert etag != get(client).headers['ETag']
+    assert get(client, '&fields=name', headers={
+        'If-None-Match': etag}).status_code == 304
+    assert get(client, '&fields=summary', headers={
+        'If-None-Match': etag}).status_code == 200
+
+
+def test_unchanged_merge_keeps_etag(client, series):
+    """Refreshes that change nothing only bump the seasons' `last_checked`,
+    which is not part of the representation."""
+    client.post('/tv-series/batch?mode=merge', json=[series])
+    etag = get(client).headers['ETag']
+
+    client.put('/tv-series', json=series)
+
+    assert get(client, headers={'If-None-Match': etag}).status_code == 304
+    response_cache.clear()
+    assert get(client, headers={'If-None-Match': etag}).status_code == 304
@@ -0,0 +1,73 @@
+import gzip
+
+import pytest
+
+from tests.context import resources
+
+
+@pytest.fixture
+def long_series(series):
+    """A series whose JSON is over `COMPRESSION_MIN_BYTES`."""
+    series['episode_ratings'] = [
+        {'season': season, 'ratings': [
+            {'episode_number': episode, 'rating': 8.5}
+            for episode in range(1, 21)]}
+        for season in range(1, 6)]
+    return series
+
+
+def get(client, query='', **kwargs):
+    return client.get(f'/tv-series?name=Game of Thrones{query}', json={},
+                      **kwargs)
+
+
+def test_gzip(client, long_series):
+    client.post('/tv-series', json=long_series)
+    plain = get(client)
+
+    for _ in range(2):  # compressed, then from the response cache
+        resp = get(client, headers={'Accept-Encoding': 'gzip'})
+
+        assert resp.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in resp.headers['Vary']
+        assert resp.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+        assert gzip.decompress(resp.data) == plain.data
+        assert len(resp.data) < len(plain.data)
+
+
+def test_not_accepted(client, long_series):
+    client.post('/tv-series', json=long_series)
+
+    resp = get(client, headers={'Accept-Encoding': 'identity'})
+
+    assert 'Content-Encoding' not in resp.headers
+    assert 'Accept-Encoding' in resp.headers['Vary']
+
+
+def test_small_body_not_compressed(client, series):
+    client.post('/tv-series', json=series)
+
+    resp = get(client, headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in resp.headers
+
+
+def test_if_none_match_encoded(client, long_series):
+    client.post('/tv-series', json=long_series)
+    etag = get(client, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+
+    resp = get(client, headers={'Accept-Encoding': 'gzip',
+                                'If-None-Match': etag})
+
+    assert resp.status_code == 304
+    assert resp.headers['ETag'] == etag
+
+
+def test_partial_gzip(client, long_series):
+    client.post('/tv-series', json=long_series)
+
+    resp = get(client, '&fields=ratings',
+               headers={'Accept-Encoding': 'gzip'})
+
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert len(gzip.decompress(resp.data)) > len(resp.data)
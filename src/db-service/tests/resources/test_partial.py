@@ -0,0 +1,69 @@
+from tests.context import resources
+
+
+def get(client, query, **kwargs):
+    return client.get(f'/tv-series?name=Game of Thrones&{query}', json={},
+                      **kwargs)
+
+
+def test_fields(client, series):
+    client.post('/tv-series', json=series)
+
+    doc = get(client, 'fields=name,overall_rating').get_json()
+
+    assert doc == {'_id': 'game_of_thrones', 'name': 'Game of Thrones',
+                   'overall_rating': 9.4}
+
+
+def test_summary(client, series):
+    client.post('/tv-series', json=series)
+
+    doc = get(client, 'fields=summary').get_json()
+
+    assert [season['_id'] for season in doc['ratings']] == [1, 2]
+    assert all('ratings' not in season for season in doc['ratings'])
+
+
+def test_season_range(client, series):
+    client.post('/tv-series', json=series)
+
+    doc = get(client, 'season_offset=1&season_limit=1').get_json()
+
+    assert [season['_id'] for season in doc['ratings']] == [2]
+
+
+def test_episode_pages(client, series):
+    client.post('/tv-series', json=series)
+
+    first = get(client, 'fields=ratings&episode_limit=2').get_json()
+    last = get(client, 'fields=ratings&episode_limit=2&cursor=' +
+               first['next_cursor']).get_json()
+
+    assert first['next_cursor'] == '1:0'
+    assert [[ep['_id'] for ep in season['ratings']]
+            for season in first['ratings']] == [[1, 2]]
+    assert last['next_cursor'] is None
+    assert [(season['_id'], [ep['rating'] for ep in season['ratings']])
+            for season in last['ratings']] == [(2, [8.8])]
+
+
+def test_invalid_query(client, series):
+    client.post('/tv-series', json=series)
+
+    assert get(client, 'fields=episodes').status_code == 400
+    assert get(client, 'episode_limit=2&cursor=x').status_code == 400
+    assert get(client, 'season_limit=0').status_code == 400
+
+
+def test_not_found(client):
+    assert get(client, 'fields=name').status_code == 404
+
+
+def test_season_stamps_not_served(client, series):
+    client.post('/tv-series/batch?mode=merge', json=[series])
+
+    for query in ('fields=summary', 'fields=ratings',
+                  'season_offset=1', 'episode_limit=2'):
+        doc = get(client, query).get_json()
+        assert all(set(season) <= {'_id', 'episodes_count', 'ratings'}
+                   for season in doc['ratings'])
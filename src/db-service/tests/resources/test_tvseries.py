@@ -0,0 +1,89 @@
+from tests.context import resources
+
+
+def get(client, query, **kwargs):
+    # `name` is also parsed from the JSON body, which must be present
+    return client.get(f'/tv-series?{query}', json={}, **kwargs)
+
+
+def test_merge_creates_then_updates(client, series):
+    resp = client.post('/tv-series/batch?mode=merge', json=[series])
+    assert resp.status_code == 200
+    assert resp.get_json()['results'][0]['status'] == 'created'
+
+    series['episode_ratings'][0]['ratings'][0]['rating'] = 9.0
+    result, = client.post('/tv-series/batch?mode=merge',
+                          json=[series]).get_json()['results']
+
+    assert result['status'] == 'updated'
+    assert result['changes'] == {'ratings_changed': [
+        {'season': 1, 'episode': 1, 'old': 9.1, 'new': 9.0}]}
+    doc = get(client, 'name=Game of Thrones').get_json()
+    assert doc['ratings'][0]['ratings'][0]['rating'] == 9.0
+
+
+def test_merge_unchanged_keeps_last_modified(client, series):
+    client.post('/tv-series/batch?mode=merge', json=[series])
+    before = get(client, 'name=Game of Thrones').get_json()
+
+    result, = client.post('/tv-series/batch?mode=merge',
+                          json=[series]).get_json()['results']
+
+    assert result['status'] == 'unchanged'
+    after = get(client, 'name=Game of Thrones').get_json()
+    assert after['last_modified'] == before['last_modified']
+
+
+def test_merge_keeps_missing_seasons(client, series):
+    client.post('/tv-series', json=series)
+    del series['episode_ratings'][1]
+
+    resp = client.put('/tv-series', json=series)
+
+    assert resp.get_json()['status'] == 'unchanged'
+    doc = get(client, 'name=Game of Thrones').get_json()
+    assert [season['_id'] for season in doc['ratings']] == [1, 2]
+
+
+def test_merge_invalid_mode(client, series):
+    resp = client.post('/tv-series/batch?mode=upsert', json=[series])
+    assert resp.status_code == 400
+
+
+def test_get_cached(client, series):
+    from resources.tvseries import response_cache
+    client.post('/tv-series', json=series)
+    hits = response_cache.stats()['hits']
+
+    first = get(client, 'name=Game of Thrones')
+    second = get(client, 'name=Game of Thrones')
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert response_cache.stats()['hits'] == hits + 1
+
+
+def test_post_invalidates_cached(client, series):
+    client.post('/tv-series', json=series)
+    get(client, 'name=Game of Thrones')
+    series['series_rating'] = 9.3
+    client.post('/tv-series', json=series)
+
+    doc = get(client, 'name=Game of Thrones').get_json()
+    assert doc['overall_rating'] == 9.3
+
+
+def test_post_invalid_body(client):
+    assert client.post('/tv-series', json=['Dark']).status_code == 400
+    assert client.post('/tv-series', json={'name': 1}).status_code == 400
+    assert client.post('/tv-series', data='Dark').status_code == 400
+
+
+def test_season_stamps_not_served(client, series):
+    client.post('/tv-series/batch?mode=merge', json=[series])
+
+    doc = get(client, 'name=Game of Thrones').get_json()
+
+    assert 'last_modified' in doc
+    assert all('last_modified' not in season and 'last_checked' not in season
+               for season in doc['ratings'])
@@ -0,0 +1,45 @@
+"""
+common/singleflight.py
+----------------------
+
+Deduplication of concurrent, identical asyncio operations.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+
+class SingleFlight():
+    """Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller of `do` for a key starts the operation; callers arriving
+    while it is in flight wait on the same task and receive its result (or
+    exception). Once the operation finishes, the key is forgotten, so the
+    next call starts a new operation.
+
+    Not thread-safe: all calls must be made from the same event loop.
+    """
+
+    def __init__(self):
+        self.__inflight = {}
+
+    async def do(self, key: Hashable,
+                 coro_fn: Callable[[], Awaitable]):
+        """Returns the result of `coro_fn()`, sharing it with every
+        concurrent call made with the same `key`.
+
+        A caller being cancelled does not cancel the shared operation.
+        """
+        task = self.__inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self.__inflight[key] = task
+            task.add_done_callback(
+                lambda _: self.__inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def is_inflight(self, key: Hashable) -> bool:
+        return key in self.__inflight
+
+    def __len__(self):
+        return len(self.__inflight)
@@ -36,3 +36,24 @@ def make_logger(logger_name: str) -> logging.Logger:
         logger.addHandler(handler)
         logger.setLevel(logging.DEBUG)
     return logger
+
+
+def normalize_identifier(name: str) -> str:
+    """Normalizes a series name to the identifier the database service stores
+    it under: lowercased alphanumerics, with spaces replaced by underscores
+    and any other character dropped.
+
+    This duplicates `Database._get_id` of the database service, which this
+    service cannot import. Requests for the same series are coalesced (see
+    `common.singleflight`) and indexed by this identifier, so any change to
+    one must be made to the other; `tests/common/test_utils.py` pins the
+    identifiers the database service stores.
+    """
+    def process_char(c: str):
+        if c.isalnum():
+            return c.lower()
+        elif c == ' ':
+            return '_'
+        else:
+            return ''
+    return ''.join(process_char(c) for c in name)
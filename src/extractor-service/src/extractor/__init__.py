@@ -1,12 +1,12 @@
+import contextlib
 import logging
 import logging.config
 import os
 from pathlib import Path
 import pickle
-from pprint import pprint
-import requests
+import re
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Iterable, List
 
 from dotenv import load_dotenv
 
@@ -23,9 +23,17 @@ from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
 
 from common.utils import get_logger_cfg_fpath
+from extractor.base import BaseExtractor
 from extractor.config import ExtractorConfig
+from extractor.http_extractor import IMDb_HTTP_Extractor, PageParseError
 from extractor.constants import IMDb_Constants as consts
+from extractor.db_client import DBClient, DBRequestError
+from extractor.driver_pool import DriverPool
+from extractor.incremental import SeasonPlanner
+from extractor.persistence import BatchWriter
 from extractor.ratings import SeriesRatings, SeriesRatingsCollection
+from extractor.throttle import RateLimiter
+from extractor.title_index import TitleIndex, shared_title_index
 
 
 try:
@@ -38,9 +46,17 @@ logger = logging.getLogger(__name__)
 env_path = Path('.') / 'dev.env'
 load_dotenv(dotenv_path=env_path)
 DB_API = os.getenv("DB_API")
+DB_BATCH_API = f"{DB_API}/batch"
 SELENIUM_API = os.getenv("SELENIUM_API")
 
 
+def new_remote_driver() -> webdriver.Remote:
+    """Creates a new Chrome session on the Selenium grid at `SELENIUM_API`."""
+    return webdriver.Remote(
+        command_executor=SELENIUM_API,
+        desired_capabilities=DesiredCapabilities.CHROME)
+
+
 class RemoteDriver():
     """A context manager for Selenium webdriver(s) being run remotely.
 
@@ -52,9 +68,7 @@ class RemoteDriver():
         pass
 
     def __enter__(self):
-        self.__driver = webdriver.Remote(
-            command_executor=SELENIUM_API,
-            desired_capabilities=DesiredCapabilities.CHROME)
+        self.__driver = new_remote_driver()
         return self.__driver
 
     def __exit__(self, exception_type, exception_value, traceback):
@@ -63,9 +77,12 @@ class RemoteDriver():
         self.__driver.quit()
 
 
-class IMDb_Extractor():
+class IMDb_Extractor(BaseExtractor):
     """Analyzes TV series based on data from IMDb.
 
+    Pages are loaded and navigated in a remote (Selenium) browser. See
+    `IMDb_HTTP_Extractor` for a backend that does not need a browser.
+
     Args
     ----
     `config`: ExtractorConfig, required.
@@ -79,6 +96,19 @@ class IMDb_Extractor():
     `deretry_secs`: int, optional, default=10.
         Number of seconds permitted for retrying an operation (e.g.
         attempting to click a dropdown.)
+
+    `driver_pool`: DriverPool, optional, default=None.
+        Pool to lease warm drivers from. If None, a new remote driver is
+        created (and quit) for every `multiple_queries` call, or for every
+        series when extracting in parallel (`series_workers` > 1).
+
+    `rate_limiter`, `on_season`: optional.
+        See `BaseExtractor`.
+
+    `title_index`: TitleIndex, optional.
+        Index of title IDs, which lets known series be loaded straight from
+        their title page instead of through the search bar. Defaults to the
+        one of the config's `title_index.path`, if set.
     """
 
     class _Decorators():
@@ -88,7 +118,7 @@ class IMDb_Extractor():
             the driver is on the TV series' home page.
 
             Raises:
-                NoSuchElementException:
+                PageParseError:
                     if the driver is not on the series' home page.
                 NoSeriesNameAsFirstArgException:
                     if the wrapped function does not provide `series_name` as
@@ -119,9 +149,9 @@ class IMDb_Extractor():
                         assert args[0].lower() in series_header.text.lower()
                     else:
                         raise NoSeriesNameAsFirstArgException
-                except NoSuchElementException:
+                except NoSuchElementException as exc:
                     logger.error("Series title not found")
-                    quit()
+                    raise PageParseError("Series title not found") from exc
                 return func(self, *args, **kwargs)
             return wrapper
 
@@ -157,36 +187,55 @@ class IMDb_Extractor():
             def wrapper(self, *args, **kwargs):
                 try:
                     return elem_accessing_func(self, *args, **kwargs)
-                except NoSuchElementException:
+                except NoSuchElementException as exc:
                     logger.error("No such element.")
-                    quit()
+                    raise PageParseError("No such element") from exc
             return wrapper
 
     def __init__(self, config: ExtractorConfig, timeout_secs: int = 30,
-                 timeout_retry: int = 3, retry_secs: int = 10):
+                 timeout_retry: int = 3, retry_secs: int = 10,
+                 driver_pool: DriverPool = None,
+                 rate_limiter: RateLimiter = None,
+                 on_season: Callable = None, title_index: TitleIndex = None):
+        super().__init__(config, rate_limiter, on_season)
+        if title_index is None:
+            title_index = shared_title_index(config)
+        self.__title_index = title_index
         self.__driver = None
+        self.__driver_pool = driver_pool
         self.__PAGE_LOAD_TIMEOUT = timeout_secs
         self.__PAGE_LOAD_TIMEOUT_RETRY = timeout_retry
         self.__RETRY_SECS = retry_secs
 
-    def multiple_queries(self, series_names: List[str],
-                         ratings_collection: SeriesRatingsCollection) -> None:
-        """Query _multiple_ TV series' ratings with a List of their names.
-        This is a convenient API that is equivalent to multiple `query` calls.
-        """
-        with RemoteDriver() as dvr:
+    def _clone(self) -> 'IMDb_Extractor':
+        return IMDb_Extractor(self._config,
+                              timeout_secs=self.__PAGE_LOAD_TIMEOUT,
+                              timeout_retry=self.__PAGE_LOAD_TIMEOUT_RETRY,
+                              retry_secs=self.__RETRY_SECS,
+                              driver_pool=self.__driver_pool,
+                              rate_limiter=self._rate_limiter,
+                              on_season=self._on_season,
+                              title_index=self.__title_index)
+
+    @contextlib.contextmanager
+    def _session(self):
+        if self.__driver_pool is not None:
+            driver_ctx = self.__driver_pool.lease()
+        else:
+            driver_ctx = RemoteDriver()
+        with driver_ctx as dvr:
             self.__driver = dvr
-            for tv_series in series_names:
-                if tv_series not in ratings_collection:
-                    ratings = self.query(tv_series)
-                    ratings_collection.add(ratings)
-            else:
-                logger.info(("Data already exists; Noting to query in {}"
-                             .format(str(series_names))))
-
-    def query(self, series_name: str) -> SeriesRatings:
+            try:
+                yield
+            finally:
+                self.__driver = None
+
+    def query(self, series_name: str,
+              select_seasons: Callable = None) -> SeriesRatings:
         """Query a TV series's ratings with its name.
         Return: a SeriesRating object
+
+        See `BaseExtractor.query` for `select_seasons`.
         """
         print("Querying {}".format(series_name))
         self._navigate_to_series(series_name)
@@ -196,15 +245,19 @@ class IMDb_Extractor():
                                       overall_rating=overall_rating,
                                       seasons_count=seasons_count)
         self._navigate_to_episode_guide(series_name)
-        self._query_episode_ratings(rating_series)
+        self._query_episode_ratings(
+            rating_series,
+            self._seasons_to_query(seasons_count, select_seasons))
         return rating_series
 
     @_Decorators.catch_no_such_element_exception
     @_Decorators.execute_in_series_episode_guide
-    def _query_episode_ratings(self, series_ratings: SeriesRatings) -> None:
+    def _query_episode_ratings(self, series_ratings: SeriesRatings,
+                               season_nums: List[int]) -> None:
         """
-        Internal method that queries each season found in the season dropdown.
-        Accumulates each season's episode ratings in the `SeriesRatings` arg.
+        Internal method that queries the seasons `season_nums` found in the
+        season dropdown. Accumulates each season's episode ratings in the
+        `SeriesRatings` arg.
 
         Note
         ----
@@ -216,6 +269,8 @@ class IMDb_Extractor():
         ))
         seasons = season_dropdown.options
         for index in range(0, len(seasons)):
+            if index + 1 not in season_nums:
+                continue
             start_time = datetime.now()
             while True:
                 try:
@@ -235,7 +290,8 @@ class IMDb_Extractor():
             season_num = index + 1
             season_ratings = self._query_ratings_in_season(season_num)
             if season_ratings is not None:
-                series_ratings.add_season_ratings(season_num, season_ratings)
+                self._add_season_ratings(series_ratings, season_num,
+                                         season_ratings)
 
     @_Decorators.wait_to_execute_in_series_season_page
     def _query_ratings_in_season(self, season_num: int) -> List[float]:
@@ -282,6 +338,18 @@ class IMDb_Extractor():
         return overall_rating
 
     def _navigate_to_series(self, name: str):
+        """Loads the series' title page: directly if its title ID is indexed
+        (and the page loaded is the series'), else through the search bar.
+        """
+        if self.__title_index is not None:
+            title_id = self.__title_index.lookup(name)
+            if title_id is not None:
+                self._load_url(consts.TITLE_URL.format(title_id=title_id))
+                if self._is_on_series_homepage(name):
+                    return
+                logger.warning(f"Indexed title {title_id} is not `{name}`; "
+                               "searching instead")
+                self.__title_index.invalidate(name, title_id)
         self._load_url(consts.HOMEPAGE_URL)
         search_bar = self.__driver.find_element_by_css_selector(
             consts.SEARCH_BAR_CSL
@@ -303,12 +371,24 @@ class IMDb_Extractor():
             "{} not found in {}".format(
                 name.lower(), first_result.text.lower())
         first_result.click()
+        if self.__title_index is not None:
+            match = re.search(consts.TITLE_ID_PATTERN,
+                              self.__driver.current_url)
+            if match is not None:
+                self.__title_index.add(name, match.group(1))
+
+    def _is_on_series_homepage(self, name: str) -> bool:
+        headers = self.__driver.find_elements_by_css_selector(
+            consts.SERIES_HEADER_CSL)
+        return bool(headers) and name.lower() in headers[0].text.lower()
 
     def _load_url(self, url: str):
         count = 1
         while count <= self.__PAGE_LOAD_TIMEOUT_RETRY:
+            self._throttle(url)
             try:
                 self.__driver.get(url)
+                break
             except TimeoutException:
                 logger.error(
                     "Timeout loading {}, retrying attempt {}...".format(
@@ -318,6 +398,32 @@ class IMDb_Extractor():
                 count += 1
 
 
+def make_extractor(config: ExtractorConfig, driver_pool: DriverPool = None,
+                   on_season: Callable = None) -> BaseExtractor:
+    """Returns the extraction backend selected by `config.backend`.
+
+    `driver_pool` is only used by the Selenium backend. See `BaseExtractor`
+    for `on_season`.
+    """
+    if config.backend == 'http':
+        return IMDb_HTTP_Extractor(config, on_season=on_season)
+    return IMDb_Extractor(config, driver_pool=driver_pool,
+                          on_season=on_season)
+
+
+def make_db_client(config: ExtractorConfig) -> DBClient:
+    """Returns a client of db-service's batch API, at `DB_API`, configured
+    by `config`. Share it between queries managers to share its connections.
+    """
+    return DBClient(DB_BATCH_API, config)
+
+
+def make_driver_pool(config: ExtractorConfig) -> DriverPool:
+    """Returns a pool of remote drivers sized according to `config`."""
+    return DriverPool(new_remote_driver, size=config.driver_pool_size,
+                      max_uses=config.driver_pool_max_uses)
+
+
 def serialize(cls):
     class WrapperClass(cls):
         def __init__(self, *args, **kwargs):
@@ -352,15 +458,21 @@ class IMDb_Queries_Manager():
     the IMDb_Extractor and SeriesRatingsCollection classes.
     """
 
-    def __init__(self, config: ExtractorConfig):
+    def __init__(self, config: ExtractorConfig,
+                 driver_pool: DriverPool = None, on_season: Callable = None,
+                 db_client: DBClient = None):
         self.__config = config
+        self.__db = db_client if db_client is not None else \
+            make_db_client(config)
+        self.__driver_pool = driver_pool
+        self.__on_season = on_season
         self.__should_serialize = config.should_serialize
         self.__pickle_name = config.serialization_filename
         self.__analyzer = None
         self.__ratings = SeriesRatingsCollection()
         self.__queries = set()
 
-    def execute(self, to_db=True) -> bool:
+    def execute(self, to_db=True, incremental=False) -> bool:
         """Executes pending queries.
 
         Params
@@ -368,16 +480,25 @@ class IMDb_Queries_Manager():
         to_db : bool, default=True
             if True, 1) only performs query if the query has not been 
             persisted in the database, and 2) saves the outputs (if 
-            successfully extracted) to the database. 
+            successfully extracted) to the database, each as soon as it is
+            extracted (see `extractor.persistence.BatchWriter`), without
+            keeping them in memory. Otherwise, outputs are kept in memory.
+        incremental : bool, default=False
+            if True (with `to_db`), queries that are persisted already are
+            refreshed rather than skipped: only their latest, missing and
+            stale seasons are extracted again (see
+            `extractor.incremental.SeasonPlanner`), and merged into what is
+            stored.
         """
 
         queries = []
+        select_seasons = None
 
-        if to_db:
-            for q in self.__queries:
-                r = requests.get(url=DB_API, params={'name': q})
-                if r.status_code != 200:
-                    queries.append(q)
+        if to_db and incremental:
+            queries = list(self.__queries)
+            select_seasons = self._plan_refresh(queries)
+        elif to_db:
+            queries = self._missing_from_db(self.__queries)
         else:
             queries = self.__queries
 
@@ -385,23 +506,24 @@ class IMDb_Queries_Manager():
             return True
 
         if self.__analyzer is None:
-            self.__analyzer = IMDb_Extractor(self.__config)
-        self.__analyzer.multiple_queries(queries, self.__ratings)
-
-        jsons = list(map(lambda r: r.json, self.__ratings.collection.values()))
-        pprint(jsons)
-
-        success = True
-
-        if to_db:
-            for json_obj in jsons:
-                r = requests.post(url=DB_API, json=json_obj)
-                print("POST STATUS: ", r.status_code)
-                if r.status_code != 200:
-                    success = False
+            self.__analyzer = make_extractor(self.__config,
+                                             self.__driver_pool,
+                                             self.__on_season)
+
+        if not to_db:
+            failures = self.__analyzer.multiple_queries(queries,
+                                                        self.__ratings)
+            self._clear_pending_queries()
+            return len(failures) == 0
+
+        # each series is saved as soon as it is extracted, and not kept
+        with self._new_writer() as writer:
+            failures = self.__analyzer.multiple_queries(
+                queries, on_result=lambda r: writer.submit(r.json),
+                select_seasons=select_seasons)
 
         self._clear_pending_queries()
-        return success
+        return len(failures) == 0 and len(writer.failed) == 0
 
     def add_query(self, query: str) -> None:
         """Queue up queries to be executed. 
@@ -431,5 +553,40 @@ class IMDb_Queries_Manager():
     def pending_queries(self) -> List[str]:
         return list(self.__queries)
 
+    def _missing_from_db(self, queries: Iterable[str]) -> List[str]:
+        """Returns the `queries` not yet persisted in the database."""
+        queries = list(queries)
+        if len(queries) == 0:
+            return []
+        try:
+            exists = self.__db.exist_many(queries)
+        except DBRequestError as exc:
+            logger.error(f"{exc}; querying all series.")
+            return queries
+        return [q for q in queries if not exists.get(q, False)]
+
+    def _plan_refresh(self, queries: List[str]) -> Dict[str, Callable]:
+        """Returns the season selection of each of the `queries` that is
+        persisted already; the others are to be extracted in full.
+        """
+        try:
+            summaries = self.__db.season_summaries(queries)
+        except DBRequestError as exc:
+            logger.error(f"{exc}; extracting all seasons.")
+            return {}
+        stale_after_secs = 86400 * self.__config.incremental_stale_after_days
+        return {q: SeasonPlanner(summary,
+                                 self.__config.incremental_latest_seasons,
+                                 stale_after_secs).select
+                for q, summary in summaries.items() if summary is not None}
+
+    def _new_writer(self) -> BatchWriter:
+        return BatchWriter(self.__db,
+                           batch_size=self.__config.persist_batch_size,
+                           queue_size=self.__config.persist_queue_size,
+                           flush_secs=self.__config.persist_flush_secs,
+                           retries=self.__config.persist_retries,
+                           backoff_secs=self.__config.db_backoff_secs)
+
     def _clear_pending_queries(self) -> None:
         self.__queries.clear()
@@ -0,0 +1,246 @@
+"""
+extractor/analytics.py
+----------------------
+
+Vectorized analytics over many series' ratings at once: season statistics,
+trends, drops and outliers, computed with NumPy on a packed ratings matrix.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from extractor.ratings import SeriesRatings
+
+METRICS = ('overall_rating', 'mean', 'slope', 'largest_drop', 'episodes')
+
+
+class RatingsMatrix():
+    """The episode ratings of many series, packed into flat NumPy arrays.
+
+    Episodes of all series are laid end to end in `ratings`, series by series
+    and season by season (in season order); seasons without ratings are left
+    out. Every episode is labeled with its season (an index into the season
+    arrays), and every season with its series (an index into
+    `series_names`), so that each statistic is one grouped reduction
+    (`np.add.reduceat`, `np.bincount`) over the whole matrix, rather than a
+    loop over series.
+
+    Per-series results are arrays aligned with `series_names`, with NaN where
+    a statistic is undefined (e.g. the trend of a single-season series).
+
+    Args
+    ----
+    `series`: Iterable[SeriesRatings], required.
+        E.g. the values of a `SeriesRatingsCollection`; see
+        `SeriesRatingsCollection.analytics`.
+    """
+
+    def __init__(self, series: Iterable[SeriesRatings]):
+        names = []
+        overall = []
+        chunks = []
+        season_nums = []
+        season_counts = []
+        season_series = []
+        for series_ratings in series:
+            series_idx = len(names)
+            names.append(series_ratings.series_name)
+            overall.append(np.nan if series_ratings.overall_rating is None
+                           else series_ratings.overall_rating)
+            nums = series_ratings.season_numbers
+            offsets = series_ratings.season_offsets
+            if offsets[-1] == 0:
+                continue
+            buf = np.frombuffer(series_ratings.ratings_buffer,
+                                dtype=np.float64)
+            for i in sorted(range(len(nums)), key=nums.__getitem__):
+                if offsets[i + 1] == offsets[i]:
+                    continue
+                chunks.append(buf[offsets[i]:offsets[i + 1]])
+                season_nums.append(nums[i])
+                season_counts.append(offsets[i + 1] - offsets[i])
+                season_series.append(series_idx)
+
+        self.__names = names
+        self.__overall = np.array(overall, dtype=np.float64)
+        self.__ratings = (np.concatenate(chunks) if chunks
+                          else np.empty(0, dtype=np.float64))
+        self.__season_nums = np.array(season_nums, dtype=np.int64)
+        self.__season_counts = np.array(season_counts, dtype=np.int64)
+        self.__season_series = np.array(season_series, dtype=np.int64)
+        self.__season_starts = (np.cumsum(self.__season_counts) -
+                                self.__season_counts)
+        self.__episode_season = np.repeat(
+            np.arange(len(season_counts)), self.__season_counts)
+        self.__episode_series = self.__season_series[self.__episode_season]
+
+    @property
+    def series_names(self) -> List[str]:
+        return list(self.__names)
+
+    @property
+    def ratings(self) -> np.ndarray:
+        """Returns the ratings of all episodes, end to end."""
+        return self.__ratings
+
+    @property
+    def episodes_count(self) -> int:
+        return len(self.__ratings)
+
+    def season_stats(self) -> Dict[str, np.ndarray]:
+        """Returns the statistics of every season, as arrays aligned by
+        season: `series` (index into `series_names`), `season` (number),
+        `count`, `mean`, `median` and `var` (population variance).
+        """
+        if not len(self.__season_counts):
+            empty = np.empty(0)
+            return {'series': empty.astype(np.int64),
+                    'season': empty.astype(np.int64),
+                    'count': empty.astype(np.int64),
+                    'mean': empty, 'median': empty, 'var': empty}
+        means = self._season_means()
+        deviations = self.__ratings - means[self.__episode_season]
+        var = (np.add.reduceat(deviations ** 2, self.__season_starts) /
+               self.__season_counts)
+
+        # sorted by season, then rating: each season's middle is its median
+        by_rating = self.__ratings[np.lexsort((self.__ratings,
+                                               self.__episode_season))]
+        low = self.__season_starts + (self.__season_counts - 1) // 2
+        high = self.__season_starts + self.__season_counts // 2
+        median = (by_rating[low] + by_rating[high]) / 2
+
+        return {'series': self.__season_series.copy(),
+                'season': self.__season_nums.copy(),
+                'count': self.__season_counts.copy(),
+                'mean': means, 'median': median, 'var': var}
+
+    def series_means(self) -> np.ndarray:
+        """Returns the mean episode rating of each series."""
+        counts, sums = self._per_series(self.__episode_series,
+                                        self.__ratings)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return sums / counts
+
+    def trend_slopes(self) -> np.ndarray:
+        """Returns the slope of the least-squares line through each series'
+        season means, by season number: how much the series gains (or, if
+        negative, loses) per season. NaN for series of under two seasons.
+        """
+        x = self.__season_nums.astype(np.float64)
+        y = self._season_means()
+        n, sx = self._per_series(self.__season_series, x)
+        _, sy = self._per_series(self.__season_series, y)
+        _, sxx = self._per_series(self.__season_series, x * x)
+        _, sxy = self._per_series(self.__season_series, x * y)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            slopes = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        slopes[n < 2] = np.nan
+        return slopes
+
+    def largest_drops(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns, for each series, the largest fall in mean rating from a
+        season to the next one, and the numbers of these two seasons:
+        `(drops, from_seasons, to_seasons)`. A negative drop means the series
+        only ever improved; series of a single season get NaN (and season
+        -1).
+        """
+        series_count = len(self.__names)
+        drops = np.full(series_count, np.nan)
+        from_seasons = np.full(series_count, -1, dtype=np.int64)
+        to_seasons = np.full(series_count, -1, dtype=np.int64)
+
+        means = self._season_means()
+        consecutive = np.nonzero(self.__season_series[1:] ==
+                                 self.__season_series[:-1])[0]
+        if not len(consecutive):
+            return drops, from_seasons, to_seasons
+        falls = means[consecutive] - means[consecutive + 1]
+        owners = self.__season_series[consecutive]
+        # sorted by series, then largest fall first: keep each series' first
+        order = np.lexsort((-falls, owners))
+        owners_sorted = owners[order]
+        first = np.concatenate(
+            ([True], owners_sorted[1:] != owners_sorted[:-1]))
+        best = order[first]
+        drops[owners[best]] = falls[best]
+        from_seasons[owners[best]] = self.__season_nums[consecutive[best]]
+        to_seasons[owners[best]] = self.__season_nums[consecutive[best] + 1]
+        return drops, from_seasons, to_seasons
+
+    def outliers(self, threshold: float = 2.5) -> List[dict]:
+        """Returns the episodes whose rating is at least `threshold` standard
+        deviations away from the mean of their series, most extreme first:
+        `[{'series': ..., 'season': ..., 'episode': ..., 'rating': ...,
+        'z': ...}]`.
+        """
+        counts, sums = self._per_series(self.__episode_series,
+                                        self.__ratings)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            deviations = self.__ratings - means[self.__episode_series]
+            _, squares = self._per_series(self.__episode_series,
+                                          deviations ** 2)
+            stds = np.sqrt(squares / counts)
+            z = deviations / stds[self.__episode_series]
+        hits = np.nonzero(np.abs(z) >= threshold)[0]
+        hits = hits[np.argsort(-np.abs(z[hits]), kind='stable')]
+
+        seasons = self.__episode_season[hits]
+        episode_nums = hits - self.__season_starts[seasons] + 1
+        return [{'series': self.__names[self.__episode_series[i]],
+                 'season': int(self.__season_nums[season]),
+                 'episode': int(episode_num),
+                 'rating': float(self.__ratings[i]),
+                 'z': float(z[i])}
+                for i, season, episode_num in zip(hits, seasons,
+                                                  episode_nums)]
+
+    def top_k(self, metric: str, k: int = 10,
+              largest: bool = True) -> List[Tuple[str, float]]:
+        """Returns the `k` series ranking highest (or lowest, if not
+        `largest`) by `metric`, one of `METRICS`, as `(name, value)` pairs,
+        best first. Series for which the metric is undefined are left out.
+
+        Raises
+        ------
+        `ValueError`
+            raised when `metric` is not one of `METRICS`
+        """
+        if metric == 'overall_rating':
+            values = self.__overall
+        elif metric == 'mean':
+            values = self.series_means()
+        elif metric == 'slope':
+            values = self.trend_slopes()
+        elif metric == 'largest_drop':
+            values = self.largest_drops()[0]
+        elif metric == 'episodes':
+            values = self._per_series(self.__episode_series,
+                                      self.__ratings)[0].astype(np.float64)
+        else:
+            raise ValueError(f"`metric` must be one of {METRICS}, "
+                             f"got {metric!r}")
+
+        candidates = np.nonzero(~np.isnan(values))[0]
+        keys = -values[candidates] if largest else values[candidates]
+        if k < len(candidates):
+            candidates = candidates[np.argpartition(keys, k)[:k]]
+            keys = -values[candidates] if largest else values[candidates]
+        ranked = candidates[np.argsort(keys, kind='stable')]
+        return [(self.__names[i], float(values[i])) for i in ranked]
+
+    def _season_means(self) -> np.ndarray:
+        if not len(self.__season_counts):
+            return np.empty(0)
+        return (np.add.reduceat(self.__ratings, self.__season_starts) /
+                self.__season_counts)
+
+    def _per_series(self, labels: np.ndarray,
+                    values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the count and sum of `values` by series, for values
+        labeled with the index of their series."""
+        length = len(self.__names)
+        return (np.bincount(labels, minlength=length),
+                np.bincount(labels, weights=values, minlength=length))
@@ -0,0 +1,178 @@
+import abc
+import contextlib
+import logging
+import logging.config
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List
+from urllib.parse import urlparse
+
+from common.utils import get_logger_cfg_fpath
+from extractor.config import ExtractorConfig
+from extractor.ratings import SeriesRatings, SeriesRatingsCollection
+from extractor.throttle import RateLimiter
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+class BaseExtractor(abc.ABC):
+    """Interface shared by all extraction backends.
+
+    A backend only needs to implement `query`, which turns a series name into
+    a `SeriesRatings` object, and `_clone`. Backends that hold an expensive
+    resource for the duration of a batch (e.g. a browser session) may
+    override `_session`.
+
+    Args
+    ----
+    `config`: ExtractorConfig, required.
+        `series_workers` sets how many series `multiple_queries` extracts
+        concurrently; `rate_limit` throttles page loads per host.
+
+    `rate_limiter`: RateLimiter, optional.
+        Limiter to throttle page loads with. Defaults to one built from
+        `config`; pass an existing limiter to share it between extractors.
+
+    `on_season`: Callable, optional.
+        Called as `on_season(series_ratings, season_num, season_ratings)`
+        every time the ratings of a season have been extracted. May be called
+        from worker threads.
+    """
+
+    def __init__(self, config: ExtractorConfig,
+                 rate_limiter: RateLimiter = None,
+                 on_season: Callable = None):
+        self._config = config
+        self._on_season = on_season
+        if rate_limiter is None and config.requests_per_sec is not None:
+            rate_limiter = RateLimiter(config.requests_per_sec,
+                                       config.request_burst)
+        self._rate_limiter = rate_limiter
+        self.__local = threading.local()
+
+    def multiple_queries(self, series_names: List[str],
+                         ratings_collection: SeriesRatingsCollection = None,
+                         on_result: Callable = None,
+                         select_seasons: Dict[str, Callable] = None
+                         ) -> Dict[str, Exception]:
+        """Query _multiple_ TV series' ratings with a List of their names.
+        This is a convenient API that is equivalent to multiple `query` calls;
+        `select_seasons` maps series names to the `select_seasons` argument of
+        their `query`.
+
+        Series already in `ratings_collection` are skipped. Up to
+        `config.series_workers` series are extracted concurrently, each
+        worker with its own backend instance; every series is added to
+        `ratings_collection` (if any) and passed to `on_result` (if any) as
+        soon as it is extracted, from the calling thread.
+
+        A series that fails to be extracted does not abort the batch.
+        Returns the failed series, mapped to the exception raised.
+        """
+        pending = [name for name in dict.fromkeys(series_names)
+                   if ratings_collection is None or
+                   name not in ratings_collection]
+        if not pending:
+            logger.info(("Data already exists; Noting to query in {}"
+                         .format(str(series_names))))
+            return {}
+
+        def on_extracted(series_ratings: SeriesRatings) -> None:
+            if ratings_collection is not None:
+                ratings_collection.add(series_ratings)
+            if on_result is not None:
+                on_result(series_ratings)
+
+        if select_seasons is None:
+            select_seasons = {}
+
+        failures = {}
+        workers = min(self._config.series_workers, len(pending))
+        if workers == 1:
+            with self._session():
+                for tv_series in pending:
+                    try:
+                        series_ratings = self.query(
+                            tv_series, select_seasons.get(tv_series))
+                    except Exception as exc:
+                        self._log_failure(tv_series, exc)
+                        failures[tv_series] = exc
+                    else:
+                        on_extracted(series_ratings)
+            return failures
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._query_in_worker, tv_series,
+                                   select_seasons.get(tv_series)):
+                       tv_series for tv_series in pending}
+            for future in as_completed(futures):
+                tv_series = futures[future]
+                try:
+                    series_ratings = future.result()
+                except Exception as exc:
+                    self._log_failure(tv_series, exc)
+                    failures[tv_series] = exc
+                else:
+                    on_extracted(series_ratings)
+        return failures
+
+    @abc.abstractmethod
+    def query(self, series_name: str,
+              select_seasons: Callable = None) -> SeriesRatings:
+        """Query a TV series's ratings with its name.
+        Return: a SeriesRating object
+
+        If `select_seasons` is provided, it is called with the series' seasons
+        count and returns the numbers of the seasons to extract; the other
+        seasons are skipped (see `extractor.incremental`).
+        """
+
+    def _session(self):
+        """Context in which a batch of queries is run. No-op by default."""
+        return contextlib.nullcontext()
+
+    @abc.abstractmethod
+    def _clone(self) -> 'BaseExtractor':
+        """Returns a new extractor of the same backend and settings, sharing
+        this extractor's rate limiter, for use by a single worker thread.
+        """
+
+    def _query_in_worker(self, series_name: str,
+                         select_seasons: Callable = None) -> SeriesRatings:
+        """Queries a series with the calling thread's own extractor."""
+        worker = getattr(self.__local, 'extractor', None)
+        if worker is None:
+            worker = self.__local.extractor = self._clone()
+        with worker._session():
+            return worker.query(series_name, select_seasons)
+
+    @staticmethod
+    def _seasons_to_query(seasons_count: int,
+                          select_seasons: Callable = None) -> List[int]:
+        """Returns the numbers of the seasons to extract, in order."""
+        season_nums = range(1, seasons_count + 1)
+        if select_seasons is None:
+            return list(season_nums)
+        selected = set(select_seasons(seasons_count))
+        return [num for num in season_nums if num in selected]
+
+    def _add_season_ratings(self, series_ratings: SeriesRatings,
+                            season_num: int,
+                            season_ratings: List[float]) -> None:
+        """Adds a season's ratings to `series_ratings` and reports it to the
+        `on_season` callback, if any."""
+        series_ratings.add_season_ratings(season_num, season_ratings)
+        if self._on_season is not None:
+            self._on_season(series_ratings, season_num, season_ratings)
+
+    def _throttle(self, url: str) -> None:
+        """Blocks until loading `url` is permitted by the rate limit."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(urlparse(url).netloc)
+
+    def _log_failure(self, series_name: str, exc: Exception) -> None:
+        logger.error("Failed to extract `{}`: {!r}".format(series_name, exc))
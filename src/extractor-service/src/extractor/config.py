@@ -7,6 +7,10 @@ from common.utils import get_logger_cfg_fpath
 
 CONFIG_FNAME = "cfg/base_cfg.yml"
 
+SUPPORTED_BACKENDS = ('selenium', 'http')
+# types of the pages cached, see `extractor.page_cache.page_type`
+PAGE_TYPES = ('find', 'title', 'season', 'other')
+
 try:
     fileConfig(get_logger_cfg_fpath())
 except FileNotFoundError as e:
@@ -19,6 +23,11 @@ class ExtractorConfigFileNotFoundError(FileNotFoundError):
     pass
 
 
+class ExtractorConfigValueError(ValueError):
+    """Raised when a value in the extractor config file is invalid."""
+    pass
+
+
 class ExtractorConfig:
     """This class contains configurations specified in the config file.
     The default location for config file is `src/config.yml`.
@@ -36,6 +45,34 @@ class ExtractorConfig:
         self.__headless = True
         self.__serialization = True
         self.__serialization_fname = "src/pickle"
+        self.__backend = 'selenium'
+        self.__imdb_base_url = None
+        self.__season_workers = 8
+        self.__driver_pool_size = 2
+        self.__driver_pool_max_uses = 20
+        self.__series_workers = 1
+        self.__requests_per_sec = None
+        self.__request_burst = 1
+        self.__extraction_workers = 5
+        self.__db_timeout_secs = 10.0
+        self.__db_retries = 3
+        self.__db_backoff_secs = 0.5
+        self.__db_pool_size = 4
+        self.__db_names_per_request = 50
+        self.__persist_batch_size = 10
+        self.__persist_queue_size = 20
+        self.__persist_flush_secs = 1.0
+        self.__persist_retries = 3
+        self.__incremental_latest_seasons = 2
+        self.__incremental_stale_after_days = 30.0
+        self.__page_cache_dir = None
+        self.__page_cache_max_bytes = 256 * 2**20
+        self.__page_cache_ttl_secs = {}
+        self.__page_cache_offline = False
+        self.__title_index_path = None
+        self.__title_index_seeds = []
+        self.__title_index_fuzzy_cutoff = 0.9
+        self.__title_index_fuzzy_max_entries = 10000
 
         if 'tv_series' not in cfg:
             self.__tv_series_names = []
@@ -51,6 +88,144 @@ class ExtractorConfig:
             if 'pickle_filename' in cfg['pickle']:
                 self.__serialization_fname = cfg['pickle']['pickle_filename']
 
+        if 'backend' in cfg:
+            if cfg['backend'] not in SUPPORTED_BACKENDS:
+                raise ExtractorConfigValueError(
+                    "Unsupported backend `{}`, expected one of {}".format(
+                        cfg['backend'], SUPPORTED_BACKENDS))
+            self.__backend = cfg['backend']
+
+        if 'imdb_base_url' in cfg:
+            self.__imdb_base_url = cfg['imdb_base_url']
+
+        if 'season_workers' in cfg:
+            self.__season_workers = self._positive_int(cfg, 'season_workers')
+
+        if 'driver_pool' in cfg:
+            if 'size' in cfg['driver_pool']:
+                self.__driver_pool_size = self._positive_int(
+                    cfg['driver_pool'], 'size')
+            if 'max_uses' in cfg['driver_pool']:
+                self.__driver_pool_max_uses = self._positive_int(
+                    cfg['driver_pool'], 'max_uses')
+
+        if 'series_workers' in cfg:
+            self.__series_workers = self._positive_int(cfg, 'series_workers')
+
+        if 'extraction_workers' in cfg:
+            self.__extraction_workers = self._positive_int(
+                cfg, 'extraction_workers')
+
+        if 'rate_limit' in cfg:
+            rate_limit = cfg['rate_limit']
+            if 'requests_per_sec' in rate_limit:
+                self.__requests_per_sec = self._positive_number(
+                    rate_limit, 'requests_per_sec')
+            if 'burst' in rate_limit:
+                self.__request_burst = self._positive_int(rate_limit, 'burst')
+
+        if 'db_client' in cfg:
+            db_client = cfg['db_client']
+            if 'timeout_secs' in db_client:
+                self.__db_timeout_secs = self._positive_number(
+                    db_client, 'timeout_secs')
+            if 'retries' in db_client:
+                self.__db_retries = self._non_negative_int(
+                    db_client, 'retries')
+            if 'backoff_secs' in db_client:
+                self.__db_backoff_secs = self._positive_number(
+                    db_client, 'backoff_secs')
+            if 'pool_size' in db_client:
+                self.__db_pool_size = self._positive_int(
+                    db_client, 'pool_size')
+            if 'names_per_request' in db_client:
+                self.__db_names_per_request = self._positive_int(
+                    db_client, 'names_per_request')
+
+        if 'persistence' in cfg:
+            persistence = cfg['persistence']
+            if 'batch_size' in persistence:
+                self.__persist_batch_size = self._positive_int(
+                    persistence, 'batch_size')
+            if 'queue_size' in persistence:
+                self.__persist_queue_size = self._positive_int(
+                    persistence, 'queue_size')
+            if 'flush_secs' in persistence:
+                self.__persist_flush_secs = self._positive_number(
+                    persistence, 'flush_secs')
+            if 'retries' in persistence:
+                self.__persist_retries = self._non_negative_int(
+                    persistence, 'retries')
+
+        if 'incremental' in cfg:
+            incremental = cfg['incremental']
+            if 'latest_seasons' in incremental:
+                self.__incremental_latest_seasons = self._non_negative_int(
+                    incremental, 'latest_seasons')
+            if 'stale_after_days' in incremental:
+                self.__incremental_stale_after_days = self._positive_number(
+                    incremental, 'stale_after_days')
+
+        if 'page_cache' in cfg:
+            page_cache = cfg['page_cache']
+            if 'dir' in page_cache:
+                self.__page_cache_dir = page_cache['dir']
+            if 'max_mb' in page_cache:
+                self.__page_cache_max_bytes = int(
+                    self._positive_number(page_cache, 'max_mb') * 2**20)
+            if 'ttl_secs' in page_cache:
+                for page_type in page_cache['ttl_secs']:
+                    if page_type not in PAGE_TYPES:
+                        raise ExtractorConfigValueError(
+                            "`ttl_secs` keys must be some of {}, got {}"
+                            .format(PAGE_TYPES, page_type))
+                    self.__page_cache_ttl_secs[page_type] = \
+                        self._positive_number(page_cache['ttl_secs'],
+                                              page_type)
+            if 'offline' in page_cache:
+                self.__page_cache_offline = bool(page_cache['offline'])
+
+        if 'title_index' in cfg:
+            title_index = cfg['title_index']
+            if 'path' in title_index:
+                self.__title_index_path = title_index['path']
+            if 'seeds' in title_index:
+                self.__title_index_seeds = list(title_index['seeds'] or [])
+            if 'fuzzy_cutoff' in title_index:
+                cutoff = self._positive_number(title_index, 'fuzzy_cutoff')
+                if cutoff > 1:
+                    raise ExtractorConfigValueError(
+                        "`fuzzy_cutoff` must be at most 1, got {}".format(
+                            cutoff))
+                self.__title_index_fuzzy_cutoff = cutoff
+            if 'fuzzy_max_entries' in title_index:
+                self.__title_index_fuzzy_max_entries = self._non_negative_int(
+                    title_index, 'fuzzy_max_entries')
+
+    @staticmethod
+    def _positive_int(cfg: dict, key: str) -> int:
+        if not isinstance(cfg[key], int) or cfg[key] <= 0:
+            raise ExtractorConfigValueError(
+                "`{}` must be a positive integer, got {}".format(
+                    key, cfg[key]))
+        return cfg[key]
+
+    @staticmethod
+    def _non_negative_int(cfg: dict, key: str) -> int:
+        if not isinstance(cfg[key], int) or cfg[key] < 0:
+            raise ExtractorConfigValueError(
+                "`{}` must be a non-negative integer, got {}".format(
+                    key, cfg[key]))
+        return cfg[key]
+
+    @staticmethod
+    def _positive_number(cfg: dict, key: str) -> float:
+        if not isinstance(cfg[key], (int, float)) or cfg[key] <= 0:
+            raise ExtractorConfigValueError(
+                "`{}` must be a positive number, got {}".format(
+                    key, cfg[key]))
+        return float(cfg[key])
+
     @property
     def should_serialize(self) -> bool:
         """Returns if serialization is on or off, default to on if not
@@ -73,3 +248,174 @@ class ExtractorConfig:
     @property
     def headless(self):
         return self.__headless
+
+    @property
+    def backend(self) -> str:
+        """Returns the extraction backend to use (`selenium` or `http`),
+        default to `selenium` if not specified in config."""
+        return self.__backend
+
+    @property
+    def imdb_base_url(self) -> str:
+        """Returns the base URL the HTTP backend fetches pages from, default
+        to None (i.e. IMDb itself) if not specified in config."""
+        return self.__imdb_base_url
+
+    @property
+    def season_workers(self) -> int:
+        """Returns the max number of seasons of a series fetched concurrently
+        by the HTTP backend, default to 8 if not specified in config."""
+        return self.__season_workers
+
+    @property
+    def driver_pool_size(self) -> int:
+        """Returns the max number of WebDriver sessions kept alive by the
+        Selenium backend, default to 2 if not specified in config."""
+        return self.__driver_pool_size
+
+    @property
+    def driver_pool_max_uses(self) -> int:
+        """Returns the number of extractions after which a pooled WebDriver
+        session is recycled, default to 20 if not specified in config."""
+        return self.__driver_pool_max_uses
+
+    @property
+    def series_workers(self) -> int:
+        """Returns the max number of series extracted concurrently by
+        `multiple_queries`, default to 1 (sequential) if not specified in
+        config."""
+        return self.__series_workers
+
+    @property
+    def requests_per_sec(self) -> float:
+        """Returns the max sustained page loads per second per host, default
+        to None (unlimited) if not specified in config."""
+        return self.__requests_per_sec
+
+    @property
+    def request_burst(self) -> int:
+        """Returns the number of page loads permitted back-to-back to a host
+        before `requests_per_sec` applies, default to 1."""
+        return self.__request_burst
+
+    @property
+    def extraction_workers(self) -> int:
+        """Returns the max number of extraction requests the RPC service runs
+        at once, default to 5 if not specified in config."""
+        return self.__extraction_workers
+
+    @property
+    def db_timeout_secs(self) -> float:
+        """Returns the timeout of each request to db-service, default to 10
+        seconds if not specified in config."""
+        return self.__db_timeout_secs
+
+    @property
+    def db_retries(self) -> int:
+        """Returns how many times a failed request to db-service is retried,
+        default to 3 if not specified in config."""
+        return self.__db_retries
+
+    @property
+    def db_backoff_secs(self) -> float:
+        """Returns the base delay between retries of requests to db-service,
+        default to 0.5 seconds if not specified in config."""
+        return self.__db_backoff_secs
+
+    @property
+    def db_pool_size(self) -> int:
+        """Returns the max number of connections kept open to db-service,
+        default to 4 if not specified in config."""
+        return self.__db_pool_size
+
+    @property
+    def db_names_per_request(self) -> int:
+        """Returns the max number of series names checked per existence
+        request to db-service, default to 50 if not specified in config."""
+        return self.__db_names_per_request
+
+    @property
+    def persist_batch_size(self) -> int:
+        """Returns the max number of series saved per request while
+        extracting, default to 10 if not specified in config."""
+        return self.__persist_batch_size
+
+    @property
+    def persist_queue_size(self) -> int:
+        """Returns the max number of extracted series waiting to be saved,
+        default to 20 if not specified in config."""
+        return self.__persist_queue_size
+
+    @property
+    def persist_flush_secs(self) -> float:
+        """Returns how long an extracted series may wait for others to be
+        saved with, default to 1 second if not specified in config."""
+        return self.__persist_flush_secs
+
+    @property
+    def persist_retries(self) -> int:
+        """Returns how many times saving an extracted series is retried,
+        default to 3 if not specified in config."""
+        return self.__persist_retries
+
+    @property
+    def incremental_latest_seasons(self) -> int:
+        """Returns how many of the latest seasons an incremental refresh
+        always re-extracts, default to 2 if not specified in config."""
+        return self.__incremental_latest_seasons
+
+    @property
+    def incremental_stale_after_days(self) -> float:
+        """Returns after how many days a season is re-extracted by an
+        incremental refresh even if it is not among the latest, default to
+        30 if not specified in config."""
+        return self.__incremental_stale_after_days
+
+    @property
+    def page_cache_dir(self) -> str:
+        """Returns the directory fetched pages are cached in, or None (the
+        default) if pages are not cached."""
+        return self.__page_cache_dir
+
+    @property
+    def page_cache_max_bytes(self) -> int:
+        """Returns the max size of the page cache, default to 256MiB if not
+        specified in config (as `max_mb`)."""
+        return self.__page_cache_max_bytes
+
+    @property
+    def page_cache_ttl_secs(self) -> dict:
+        """Returns the TTLs of cached pages by page type (`find`, `title`,
+        `season`, `other`); types not specified in config keep the defaults
+        of `extractor.page_cache`."""
+        return dict(self.__page_cache_ttl_secs)
+
+    @property
+    def page_cache_offline(self) -> bool:
+        """Returns if cached pages are served regardless of their age, and
+        pages not cached are not fetched, default to off."""
+        return self.__page_cache_offline
+
+    @property
+    def title_index_path(self) -> str:
+        """Returns the file series title IDs are indexed in, or None (the
+        default) if title IDs are always searched for."""
+        return self.__title_index_path
+
+    @property
+    def title_index_seeds(self) -> list:
+        """Returns the files the title index is seeded from, default to none
+        if not specified in config."""
+        return list(self.__title_index_seeds)
+
+    @property
+    def title_index_fuzzy_cutoff(self) -> float:
+        """Returns how similar (0 to 1) a name must be to an indexed one to
+        reuse its title ID, default to 0.9 if not specified in config."""
+        return self.__title_index_fuzzy_cutoff
+
+    @property
+    def title_index_fuzzy_max_entries(self) -> int:
+        """Returns the size of the title index above which fuzzy matching is
+        off, default to 10000 if not specified in config."""
+        return self.__title_index_fuzzy_max_entries
@@ -11,6 +11,9 @@ class IMDb_Constants():
     """
 
     HOMEPAGE_URL = "https://www.imdb.com/"
+    TITLE_URL = HOMEPAGE_URL + "title/{title_id}/"
+
+    TITLE_ID_PATTERN = r"/title/(tt\d+)"
 
     TV_SERIES_IDENTIFIERS = ["TV Series", "TV Mini-Series"]
 
@@ -35,3 +38,43 @@ class IMDb_Constants():
     # TV Series season page
     EPISODE_GUIDE_SEASON_PAGE_IDENTIFIER = "episodes?season="
     EPISODE_RATINGS_CSL = "div.ipl-rating-star.small > span.ipl-rating-star__rating"
+
+
+class IMDb_HTTP_Constants():
+    """Constants used by the HTTP backend, which fetches IMDb pages directly
+    instead of driving a browser.
+
+    URL templates are relative to the IMDb base URL, so that the backend can
+    be pointed to a mirror (or a local fixture server) via config.
+    """
+
+    HOMEPAGE_URL = IMDb_Constants.HOMEPAGE_URL
+
+    FIND_URL = "find?q={query}&s=tt&ttype=tv"
+    TITLE_URL = "title/{title_id}/"
+    SEASON_URL = "title/{title_id}/episodes?season={season_num}"
+
+    REQUEST_HEADERS = {
+        'User-Agent': ("Mozilla/5.0 (X11; Linux x86_64) "
+                       "AppleWebKit/537.36 (KHTML, like Gecko) "
+                       "Chrome/75.0.3770.142 Safari/537.36"),
+        'Accept-Language': "en-US,en;q=0.9",
+    }
+
+    TITLE_ID_PATTERN = IMDb_Constants.TITLE_ID_PATTERN
+
+    # Search results page
+    SEARCH_RESULT_FIRST_XPATH = ("(//table[contains(@class, 'findList')]"
+                                 "//td[contains(@class, 'result_text')])[1]")
+
+    # TV Series homepage
+    SERIES_HEADER_XPATH = "//div[contains(@class, 'title_wrapper')]/h1"
+    OVERALL_RATINGS_XPATH = ("//div[contains(@class, 'ratingValue')]"
+                             "/strong/span")
+    SEASONS_LINKS_XPATH = ("//div[contains(@class, 'seasons-and-year-nav')]"
+                           "//a[contains(@href, 'episodes?season=')]")
+
+    # TV Series season page
+    EPISODE_RATINGS_XPATH = ("//div[contains(@class, 'ipl-rating-star') and "
+                             "contains(@class, 'small')]"
+                             "/span[@class='ipl-rating-star__rating']")
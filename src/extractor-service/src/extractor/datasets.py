@@ -0,0 +1,236 @@
+"""
+extractor/datasets.py
+---------------------
+
+Builds series ratings for the whole catalog out of IMDb's public TSV dataset
+dumps (https://datasets.imdbws.com), instead of extracting series one page
+at a time.
+"""
+
+import gzip
+import json
+import logging
+import logging.config
+import os
+import tempfile
+import zlib
+from typing import Iterator, List
+
+from common.utils import get_logger_cfg_fpath, normalize_identifier
+from extractor.ratings import SeriesRatings
+from extractor.title_index import SERIES_TITLE_TYPES
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+NULL = '\\N'
+
+
+class DatasetImporter():
+    """Joins `title.basics`, `title.episode` and `title.ratings` into series
+    ratings, in the `SeriesRatings.json` format.
+
+    The dumps are far larger than what should be held in memory, so they are
+    joined with partitioned (Grace) hash joins: rows are first spilled to
+    `partitions` files on disk by a hash of their join key, then every
+    partition is joined on its own, in memory. Memory use is thus bounded by
+    the size of the largest partition, roughly `1 / partitions` of the input.
+
+    1. Episodes and ratings are partitioned by episode ID; series (from
+        `title.basics`) and ratings are partitioned by series ID.
+    2. Each episode partition joins episodes to their ratings, and spills
+        the rated episodes to the series partitions, by parent series ID.
+    3. Each series partition groups the rated episodes of each series into
+        its `SeriesRatings` JSON, spilled by series name.
+    4. Each name partition keeps, of the series sharing a name (db-service
+        stores series by name), the one with the most votes.
+
+    Args
+    ----
+    `basics_path`, `episodes_path`, `ratings_path`: str, required.
+        Paths to `title.basics.tsv`, `title.episode.tsv` and
+        `title.ratings.tsv`, which may be gzipped (`.gz`).
+
+    `partitions`: int, optional, default=32.
+
+    `min_votes`: int, optional, default=0.
+        Series with fewer votes (for the series itself) are skipped.
+
+    `work_dir`: str, optional.
+        Directory to spill partitions to. Defaults to the system's temporary
+        directory.
+
+    Note
+    ----
+    - Series with no overall rating, or no rated episode, are skipped, as
+        are episodes without a season or episode number.
+    - As with extracted series, episodes are listed in order, and numbered
+        from 1 in each season.
+    """
+
+    def __init__(self, basics_path: str, episodes_path: str,
+                 ratings_path: str, partitions: int = 32,
+                 min_votes: int = 0, work_dir: str = None):
+        self.__BASICS_PATH = basics_path
+        self.__EPISODES_PATH = episodes_path
+        self.__RATINGS_PATH = ratings_path
+        self.__PARTITIONS = partitions
+        self.__MIN_VOTES = min_votes
+        self.__WORK_DIR = work_dir
+
+    def series(self) -> Iterator[dict]:
+        """Yields the ratings of every series, in `SeriesRatings.json`
+        format, in no particular order."""
+        with tempfile.TemporaryDirectory(dir=self.__WORK_DIR) as tmp_dir:
+            by_episode = _Partitions(tmp_dir, 'episode', self.__PARTITIONS)
+            by_series = _Partitions(tmp_dir, 'series', self.__PARTITIONS)
+            by_name = _Partitions(tmp_dir, 'name', self.__PARTITIONS)
+
+            with by_episode, by_series:
+                self._partition_inputs(by_episode, by_series)
+
+            with by_series.appending():
+                for i in range(self.__PARTITIONS):
+                    self._join_episode_ratings(by_episode.read(i), by_series)
+            by_episode.remove()
+
+            with by_name:
+                for i in range(self.__PARTITIONS):
+                    self._assemble_series(by_series.read(i), by_name)
+                by_series.remove()
+
+            for i in range(self.__PARTITIONS):
+                yield from self._dedupe_names(by_name.read(i))
+
+    def _partition_inputs(self, by_episode: '_Partitions',
+                          by_series: '_Partitions') -> None:
+        for tconst, parent, season, episode in _read_columns(
+                self.__EPISODES_PATH, 4):
+            if season == NULL or episode == NULL:
+                continue
+            by_episode.write(tconst, ('E', tconst, parent, season, episode))
+        for tconst, rating, votes in _read_columns(self.__RATINGS_PATH, 3):
+            by_episode.write(tconst, ('R', tconst, rating))
+            by_series.write(tconst, ('R', tconst, rating, votes))
+        for tconst, title_type, title in _read_columns(self.__BASICS_PATH, 3):
+            if title_type in SERIES_TITLE_TYPES:
+                by_series.write(tconst, ('S', tconst, title))
+
+    @staticmethod
+    def _join_episode_ratings(rows: Iterator[List[str]],
+                              by_series: '_Partitions') -> None:
+        episodes = {}
+        ratings = {}
+        for row in rows:
+            if row[0] == 'E':
+                episodes[row[1]] = row[2:]
+            else:
+                ratings[row[1]] = row[2]
+        for tconst, (parent, season, episode) in episodes.items():
+            if tconst in ratings:
+                by_series.write(parent, ('E', parent, season, episode,
+                                         ratings[tconst]))
+
+    def _assemble_series(self, rows: Iterator[List[str]],
+                         by_name: '_Partitions') -> None:
+        titles = {}
+        overall = {}
+        seasons = {}
+        for row in rows:
+            if row[0] == 'S':
+                titles[row[1]] = row[2]
+            elif row[0] == 'R':
+                overall[row[1]] = (float(row[2]), int(row[3]))
+            else:
+                _, parent, season, episode, rating = row
+                seasons.setdefault(parent, {}).setdefault(
+                    int(season), []).append((int(episode), float(rating)))
+
+        for tconst, title in titles.items():
+            # season 0 holds specials and the like, which are not extracted
+            rated = {num: episodes
+                     for num, episodes in seasons.get(tconst, {}).items()
+                     if num > 0}
+            if tconst not in overall or not rated:
+                continue
+            rating, votes = overall[tconst]
+            if votes < self.__MIN_VOTES:
+                continue
+            try:
+                series_ratings = SeriesRatings(
+                    series_name=title, overall_rating=rating,
+                    seasons_count=max(rated))
+            except (TypeError, ValueError) as exc:
+                logger.warning(f"Skipping {tconst} (`{title}`): {exc}")
+                continue
+            for season_num in sorted(rated):
+                series_ratings.add_season_ratings(
+                    season_num, [r for _, r in sorted(rated[season_num])])
+            by_name.write(normalize_identifier(title),
+                          (str(votes), json.dumps(series_ratings.json)))
+
+    @staticmethod
+    def _dedupe_names(rows: Iterator[List[str]]) -> Iterator[dict]:
+        best = {}
+        for votes, series_json in rows:
+            series = json.loads(series_json)
+            key = normalize_identifier(series['name'])
+            if key not in best or int(votes) > best[key][0]:
+                best[key] = (int(votes), series)
+        for _, series in best.values():
+            yield series
+
+
+class _Partitions():
+    """A set of `count` spill files of tab-separated rows, assigned by a
+    stable hash of their key. Written as a context manager, then read.
+    """
+
+    def __init__(self, directory: str, name: str, count: int):
+        self.__paths = [os.path.join(directory, f"{name}-{i}.tsv")
+                        for i in range(count)]
+        self.__files = []
+        self.__mode = 'w'
+
+    def __enter__(self):
+        self.__files = [open(path, self.__mode, encoding='utf-8')
+                        for path in self.__paths]
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        for f in self.__files:
+            f.close()
+        self.__files = []
+
+    def appending(self) -> '_Partitions':
+        """Makes the next `with` append to the partitions written already."""
+        self.__mode = 'a'
+        return self
+
+    def write(self, key: str, fields: tuple) -> None:
+        i = zlib.crc32(key.encode('utf-8')) % len(self.__paths)
+        self.__files[i].write('\t'.join(fields) + '\n')
+
+    def read(self, i: int) -> Iterator[List[str]]:
+        with open(self.__paths[i], 'r', encoding='utf-8') as f:
+            for line in f:
+                yield line.rstrip('\n').split('\t')
+
+    def remove(self) -> None:
+        for path in self.__paths:
+            os.remove(path)
+
+
+def _read_columns(path: str, count: int) -> Iterator[List[str]]:
+    """Streams the first `count` columns of the rows of a (gzipped) IMDb
+    TSV file, skipping its header."""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        next(f, None)
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= count:
+                yield fields[:count]
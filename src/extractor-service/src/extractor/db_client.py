@@ -0,0 +1,163 @@
+"""
+extractor/db_client.py
+----------------------
+
+Client of db-service's batch API, shared by every call a queries manager
+makes: connections are kept alive and pooled, every request has a timeout,
+and transient failures are retried.
+"""
+
+import asyncio
+import logging
+import logging.config
+import random
+import time
+from typing import Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.utils import get_logger_cfg_fpath
+from extractor.config import ExtractorConfig
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+class DBClient():
+    """A client of db-service's `/tv-series/batch` endpoints.
+
+    Requests that fail with a 5xx status, a connection error or a timeout
+    are retried up to `config.db_retries` times, with exponential backoff
+    and full jitter (a random delay of up to `db_backoff_secs * 2**attempt`).
+    Both endpoints are idempotent, thus safe to retry.
+
+    Args
+    ----
+    `batch_url`: str, required.
+        URL of db-service's `/tv-series/batch` endpoint.
+
+    `config`: ExtractorConfig, required.
+        Its `db_client` section sets timeouts, retries, backoff, connection
+        pool size and how many names each existence check carries.
+    """
+
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(self, batch_url: str, config: ExtractorConfig):
+        self.__BATCH_URL = batch_url
+        self.__TIMEOUT_SECS = config.db_timeout_secs
+        self.__RETRIES = config.db_retries
+        self.__BACKOFF_SECS = config.db_backoff_secs
+        self.__NAMES_PER_REQUEST = config.db_names_per_request
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=config.db_pool_size)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+    def exist_many(self, series_names: List[str]) -> Dict[str, bool]:
+        """Returns whether each of the `series_names` is in the database.
+
+        Raises
+        ------
+        `DBRequestError` if db-service could not answer.
+        """
+        exists = {}
+        for chunk in self._chunks(series_names):
+            exists.update(self._exist_chunk(chunk))
+        return exists
+
+    async def exist_many_async(self, series_names: List[str]
+                               ) -> Dict[str, bool]:
+        """Same as `exist_many`, but checks the chunks of `series_names`
+        concurrently, on the running loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(None, self._exist_chunk, chunk)
+            for chunk in self._chunks(series_names)])
+        exists = {}
+        for chunk_exists in chunk_results:
+            exists.update(chunk_exists)
+        return exists
+
+    def season_summaries(self, series_names: List[str]) -> Dict[str, dict]:
+        """Returns the stored seasons of each of the `series_names`, without
+        their ratings, or None for a series that is not stored:
+        `{'last_modified': ..., 'seasons': [{'season': ..., 'episodes_count':
+        ..., 'last_modified': ..., 'last_checked': ...}]}`, with dates as
+        `{"$date": <epoch millis>}`.
+
+        Raises
+        ------
+        `DBRequestError` if db-service could not answer.
+        """
+        summaries = {}
+        for chunk in self._chunks(series_names):
+            r = self._request('GET', params={'name': chunk,
+                                             'include': 'seasons'})
+            for item in r.json()['results']:
+                summaries[item['name']] = item if item['exists'] else None
+        return summaries
+
+    def save_many(self, jsons: List[dict], mode: str = 'merge') -> List[dict]:
+        """Saves series ratings (in `SeriesRatings.json` format) with a
+        single request. Returns the status of each series, in order; see
+        `POST /tv-series/batch` in db-service.
+
+        Raises
+        ------
+        `DBRequestError` if db-service could not answer.
+        """
+        r = self._request('POST', params={'mode': mode}, json=jsons)
+        return r.json()['results']
+
+    def close(self) -> None:
+        self.__session.close()
+
+    def _exist_chunk(self, series_names: List[str]) -> Dict[str, bool]:
+        r = self._request('GET', params={'name': series_names})
+        return {item['name']: item['exists'] for item in r.json()['results']}
+
+    def _chunks(self, series_names: List[str]) -> List[List[str]]:
+        size = self.__NAMES_PER_REQUEST
+        return [series_names[i:i + size]
+                for i in range(0, len(series_names), size)]
+
+    def _request(self, method: str, **kwargs) -> requests.Response:
+        """Sends a request to the batch endpoint, retrying transient
+        failures. Returns the (200) response.
+        """
+        for attempt in range(self.__RETRIES + 1):
+            last_attempt = attempt == self.__RETRIES
+            try:
+                r = self.__session.request(method, self.__BATCH_URL,
+                                           timeout=self.__TIMEOUT_SECS,
+                                           **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if last_attempt:
+                    raise DBRequestError(
+                        f"{method} {self.__BATCH_URL} failed: {exc!r}")
+                reason = repr(exc)
+            else:
+                if r.status_code == 200:
+                    return r
+                if last_attempt or r.status_code not in self.RETRY_STATUSES:
+                    raise DBRequestError(
+                        f"{method} {self.__BATCH_URL} failed with status "
+                        f"{r.status_code}")
+                reason = f"status {r.status_code}"
+            delay = random.uniform(0, self.__BACKOFF_SECS * 2**attempt)
+            logger.warning(f"{method} {self.__BATCH_URL} failed ({reason}); "
+                           f"retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
+class DBRequestError(Exception):
+    """Raised when db-service fails to answer a request, retries included.
+    """
+    pass
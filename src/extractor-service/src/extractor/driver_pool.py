@@ -0,0 +1,198 @@
+"""
+extractor/driver_pool.py
+------------------------
+
+A pool of warm WebDriver sessions, leased to extractions and reused across
+them, so that sessions are not created against the Selenium grid per job.
+"""
+
+import contextlib
+import logging
+import logging.config
+import threading
+import time
+from typing import Callable
+
+from selenium.common.exceptions import WebDriverException
+
+from common.utils import get_logger_cfg_fpath
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+class _PooledDriver():
+    """A driver owned by the pool, and the number of times it was leased."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool():
+    """A thread-safe pool of reusable WebDriver sessions.
+
+    Args
+    ----
+    `driver_factory`: Callable, required.
+        Creates a new driver session, e.g. a `webdriver.Remote`.
+
+    `size`: int, optional, default=2.
+        Max number of sessions alive at once (leased or idle).
+
+    `max_uses`: int, optional, default=20.
+        Number of leases after which a session is quit and replaced, so that
+        long-lived browsers do not accumulate state and memory.
+
+    `lease_timeout_secs`: float, optional, default=None.
+        Number of seconds `lease` waits for a session when all of them are
+        leased out. Waits indefinitely if None.
+
+    Usage
+    -----
+    ```
+    pool = DriverPool(new_remote_driver, size=4)
+    with pool.lease() as driver:
+        driver.get(url)
+    pool.close()
+    ```
+    """
+
+    def __init__(self, driver_factory: Callable, size: int = 2,
+                 max_uses: int = 20, lease_timeout_secs: float = None):
+        self.__driver_factory = driver_factory
+        self.__SIZE = size
+        self.__MAX_USES = max_uses
+        self.__LEASE_TIMEOUT = lease_timeout_secs
+        self.__idle = []
+        self.__cond = threading.Condition()
+        self.__created = 0
+        self.__closed = False
+
+    @property
+    def size(self) -> int:
+        return self.__SIZE
+
+    @property
+    def alive_count(self) -> int:
+        """Returns the number of sessions alive, whether leased or idle."""
+        return self.__created
+
+    @contextlib.contextmanager
+    def lease(self):
+        """Leases a healthy driver for the duration of the `with` block.
+
+        A driver whose lease ends with a `WebDriverException` is quit rather
+        than returned to the pool.
+
+        Raises
+        ------
+        `DriverPoolClosedError`
+            raised when the pool has been closed.
+
+        `DriverPoolTimeoutError`
+            raised when no driver becomes available within
+            `lease_timeout_secs`.
+        """
+        pooled = self._acquire()
+        broken = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(pooled, broken)
+
+    def close(self) -> None:
+        """Quits all idle sessions. Leased sessions are quit when returned."""
+        with self.__cond:
+            self.__closed = True
+            idle, self.__idle = self.__idle, []
+            self.__cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _acquire(self) -> _PooledDriver:
+        deadline = (None if self.__LEASE_TIMEOUT is None
+                    else time.monotonic() + self.__LEASE_TIMEOUT)
+        while True:
+            pooled = self._take_idle_or_reserve(deadline)
+            if pooled is None:
+                return self._create()
+            if self._is_healthy(pooled):
+                return pooled
+            logger.warning("Pooled driver failed health check; replacing it.")
+            self._discard(pooled)
+
+    def _take_idle_or_reserve(self, deadline: float) -> _PooledDriver:
+        """Returns the most recently used idle driver. If there is none but
+        the pool is not full, reserves a slot for a new driver and returns
+        None. Otherwise waits until either becomes possible.
+        """
+        with self.__cond:
+            while True:
+                if self.__closed:
+                    raise DriverPoolClosedError("Driver pool has been closed.")
+                if self.__idle:
+                    return self.__idle.pop()
+                if self.__created < self.__SIZE:
+                    self.__created += 1
+                    return None
+                remaining = (None if deadline is None
+                             else deadline - time.monotonic())
+                if remaining is not None and remaining <= 0:
+                    raise DriverPoolTimeoutError(
+                        "No driver became available in {} seconds.".format(
+                            self.__LEASE_TIMEOUT))
+                self.__cond.wait(remaining)
+
+    def _create(self) -> _PooledDriver:
+        try:
+            return _PooledDriver(self.__driver_factory())
+        except Exception:
+            with self.__cond:
+                self.__created -= 1
+                self.__cond.notify()
+            raise
+
+    def _release(self, pooled: _PooledDriver, broken: bool) -> None:
+        pooled.uses += 1
+        with self.__cond:
+            if not (broken or self.__closed
+                    or pooled.uses >= self.__MAX_USES):
+                self.__idle.append(pooled)
+                self.__cond.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledDriver) -> None:
+        with self.__cond:
+            self.__created -= 1
+            self.__cond.notify()
+        try:
+            pooled.driver.quit()
+        except WebDriverException as exc:
+            logger.warning("Error quitting driver: {}".format(exc))
+
+    def _is_healthy(self, pooled: _PooledDriver) -> bool:
+        if pooled.uses == 0:
+            return True
+        try:
+            pooled.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+
+class DriverPoolClosedError(Exception):
+    """Raised when leasing from a pool that has been closed."""
+    pass
+
+
+class DriverPoolTimeoutError(Exception):
+    """Raised when no driver can be leased within the lease timeout."""
+    pass
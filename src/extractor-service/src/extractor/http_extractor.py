@@ -0,0 +1,341 @@
+"""
+extractor/http_extractor.py
+---------------------------
+
+An extraction backend that fetches IMDb pages with plain HTTP requests and
+parses them with lxml, instead of rendering them in a remote browser.
+"""
+
+import logging
+import logging.config
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+from urllib.parse import quote_plus, urljoin
+
+import requests
+from lxml import html
+from requests.adapters import HTTPAdapter
+
+from common.utils import get_logger_cfg_fpath
+from extractor.base import BaseExtractor
+from extractor.config import ExtractorConfig
+from extractor.constants import IMDb_Constants
+from extractor.constants import IMDb_HTTP_Constants as consts
+from extractor.page_cache import PageCache, shared_page_cache
+from extractor.ratings import SeriesRatings
+from extractor.throttle import RateLimiter
+from extractor.title_index import TitleIndex, shared_title_index
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+class IMDb_HTTP_Extractor(BaseExtractor):
+    """Extracts TV series ratings from IMDb over plain HTTP.
+
+    Produces the same `SeriesRatings` objects as `IMDb_Extractor`, but needs
+    neither a browser nor a Selenium grid: every page is fetched once and
+    parsed in-process.
+
+    Args
+    ----
+    `config`: ExtractorConfig, required.
+
+    `timeout_secs`: int, optional, default=30.
+        Number of seconds permitted for a page to load.
+
+    `timeout_retry`: int, optional, default=3.
+        Number of retries if a timeout is encountered during page load.
+
+    `base_url`: str, optional.
+        URL that page paths are resolved against. Defaults to the config's
+        `imdb_base_url`, or IMDb's homepage if that is not set either.
+
+    `rate_limiter`, `on_season`: optional.
+        See `BaseExtractor`.
+
+    `page_cache`: PageCache, optional.
+        Cache to serve pages (and parsed season ratings) from. Defaults to
+        the one of the config's `page_cache.dir`, if set.
+
+    `title_index`: TitleIndex, optional.
+        Index of title IDs, which lets known series skip the search. Defaults
+        to the one of the config's `title_index.path`, if set.
+
+    Note
+    ----
+    - The seasons of a series are fetched concurrently, by at most
+        `config.season_workers` threads, and added to `SeriesRatings` in
+        season order.
+    - Stale cached pages are revalidated with `If-None-Match` /
+        `If-Modified-Since`, so an unchanged page costs a 304, not a download.
+    - A series found in the title index is fetched straight from its title
+        page. If that page cannot be fetched, or is not the series', the
+        entry is invalidated and the series is searched for instead.
+    """
+
+    def __init__(self, config: ExtractorConfig, timeout_secs: int = 30,
+                 timeout_retry: int = 3, base_url: str = None,
+                 rate_limiter: RateLimiter = None,
+                 on_season: Callable = None, page_cache: PageCache = None,
+                 title_index: TitleIndex = None):
+        super().__init__(config, rate_limiter, on_season)
+        if page_cache is None:
+            page_cache = shared_page_cache(config)
+        self.__page_cache = page_cache
+        if title_index is None:
+            title_index = shared_title_index(config)
+        self.__title_index = title_index
+        if base_url is None:
+            base_url = config.imdb_base_url or consts.HOMEPAGE_URL
+        if not base_url.endswith('/'):
+            base_url += '/'
+        self.__BASE_URL = base_url
+        self.__PAGE_LOAD_TIMEOUT = timeout_secs
+        self.__PAGE_LOAD_TIMEOUT_RETRY = timeout_retry
+        self.__SEASON_WORKERS = config.season_workers
+        self.__session = requests.Session()
+        self.__session.headers.update(consts.REQUEST_HEADERS)
+        adapter = HTTPAdapter(pool_maxsize=self.__SEASON_WORKERS)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+    def query(self, series_name: str,
+              select_seasons: Callable = None) -> SeriesRatings:
+        """Query a TV series's ratings with its name.
+        Return: a SeriesRating object
+
+        See `BaseExtractor.query` for `select_seasons`.
+        """
+        logger.info("Querying {}".format(series_name))
+        title_id = self._indexed_title_id(series_name)
+        title_page = None
+        if title_id is not None:
+            title_page = self._fetch_indexed_title(series_name, title_id)
+        if title_page is None:
+            title_id = self._find_title_id(series_name)
+            title_page = self._fetch(
+                consts.TITLE_URL.format(title_id=title_id))
+        rating_series = SeriesRatings(
+            series_name=series_name,
+            overall_rating=self._parse_overall_rating(title_page),
+            seasons_count=self._parse_seasons_count(title_page))
+        self._query_episode_ratings(
+            title_id, rating_series,
+            self._seasons_to_query(rating_series.seasons_count,
+                                   select_seasons))
+        return rating_series
+
+    def _clone(self) -> 'IMDb_HTTP_Extractor':
+        return IMDb_HTTP_Extractor(
+            self._config, timeout_secs=self.__PAGE_LOAD_TIMEOUT,
+            timeout_retry=self.__PAGE_LOAD_TIMEOUT_RETRY,
+            base_url=self.__BASE_URL, rate_limiter=self._rate_limiter,
+            on_season=self._on_season, page_cache=self.__page_cache,
+            title_index=self.__title_index)
+
+    def _indexed_title_id(self, name: str) -> str:
+        if self.__title_index is None:
+            return None
+        return self.__title_index.lookup(name)
+
+    def _fetch_indexed_title(self, name: str,
+                             title_id: str) -> html.HtmlElement:
+        """Fetches the title page of an indexed title ID. Returns None if the
+        page cannot be fetched or is not the series' (by its header, as the
+        Selenium backend checks); the index entry is only invalidated if the
+        title does not exist (404) or is not the series'.
+        """
+        try:
+            page = self._fetch(consts.TITLE_URL.format(title_id=title_id))
+        except PageFetchError as exc:
+            logger.warning(f"Indexed title {title_id} of `{name}` could not "
+                           f"be fetched ({exc}); searching instead")
+            # timeouts and server errors say nothing of the entry
+            if exc.status_code == 404:
+                self.__title_index.invalidate(name, title_id)
+            return None
+        header = page.xpath(consts.SERIES_HEADER_XPATH)
+        if not header or name.lower() not in header[0].text_content().lower():
+            logger.warning(f"Indexed title {title_id} is not `{name}`; "
+                           "searching instead")
+            self.__title_index.invalidate(name, title_id)
+            return None
+        return page
+
+    def _find_title_id(self, name: str) -> str:
+        """Resolves a series name to its IMDb title ID (e.g. `tt0944947`)
+        using the first result of IMDb's TV title search, and adds it to the
+        title index, if any.
+        """
+        search_page = self._fetch(
+            consts.FIND_URL.format(query=quote_plus(name)))
+        first_result = search_page.xpath(consts.SEARCH_RESULT_FIRST_XPATH)
+        if not first_result:
+            raise SeriesNotFoundError(
+                f"'{name}' does not exist on IMDb as a TV Series.")
+        first_result = first_result[0]
+        if not any(ID in first_result.text_content()
+                   for ID in IMDb_Constants.TV_SERIES_IDENTIFIERS):
+            raise SeriesNotFoundError(
+                f"'{name}' does not exist on IMDb as a TV Series. "
+                "The Extractor currently only supports extracting TV Series. ")
+
+        link = first_result.find('a')
+        if link is None or name.lower() not in link.text_content().lower():
+            raise SeriesNotFoundError("{} not found in {}".format(
+                name.lower(), first_result.text_content().strip().lower()))
+        match = re.search(consts.TITLE_ID_PATTERN, link.get('href', ''))
+        if match is None:
+            raise SeriesNotFoundError(
+                f"Could not find a title ID for '{name}' in search results.")
+        if self.__title_index is not None:
+            self.__title_index.add(name, match.group(1))
+        return match.group(1)
+
+    def _query_episode_ratings(self, title_id: str,
+                               series_ratings: SeriesRatings,
+                               season_nums: List[int]) -> None:
+        """
+        Internal method that fetches the seasons `season_nums` concurrently.
+        Accumulates each season's episode ratings in the `SeriesRatings` arg,
+        in season order.
+        """
+        if not season_nums:
+            return
+        workers = min(self.__SEASON_WORKERS, len(season_nums))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            all_ratings = pool.map(
+                lambda season_num: self._query_ratings_in_season(
+                    title_id, season_num),
+                season_nums)
+            for season_num, season_ratings in zip(season_nums, all_ratings):
+                if season_ratings is not None:
+                    self._add_season_ratings(series_ratings, season_num,
+                                             season_ratings)
+
+    def _query_ratings_in_season(self, title_id: str,
+                                 season_num: int) -> List[float]:
+        path = consts.SEASON_URL.format(title_id=title_id,
+                                        season_num=season_num)
+        ratings = self._cached_parse(path)
+        if ratings is None:
+            ratings = self._parse_episode_ratings(self._fetch(path))
+            if self.__page_cache is not None:
+                self.__page_cache.set_parsed(
+                    urljoin(self.__BASE_URL, path), ratings)
+        if ratings == []:
+            logger.warning(("No ratings found for season {}. This usually "
+                            "indicates this season has not aired yet."
+                            ).format(season_num))
+        return ratings if ratings != [] else None
+
+    def _parse_overall_rating(self, page: html.HtmlElement) -> float:
+        elems = page.xpath(consts.OVERALL_RATINGS_XPATH)
+        if not elems:
+            raise PageParseError("Overall rating not found on title page.")
+        return float(elems[0].text_content())
+
+    def _parse_seasons_count(self, page: html.HtmlElement) -> int:
+        season_nums = [int(a.text_content()) for a in
+                       page.xpath(consts.SEASONS_LINKS_XPATH)
+                       if a.text_content().strip().isdigit()]
+        if not season_nums:
+            raise PageParseError("Seasons count not found on title page.")
+        return max(season_nums)
+
+    def _parse_episode_ratings(self, page: html.HtmlElement) -> List[float]:
+        return [float(elem.text_content())
+                for elem in page.xpath(consts.EPISODE_RATINGS_XPATH)]
+
+    def _cached_parse(self, path: str):
+        """Returns what was parsed out of the page at `path`, if the page is
+        cached and fresh, or None."""
+        if self.__page_cache is None:
+            return None
+        cached = self.__page_cache.get(urljoin(self.__BASE_URL, path))
+        if cached is None or not cached.fresh:
+            return None
+        return cached.parsed
+
+    def _fetch(self, path: str) -> html.HtmlElement:
+        """Fetches a page, relative to the base URL, and parses it.
+
+        Fresh pages are served from the page cache, if any; stale ones are
+        revalidated. Retries up to `timeout_retry` times if the page times
+        out.
+
+        Raises
+        ------
+        `PageFetchError`
+            raised when the page cannot be loaded, or is not served with
+            a 200 status code (or a 304 for a cached page).
+        """
+        url = urljoin(self.__BASE_URL, path)
+        cached = None
+        if self.__page_cache is not None:
+            cached = self.__page_cache.get(url)
+            if cached is not None and cached.fresh:
+                return html.fromstring(cached.body)
+            if self.__page_cache.offline:
+                raise PageFetchError(f"{url} is not cached (offline)")
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+        for count in range(1, self.__PAGE_LOAD_TIMEOUT_RETRY + 1):
+            self._throttle(url)
+            try:
+                resp = self.__session.get(url, headers=headers,
+                                          timeout=self.__PAGE_LOAD_TIMEOUT)
+                break
+            except requests.Timeout:
+                logger.error(
+                    "Timeout loading {}, retrying attempt {}...".format(
+                        url, count))
+            except requests.RequestException as exc:
+                raise PageFetchError(f"Unable to load {url}: {exc}")
+        else:
+            raise PageFetchError(f"Timed out loading {url}")
+
+        if resp.status_code == 304 and cached is not None:
+            self.__page_cache.touch(url)
+            return html.fromstring(cached.body)
+        if resp.status_code != 200:
+            raise PageFetchError("Loading {} returned status code {}".format(
+                url, resp.status_code), status_code=resp.status_code)
+        if self.__page_cache is not None:
+            self.__page_cache.put(url, resp.content,
+                                  etag=resp.headers.get('ETag'),
+                                  last_modified=resp.headers.get(
+                                      'Last-Modified'))
+        return html.fromstring(resp.content)
+
+
+class PageFetchError(Exception):
+    """Raised when a page cannot be fetched by the HTTP backend.
+
+    `status_code` is the HTTP status the server answered with, or None if it
+    did not answer (timeout, connection error, or offline cache miss).
+    """
+
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class PageParseError(Exception):
+    """Raised when an expected element cannot be found on a fetched page."""
+    pass
+
+
+class SeriesNotFoundError(LookupError):
+    """Raised when a name does not resolve to a TV series on IMDb."""
+    pass
@@ -0,0 +1,63 @@
+"""
+extractor/incremental.py
+------------------------
+
+Chooses which seasons of an already stored series to extract again, so that
+refreshing a running show does not re-fetch seasons that cannot have changed.
+"""
+
+import time
+from typing import List
+
+
+class SeasonPlanner():
+    """Plans the seasons to re-extract for a stored series.
+
+    A season is re-extracted if it is
+    - one of the `latest_seasons` latest (new episodes and ratings land there),
+    - not stored (it is new, or had no rated episodes when last extracted), or
+    - stale: last checked more than `stale_after_secs` ago.
+
+    Args
+    ----
+    `summary`: dict, required.
+        The stored seasons of the series, as returned by
+        `DBClient.season_summaries`.
+
+    `latest_seasons`: int, required.
+
+    `stale_after_secs`: float, required.
+
+    `now`: float, optional.
+        Current time, in seconds since the epoch. Defaults to `time.time()`.
+    """
+
+    def __init__(self, summary: dict, latest_seasons: int,
+                 stale_after_secs: float, now: float = None):
+        self.__LATEST_SEASONS = latest_seasons
+        self.__STALE_BEFORE_MS = 1000 * (
+            (time.time() if now is None else now) - stale_after_secs)
+        fallback_ms = _millis(summary.get('last_modified'))
+        self.__checked_ms = {
+            season['season']: _millis(season.get('last_checked'),
+                                      fallback_ms)
+            for season in summary.get('seasons', [])}
+
+    def select(self, seasons_count: int) -> List[int]:
+        """Returns the numbers of the seasons to re-extract, in order, out of
+        the `seasons_count` seasons the series has.
+        """
+        latest_from = seasons_count - self.__LATEST_SEASONS + 1
+        return [num for num in range(1, seasons_count + 1)
+                if num >= latest_from or self._is_stale(num)]
+
+    def _is_stale(self, season_num: int) -> bool:
+        checked_ms = self.__checked_ms.get(season_num)
+        return checked_ms is None or checked_ms < self.__STALE_BEFORE_MS
+
+
+def _millis(date: dict, default: int = None) -> int:
+    """Reads a `{"$date": <epoch millis>}` value, as db-service encodes it."""
+    if not date:
+        return default
+    return date['$date']
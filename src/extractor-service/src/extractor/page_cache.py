@@ -0,0 +1,289 @@
+"""
+extractor/page_cache.py
+-----------------------
+
+A persistent, size-bounded cache of fetched pages (and of what was parsed out
+of them), so that repeat extractions mostly skip the network.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import logging.config
+import os
+import re
+import threading
+import time
+from typing import Dict, NamedTuple
+from urllib.parse import urlparse
+
+from common.utils import get_logger_cfg_fpath
+from extractor.config import ExtractorConfig
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECS = {
+    'find': 7 * 86400,
+    'title': 86400,
+    'season': 86400,
+    'other': 86400,
+}
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: str
+    fresh: bool
+    parsed: object
+
+
+class PageCache():
+    """A thread-safe, on-disk cache of pages, keyed by URL.
+
+    Every page is stored gzipped under the SHA-256 of its URL, next to a JSON
+    file holding its validators (`ETag`, `Last-Modified`), the digest of the
+    gzipped page, when it was last fetched or revalidated, and optionally
+    what was parsed out of it. A page
+    is fresh for the TTL of its type (`find`, `title`, `season` or `other`,
+    see `page_type`); a stale page can still be revalidated with its
+    validators. Once the cache outgrows `max_bytes`, the least recently used
+    pages are evicted.
+
+    In `offline` mode every cached page counts as fresh, which lets recorded
+    pages be replayed without a network.
+
+    Args
+    ----
+    `cache_dir`: str, required.
+
+    `max_bytes`: int, optional, default=256MiB.
+
+    `ttl_secs`: Dict[str, float], optional.
+        TTLs by page type, overriding `DEFAULT_TTL_SECS`.
+
+    `offline`: bool, optional, default=False.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 2**20,
+                 ttl_secs: Dict[str, float] = None, offline: bool = False):
+        self.__DIR = cache_dir
+        self.__MAX_BYTES = max_bytes
+        self.__TTL_SECS = dict(DEFAULT_TTL_SECS, **(ttl_secs or {}))
+        self.__OFFLINE = offline
+        # reads of a page replaced while it is read, before giving up
+        self.__READ_ATTEMPTS = 3
+        self.__lock = threading.Lock()
+        # key -> (size in bytes, last used at)
+        self.__index = {}
+        self.__bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @property
+    def offline(self) -> bool:
+        return self.__OFFLINE
+
+    @property
+    def size_bytes(self) -> int:
+        with self.__lock:
+            return self.__bytes
+
+    def get(self, url: str) -> CachedPage:
+        """Returns the cached page at `url`, or None if it is not cached."""
+        key = self._key(url)
+        meta = self._locked_read_meta(key, url, mark_used=True)
+        for _ in range(self.__READ_ATTEMPTS):
+            if meta is None:
+                return None
+            body = self._read_body(key, url)
+            if body is None:
+                return None
+            # the page may have been replaced since `meta` was read; the
+            # body is the one of `meta` if the digests match
+            current = self._locked_read_meta(key, url)
+            if (current is not None and
+                    current.get('digest') == meta.get('digest')):
+                age = time.time() - current['fetched_at']
+                fresh = (self.__OFFLINE or
+                         age < self.__TTL_SECS[page_type(url)])
+                return CachedPage(body=body, etag=current.get('etag'),
+                                  last_modified=current.get('last_modified'),
+                                  fresh=fresh, parsed=current.get('parsed'))
+            meta = current
+        return None
+
+    def put(self, url: str, body: bytes, etag: str = None,
+            last_modified: str = None) -> None:
+        """Caches the page at `url`, replacing what was cached (including
+        what was parsed out of it)."""
+        key = self._key(url)
+        # compressed outside of the lock, so that writers are not serialized
+        compressed = gzip.compress(body)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'fetched_at': time.time(), 'parsed': None,
+                'digest': hashlib.sha256(compressed).hexdigest()}
+        with self.__lock:
+            self._write(key, 'gz', compressed)
+            self._write(key, 'json', json.dumps(meta).encode('utf-8'))
+            self._update_size(key)
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """Marks the page at `url` as just fetched, e.g. after the server
+        confirmed it has not been modified."""
+        self._update_meta(url, fetched_at=time.time())
+
+    def set_parsed(self, url: str, parsed) -> None:
+        """Caches what was parsed out of the page at `url` (JSON-encodable),
+        until the page itself is replaced."""
+        self._update_meta(url, parsed=parsed)
+
+    def clear(self) -> None:
+        with self.__lock:
+            for key in list(self.__index):
+                self._remove(key)
+
+    def _update_meta(self, url: str, **fields) -> None:
+        key = self._key(url)
+        with self.__lock:
+            if key not in self.__index:
+                return
+            try:
+                meta = self._read_meta(key)
+            except (OSError, ValueError):
+                self._remove(key)
+                return
+            meta.update(fields)
+            self._write(key, 'json', json.dumps(meta).encode('utf-8'))
+            self._update_size(key)
+            self._mark_used(key)
+
+    def _locked_read_meta(self, key: str, url: str,
+                          mark_used: bool = False) -> dict:
+        """Reads the metadata of a page under the lock; None if the page is
+        not cached or its metadata is unreadable (then, it is dropped)."""
+        with self.__lock:
+            if key not in self.__index:
+                return None
+            try:
+                meta = self._read_meta(key)
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Dropping unreadable cached page {url}: "
+                               f"{exc!r}")
+                self._remove(key)
+                return None
+            if mark_used:
+                self._mark_used(key)
+            return meta
+
+    def _read_body(self, key: str, url: str) -> bytes:
+        """Reads and decompresses a page, outside of the lock so that
+        concurrent readers are not serialized (files are replaced
+        atomically). None if it was evicted, or is unreadable (then, it is
+        dropped)."""
+        try:
+            with gzip.open(self._path(key, 'gz'), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as exc:
+            logger.warning(f"Dropping unreadable cached page {url}: "
+                           f"{exc!r}")
+            with self.__lock:
+                self._remove(key)
+            return None
+
+    def _load_index(self) -> None:
+        for entry in os.scandir(self.__DIR):
+            key, ext = os.path.splitext(entry.name)
+            if ext == '.gz' and os.path.isfile(self._path(key, 'json')):
+                self._update_size(key)
+
+    def _update_size(self, key: str) -> None:
+        size = (os.path.getsize(self._path(key, 'gz')) +
+                os.path.getsize(self._path(key, 'json')))
+        old_size, _ = self.__index.get(key, (0, None))
+        self.__index[key] = (size, os.path.getmtime(self._path(key, 'gz')))
+        self.__bytes += size - old_size
+
+    def _mark_used(self, key: str) -> None:
+        now = time.time()
+        os.utime(self._path(key, 'gz'), (now, now))
+        self.__index[key] = (self.__index[key][0], now)
+
+    def _evict(self) -> None:
+        if self.__bytes <= self.__MAX_BYTES:
+            return
+        for key, _ in sorted(self.__index.items(), key=lambda kv: kv[1][1]):
+            self._remove(key)
+            if self.__bytes <= self.__MAX_BYTES:
+                break
+
+    def _remove(self, key: str) -> None:
+        size, _ = self.__index.pop(key, (0, None))
+        self.__bytes -= size
+        for ext in ('gz', 'json'):
+            try:
+                os.remove(self._path(key, ext))
+            except FileNotFoundError:
+                pass
+
+    def _read_meta(self, key: str) -> dict:
+        with open(self._path(key, 'json'), 'rb') as f:
+            return json.loads(f.read())
+
+    def _write(self, key: str, ext: str, data: bytes) -> None:
+        """Writes a file atomically, so readers never see it half written."""
+        path = self._path(key, ext)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.__DIR, f"{key}.{ext}")
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+_shared_caches = {}
+_shared_caches_lock = threading.Lock()
+
+
+def shared_page_cache(config: ExtractorConfig) -> PageCache:
+    """Returns the process-wide cache of the config's `page_cache.dir`, or
+    None if it is not set. Extractors of the same directory share a cache,
+    so that its size is accounted for once.
+    """
+    if config.page_cache_dir is None:
+        return None
+    cache_dir = os.path.abspath(config.page_cache_dir)
+    with _shared_caches_lock:
+        if cache_dir not in _shared_caches:
+            _shared_caches[cache_dir] = PageCache(
+                cache_dir, max_bytes=config.page_cache_max_bytes,
+                ttl_secs=config.page_cache_ttl_secs,
+                offline=config.page_cache_offline)
+        return _shared_caches[cache_dir]
+
+
+def page_type(url: str) -> str:
+    """Returns the type of an IMDb page, which sets how long it is cached:
+    `find` (search results), `title`, `season` (episodes) or `other`.
+    """
+    path = urlparse(url).path
+    if path.startswith('/find'):
+        return 'find'
+    if re.match(r'^/title/tt\d+/episodes', path):
+        return 'season'
+    if re.match(r'^/title/tt\d+/?$', path):
+        return 'title'
+    return 'other'
@@ -0,0 +1,179 @@
+"""
+extractor/persistence.py
+------------------------
+
+Saves series ratings to db-service while a batch is still being extracted,
+so that finished work is persisted right away and never piles up in memory.
+"""
+
+import logging
+import logging.config
+import queue
+import random
+import threading
+import time
+from typing import Dict, List
+
+from common.utils import get_logger_cfg_fpath
+from extractor.db_client import DBClient, DBRequestError
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BatchWriter():
+    """Persists series ratings in the background, in batches, as they are
+    submitted.
+
+    `submit` puts a series on a bounded queue, blocking while the queue is
+    full, so extraction never runs more than `queue_size` series ahead of
+    persistence. A writer thread saves up to `batch_size` series per request,
+    as soon as that many are queued or `flush_secs` after the first of them
+    was. Series that fail to be saved (but are not invalid) are retried up to
+    `retries` times, with jittered exponential backoff from `backoff_secs`,
+    on top of the retries of `db_client` itself.
+
+    Use as a context manager, or call `close` to flush what is queued.
+
+    Args
+    ----
+    `db_client`: DBClient, required.
+
+    `batch_size`: int, optional, default=10.
+
+    `queue_size`: int, optional, default=20.
+
+    `flush_secs`: float, optional, default=1.0.
+
+    `retries`: int, optional, default=3.
+
+    `backoff_secs`: float, optional, default=0.5.
+    """
+
+    def __init__(self, db_client: DBClient, batch_size: int = 10,
+                 queue_size: int = 20, flush_secs: float = 1.0,
+                 retries: int = 3, backoff_secs: float = 0.5):
+        self.__db = db_client
+        self.__BATCH_SIZE = batch_size
+        self.__FLUSH_SECS = flush_secs
+        self.__RETRIES = retries
+        self.__BACKOFF_SECS = backoff_secs
+        self.__queue = queue.Queue(maxsize=queue_size)
+        self.__lock = threading.Lock()
+        self.__failed = {}
+        self.__saved_count = 0
+        self.__closed = False
+        self.__thread = threading.Thread(target=self._run, daemon=True)
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def submit(self, series_json: dict) -> None:
+        """Queues a series (in `SeriesRatings.json` format) to be saved.
+        Blocks while the queue is full.
+
+        Raises
+        ------
+        `BatchWriterClosedError` if the writer has been closed.
+        """
+        if self.__closed:
+            raise BatchWriterClosedError
+        self.__queue.put(series_json)
+
+    def close(self) -> None:
+        """Saves what is still queued, then stops the writer thread."""
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__queue.put(_STOP)
+        self.__thread.join()
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """Returns the series that could not be saved, mapped to why."""
+        with self.__lock:
+            return dict(self.__failed)
+
+    @property
+    def saved_count(self) -> int:
+        with self.__lock:
+            return self.__saved_count
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self.__queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.__FLUSH_SECS
+            while len(batch) < self.__BATCH_SIZE:
+                try:
+                    item = self.__queue.get(
+                        timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._write(batch)
+            except Exception as exc:
+                logger.exception("Unexpected error saving a batch")
+                self._record_failures(batch, repr(exc))
+
+    def _write(self, batch: List[dict]) -> None:
+        """Saves a batch, retrying the series that failed to be saved."""
+        for attempt in range(self.__RETRIES + 1):
+            try:
+                results = self.__db.save_many(batch)
+            except DBRequestError as exc:
+                reason = str(exc)
+                logger.error(f"Failed to save a batch of {len(batch)}: "
+                             f"{reason}")
+            else:
+                retry = []
+                for series_json, result in zip(batch, results):
+                    if result['status'] == 'error':
+                        retry.append(series_json)
+                        reason = str(result['messages'])
+                    elif result['status'] == 'invalid':
+                        self._record_failures([series_json],
+                                              str(result['messages']))
+                    else:
+                        with self.__lock:
+                            self.__saved_count += 1
+                if len(results) < len(batch):
+                    # the series without a result may not have been saved
+                    retry.extend(batch[len(results):])
+                    reason = (f"No result for {len(batch) - len(results)} "
+                              f"of {len(batch)} series")
+                    logger.error(f"Failed to save a batch: {reason}")
+                batch = retry
+            if not batch:
+                return
+            if attempt < self.__RETRIES:
+                time.sleep(random.uniform(0, self.__BACKOFF_SECS * 2**attempt))
+        self._record_failures(batch, reason)
+
+    def _record_failures(self, batch: List[dict], reason: str) -> None:
+        with self.__lock:
+            for series_json in batch:
+                logger.error("Failed to save `{}`: {}".format(
+                    series_json.get('name'), reason))
+                self.__failed[series_json.get('name')] = reason
+
+
+class BatchWriterClosedError(RuntimeError):
+    """Raised when submitting to a closed `BatchWriter`."""
+    pass
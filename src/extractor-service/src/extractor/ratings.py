@@ -1,6 +1,7 @@
 import logging
 import logging.config
-from typing import List
+from array import array
+from typing import Iterator, List, Tuple
 
 from common.utils import get_logger_cfg_fpath
 
@@ -14,7 +15,18 @@ SERIES_NAME_MAXLEN = 100
 
 
 class SeriesRatings():
-    """Data structure that contains rating-related info on a TV series"""
+    """Data structure that contains rating-related info on a TV series
+
+    Episode ratings are stored column-wise: the ratings of every season are
+    laid end to end in a single `array('d')` buffer, and a season index
+    (`season_numbers`, `season_offsets`) records where each season starts.
+    A rating thus costs 8 bytes, rather than the ~100 of a float in a list in
+    a dict. Seasons can be read without copies through `season_view` or
+    `ratings_buffer`.
+    """
+
+    __slots__ = ('__SERIES_NAME', '__OVERALL_RATING', '__SEASONS_COUNT',
+                 '__ratings', '__season_nums', '__offsets')
 
     def __init__(self, series_name: str,
                  overall_rating: float = None, seasons_count: int = None):
@@ -33,8 +45,12 @@ class SeriesRatings():
         self.__SERIES_NAME = series_name
         self.__OVERALL_RATING = overall_rating
         self.__SEASONS_COUNT = seasons_count
-        self.__episode_ratings = {}
-        self.__max_episode_num = 0
+        # ratings of all seasons, end to end, in the order they were added
+        self.__ratings = array('d')
+        # season numbers, and where each season starts in `__ratings`; the
+        # last offset is where the last season ends
+        self.__season_nums = array('I')
+        self.__offsets = array('Q', [0])
 
     @property
     def series_name(self):
@@ -65,15 +81,58 @@ class SeriesRatings():
                 ep_1_rating, ep_2_rating, ...
             ]
         }
+
+        The lists are copies; use `season_view` to read a season in place.
+        """
+        return {season_num: self.__ratings[start:stop].tolist()
+                for season_num, start, stop in self._season_bounds()}
+
+    @property
+    def season_numbers(self) -> Tuple[int, ...]:
+        """Returns the numbers of the seasons added, in the order they were
+        added (which is the order of `ratings_buffer`)."""
+        return tuple(self.__season_nums)
+
+    @property
+    def season_offsets(self) -> Tuple[int, ...]:
+        """Returns where each season of `season_numbers` starts in
+        `ratings_buffer`, followed by where the last one ends."""
+        return tuple(self.__offsets)
+
+    @property
+    def ratings_buffer(self) -> memoryview:
+        """Returns a read-only, zero-copy view of the ratings of all seasons,
+        end to end (e.g. for `numpy.frombuffer`).
+
+        Note
+        ----
+        - Seasons cannot be added or resized while a view is held.
+        - Before Python 3.8 (no `memoryview.toreadonly`), this is a view of
+          a read-only copy.
         """
-        # TODO: it is probably a good idea to make `SeriesRatings` iterable,
-        # rather than to directly return the dict of lists object.
-        return self.__episode_ratings
+        view = memoryview(self.__ratings)
+        if hasattr(view, 'toreadonly'):
+            return view.toreadonly()
+        return memoryview(view.tobytes()).cast(view.format)
 
     @property
     def json(self):
         return self._to_json()
 
+    def season_view(self, season_num: int) -> memoryview:
+        """Returns a read-only, zero-copy view of the ratings of a season.
+        See `ratings_buffer`.
+
+        Raises
+        ------
+        `KeyError`
+            raised when the season has not been added
+        """
+        i = self._season_index(season_num)
+        if i is None:
+            raise KeyError(season_num)
+        return self.ratings_buffer[self.__offsets[i]:self.__offsets[i + 1]]
+
     def set_overall_rating(self, rating: float) -> None:
         """Set the overall rating of a TV series."""
         if self.__OVERALL_RATING is not None:
@@ -101,22 +160,32 @@ class SeriesRatings():
         - which season (season number)
         - episode ratings in that season
         """
-        if season_num in self.__episode_ratings and \
-                self.__episode_ratings[season_num] is not None:
-            logger.warning(("Ratings for season {} has been set. Modification "
-                            "of season warnings usually indicates "
-                            "a bug.").format(season_num))
-        self.__episode_ratings[season_num] = season_ratings
-        if len(season_ratings) > self.__max_episode_num:
-            self.__max_episode_num = len(season_ratings)
+        i = self._season_index(season_num)
+        if i is None:
+            self.__ratings.extend(season_ratings)
+            self.__season_nums.append(season_num)
+            self.__offsets.append(len(self.__ratings))
+            return
+
+        logger.warning(("Ratings for season {} has been set. Modification "
+                        "of season warnings usually indicates "
+                        "a bug.").format(season_num))
+        start, stop = self.__offsets[i], self.__offsets[i + 1]
+        self.__ratings[start:stop] = array('d', season_ratings)
+        shift = len(season_ratings) - (stop - start)
+        for j in range(i + 1, len(self.__offsets)):
+            self.__offsets[j] += shift
 
     def __str__(self):
         reprs = []
+        max_episode_num = max(
+            (stop - start for _, start, stop in self._season_bounds()),
+            default=0)
         DESC_STR = ("Overall rating: {}\t".format(self.__OVERALL_RATING) +
                     "Seasons count:  {}".format(self.__SEASONS_COUNT))
         HEADER_STR = "      " + "".join(["E{:<4}".format(ep_num)
                                          for ep_num in range(
-                                             self.__max_episode_num)])
+                                             max_episode_num)])
         SPACE_LEN = 2
         banner_len = (max(len(HEADER_STR), len(DESC_STR)) -
                       len(self.__SERIES_NAME) - 2 * SPACE_LEN) // 2
@@ -126,15 +195,27 @@ class SeriesRatings():
                      self.__SERIES_NAME + " " * SPACE_LEN + "*" * banner_len)
         reprs.append(DESC_STR)
         reprs.append(HEADER_STR)
-        for season_num, ratings in self.__episode_ratings.items():
+        for season_num, start, stop in self._season_bounds():
             reprs.append("S{:<5}".format(season_num) +
-                         "  ".join(map(str, ratings)))
+                         "  ".join(map(str, self.__ratings[start:stop])))
         reprs.append("")
         return "\n".join(reprs)
 
     def __repr__(self):
         return f"SeriesRatings object, series=`{self.series_name}``"
 
+    def _season_index(self, season_num: int) -> int:
+        """Returns the position of a season in the season index, or None."""
+        try:
+            return self.__season_nums.index(season_num)
+        except (ValueError, OverflowError, TypeError):
+            return None
+
+    def _season_bounds(self) -> Iterator[Tuple[int, int, int]]:
+        """Yields `(season_num, start, stop)` of every season, in order."""
+        for i, season_num in enumerate(self.__season_nums):
+            yield season_num, self.__offsets[i], self.__offsets[i + 1]
+
     def _validate_args(self, series_name: str,
                        overall_rating: float = None, seasons_count: int = None):
         """Performs argument validation for SeriesRatings. Ensures that
@@ -225,18 +306,13 @@ class SeriesRatings():
             'series_rating': self.__OVERALL_RATING,
             'episode_ratings': []
         }
-        for season_num, season_ratings in self.__episode_ratings.items():
-            obj = {}
-            ep_ctr = 1
-            obj['season'] = season_num
-            obj['ratings'] = []
-            for ep_rating in season_ratings:
-                obj['ratings'].append({
-                    'episode_number': ep_ctr,
-                    'rating': ep_rating
-                })
-                ep_ctr += 1
-            json_obj['episode_ratings'].append(obj)
+        for season_num, start, stop in self._season_bounds():
+            json_obj['episode_ratings'].append({
+                'season': season_num,
+                'ratings': [{'episode_number': ep_num, 'rating': ep_rating}
+                            for ep_num, ep_rating in enumerate(
+                                self.__ratings[start:stop], 1)]
+            })
         return json_obj
 
 
@@ -310,6 +386,14 @@ class SeriesRatingsCollection():
         for ratings in ratings_list:
             self.add(ratings)
 
+    def analytics(self) -> 'RatingsMatrix':
+        """Packs the ratings of the collection for vectorized analytics; see
+        `extractor.analytics.RatingsMatrix`. The matrix is a snapshot: series
+        added afterwards are not in it.
+        """
+        from extractor.analytics import RatingsMatrix
+        return RatingsMatrix(self.__ratings_collection.values())
+
     def __contains__(self, item):
         assert isinstance(item, str)
         return item in self.__ratings_collection
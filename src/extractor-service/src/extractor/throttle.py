@@ -0,0 +1,54 @@
+"""
+extractor/throttle.py
+---------------------
+
+Client-side throttling of page loads, so that parallel extractions do not get
+us rate-limited (or banned) by IMDb.
+"""
+
+import threading
+import time
+
+
+class RateLimiter():
+    """A thread-safe, per-host token bucket.
+
+    Each host gets its own bucket of `burst` tokens, refilled at
+    `requests_per_sec`. `acquire` takes a token, sleeping until one is
+    available; waiting callers are served in the order they arrived.
+
+    Args
+    ----
+    `requests_per_sec`: float, required.
+        Sustained number of requests permitted per host per second.
+
+    `burst`: int, optional, default=1.
+        Number of requests that may be sent back-to-back to an idle host.
+    """
+
+    def __init__(self, requests_per_sec: float, burst: int = 1):
+        if requests_per_sec <= 0:
+            raise ValueError("`requests_per_sec` must be positive.")
+        if burst < 1:
+            raise ValueError("`burst` must be at least 1.")
+        self.__RATE = requests_per_sec
+        self.__BURST = burst
+        self.__lock = threading.Lock()
+        self.__buckets = {}
+
+    def acquire(self, host: str) -> float:
+        """Blocks until a request to `host` is permitted.
+
+        Returns the number of seconds spent waiting.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            tokens, last = self.__buckets.get(host, (self.__BURST, now))
+            tokens = min(self.__BURST, tokens + (now - last) * self.__RATE)
+            # tokens may go negative: that reserves a slot in the future
+            tokens -= 1
+            self.__buckets[host] = (tokens, now)
+        wait_secs = -tokens / self.__RATE if tokens < 0 else 0
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+        return wait_secs
@@ -0,0 +1,201 @@
+"""
+extractor/title_index.py
+------------------------
+
+A persistent index of series names to IMDb title IDs, so that known series
+are loaded straight from their title page instead of through a search.
+"""
+
+import difflib
+import json
+import logging
+import logging.config
+import os
+import threading
+from typing import Iterable
+
+from common.utils import get_logger_cfg_fpath, normalize_identifier
+from extractor.config import ExtractorConfig
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+SERIES_TITLE_TYPES = ('tvSeries', 'tvMiniSeries')
+
+
+class TitleIndex():
+    """A thread-safe index of series names to IMDb title IDs (`tt...`).
+
+    Names are normalized as the database service does (see
+    `common.utils.normalize_identifier`). The index is filled by seed files
+    and by successful searches (`add`). Only what was learned (added, or
+    invalidated) is saved to `path`, as a JSON object, on every change; seed
+    entries are not rewritten. Entries that turn out to be wrong are removed
+    with `invalidate`.
+
+    A name that is not indexed falls back to the closest indexed name, if
+    one is at least `fuzzy_cutoff` similar (see `difflib.get_close_matches`)
+    and the index holds at most `fuzzy_max_entries` names: matching scans
+    every name, which large seeds (e.g. all of IMDb's series) make too slow.
+
+    Args
+    ----
+    `path`: str, optional.
+        File the index is loaded from and saved to. If None, the index is
+        kept in memory only.
+
+    `seed_paths`: Iterable[str], optional.
+        Files to fill the index with: JSON objects of names to title IDs, or
+        TSV files of `title ID<TAB>name` lines (such as IMDb's
+        `title.basics.tsv`, of which only series are indexed, by primary
+        title). Names of several title IDs in a file (remakes, series of
+        the same name) are left out, so that they are searched for. Entries
+        of `path` take precedence.
+
+    `fuzzy_cutoff`: float, optional, default=0.9.
+        Set to 1 to disable fuzzy matching.
+
+    `fuzzy_max_entries`: int, optional, default=10000.
+    """
+
+    def __init__(self, path: str = None, seed_paths: Iterable[str] = (),
+                 fuzzy_cutoff: float = 0.9, fuzzy_max_entries: int = 10000):
+        self.__PATH = path
+        self.__FUZZY_CUTOFF = fuzzy_cutoff
+        self.__FUZZY_MAX_ENTRIES = fuzzy_max_entries
+        self.__lock = threading.Lock()
+        self.__title_ids = {}
+        for seed_path in seed_paths:
+            self.__title_ids.update(self._load_seed(seed_path))
+        # learned entries, saved to `path`; None for removed seed entries
+        self.__learned = {}
+        if path is not None and os.path.isfile(path):
+            with open(path, 'r') as f:
+                self.__learned = json.load(f)
+        for key, title_id in self.__learned.items():
+            if title_id is None:
+                self.__title_ids.pop(key, None)
+            else:
+                self.__title_ids[key] = title_id
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__title_ids)
+
+    def lookup(self, name: str, fuzzy: bool = True) -> str:
+        """Returns the title ID of the series `name`, or None if neither it
+        nor (if `fuzzy`) a close enough name is indexed.
+        """
+        key = normalize_identifier(name)
+        with self.__lock:
+            if key in self.__title_ids:
+                return self.__title_ids[key]
+            if (not fuzzy or self.__FUZZY_CUTOFF >= 1 or
+                    len(self.__title_ids) > self.__FUZZY_MAX_ENTRIES):
+                return None
+            keys = list(self.__title_ids)
+        # matched outside of the lock, not to block other lookups
+        matches = difflib.get_close_matches(key, keys, n=1,
+                                            cutoff=self.__FUZZY_CUTOFF)
+        if not matches:
+            return None
+        with self.__lock:
+            title_id = self.__title_ids.get(matches[0])
+        if title_id is not None:
+            logger.info(f"`{name}` matched `{matches[0]}` in the title index")
+        return title_id
+
+    def add(self, name: str, title_id: str) -> None:
+        key = normalize_identifier(name)
+        with self.__lock:
+            if self.__title_ids.get(key) == title_id:
+                return
+            self.__title_ids[key] = title_id
+            self.__learned[key] = title_id
+            self._save()
+
+    def invalidate(self, name: str, title_id: str = None) -> None:
+        """Removes the series `name` from the index and, if `title_id` is
+        provided (the ID `lookup` returned for `name`), the entries of that
+        ID, e.g. the one a fuzzy lookup matched.
+        """
+        key = normalize_identifier(name)
+        with self.__lock:
+            keys = [key] if key in self.__title_ids else []
+            if title_id is not None:
+                keys += [indexed for indexed, indexed_id
+                         in self.__title_ids.items()
+                         if indexed_id == title_id and indexed != key]
+            for removed in keys:
+                del self.__title_ids[removed]
+                self.__learned[removed] = None
+                logger.info(f"Removed `{removed}` from the title index")
+            if keys:
+                self._save()
+
+    def _save(self) -> None:
+        if self.__PATH is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.__PATH))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.__PATH}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.__learned, f, sort_keys=True)
+        os.replace(tmp_path, self.__PATH)
+
+    @staticmethod
+    def _load_seed(seed_path: str) -> dict:
+        """Returns the entries of a seed file, without the names of several
+        title IDs."""
+        if seed_path.endswith('.json'):
+            with open(seed_path, 'r') as f:
+                entries = list(json.load(f).items())
+        else:
+            entries = []
+            with open(seed_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) < 2 or not fields[0].startswith('tt'):
+                        continue  # header, or malformed
+                    if len(fields) > 2:
+                        # title.basics: tconst, titleType, primaryTitle, ...
+                        if fields[1] not in SERIES_TITLE_TYPES:
+                            continue
+                        entries.append((fields[2], fields[0]))
+                    else:
+                        entries.append((fields[1], fields[0]))
+        title_ids = {}
+        ambiguous = set()
+        for name, title_id in entries:
+            key = normalize_identifier(name)
+            if title_ids.setdefault(key, title_id) != title_id:
+                ambiguous.add(key)
+        if ambiguous:
+            logger.info(f"Left {len(ambiguous)} ambiguous names of "
+                        f"{seed_path} out of the title index")
+        for key in ambiguous:
+            del title_ids[key]
+        return title_ids
+
+
+_shared_indexes = {}
+_shared_indexes_lock = threading.Lock()
+
+
+def shared_title_index(config: ExtractorConfig) -> TitleIndex:
+    """Returns the process-wide index of the config's `title_index.path`, or
+    None if it is not set.
+    """
+    if config.title_index_path is None:
+        return None
+    path = os.path.abspath(config.title_index_path)
+    with _shared_indexes_lock:
+        if path not in _shared_indexes:
+            _shared_indexes[path] = TitleIndex(
+                path, seed_paths=config.title_index_seeds,
+                fuzzy_cutoff=config.title_index_fuzzy_cutoff,
+                fuzzy_max_entries=config.title_index_fuzzy_max_entries)
+        return _shared_indexes[path]
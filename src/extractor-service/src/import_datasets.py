@@ -0,0 +1,87 @@
+"""
+import_datasets.py
+------------------
+
+Imports the ratings of every series in IMDb's TSV dataset dumps into
+db-service (or into a JSON lines file, with `--out`).
+
+    python3 src/import_datasets.py title.basics.tsv.gz title.episode.tsv.gz \\
+        title.ratings.tsv.gz [--min-votes N] [--partitions N] [--out FILE]
+"""
+
+import argparse
+import json
+import logging
+import logging.config
+import sys
+
+from common.utils import get_logger_cfg_fpath
+from extractor import make_db_client
+from extractor.config import ExtractorConfig
+from extractor.datasets import DatasetImporter
+from extractor.persistence import BatchWriter
+
+try:
+    logging.config.fileConfig(get_logger_cfg_fpath())
+except FileNotFoundError as e:
+    print(e)
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Import series ratings from IMDb's TSV dataset dumps.")
+    parser.add_argument('basics', help="path to title.basics.tsv[.gz]")
+    parser.add_argument('episodes', help="path to title.episode.tsv[.gz]")
+    parser.add_argument('ratings', help="path to title.ratings.tsv[.gz]")
+    parser.add_argument('--partitions', type=int, default=32,
+                        help="number of partitions the dumps are joined in")
+    parser.add_argument('--min-votes', type=int, default=0,
+                        help="skip series with fewer votes")
+    parser.add_argument('--work-dir', default=None,
+                        help="directory to spill partitions to")
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help="number of series saved per request")
+    parser.add_argument('--out', default=None,
+                        help="write JSON lines to this file instead of "
+                             "saving to db-service")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    importer = DatasetImporter(args.basics, args.episodes, args.ratings,
+                               partitions=args.partitions,
+                               min_votes=args.min_votes,
+                               work_dir=args.work_dir)
+
+    if args.out is not None:
+        count = 0
+        with open(args.out, 'w') as f:
+            for series in importer.series():
+                f.write(json.dumps(series) + '\n')
+                count += 1
+        logger.info(f"Wrote {count} series to {args.out}")
+        return True
+
+    config = ExtractorConfig()
+    db_client = make_db_client(config)
+    try:
+        with BatchWriter(db_client, batch_size=args.batch_size,
+                         queue_size=2 * args.batch_size,
+                         flush_secs=config.persist_flush_secs,
+                         retries=config.persist_retries,
+                         backoff_secs=config.db_backoff_secs) as writer:
+            for series in importer.series():
+                writer.submit(series)
+    finally:
+        db_client.close()
+    logger.info(f"Saved {writer.saved_count} series")
+    if writer.failed:
+        logger.error(f"{len(writer.failed)} series could not be saved: "
+                     f"{writer.failed}")
+    return not writer.failed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -5,16 +5,20 @@ rpc.py
 This module implements the services required by the master `.proto`.
 """
 
+import asyncio
 import logging
 from logging.config import fileConfig
 import sys
-import time
+from collections import defaultdict
 from concurrent import futures
+from typing import Callable
 
 import grpc
 
-from common.utils import get_logger_cfg_fpath
-from extractor import IMDb_Queries_Manager
+from common.singleflight import SingleFlight
+from common.utils import get_logger_cfg_fpath, normalize_identifier
+from extractor import (IMDb_Queries_Manager, make_db_client,
+                       make_driver_pool)
 from extractor.config import ExtractorConfig, ExtractorConfigFileNotFoundError
 import imdb_pb2
 import imdb_pb2_grpc
@@ -37,48 +41,142 @@ class ServeError(Exception):
 
 
 class ExtractionService(imdb_pb2_grpc.ExtractorServiceServicer):
+    """Asyncio implementation of `ExtractorService`.
+
+    RPCs are handled on the event loop; each extraction runs on a bounded
+    thread pool (`extraction_workers` in config), with a queries manager of
+    its own, so that concurrent requests never share pending queries.
+
+    Concurrent requests for the same series (by normalized identifier, as
+    stored by the database service) are coalesced into a single extraction,
+    whose result and progress are shared by all of them.
+    """
+
     def __init__(self, *args, **kwargs):
         try:
             extractor_cfg = ExtractorConfig()
         except ExtractorConfigFileNotFoundError:
             raise ExtractionServiceInitError
-        self.mgr = IMDb_Queries_Manager(ExtractorConfig())
-
-    def InitiateExtraction(self, request, context):
+        self.cfg = extractor_cfg
+        self.driver_pool = None
+        if extractor_cfg.backend == 'selenium':
+            self.driver_pool = make_driver_pool(extractor_cfg)
+        self.db_client = make_db_client(extractor_cfg)
+        self.executor = futures.ThreadPoolExecutor(
+            max_workers=extractor_cfg.extraction_workers)
+        self.inflight = SingleFlight()
+        self.progress_listeners = defaultdict(list)
+
+    async def InitiateExtraction(self, request, context):
         logger.info("Requesting to extract `{}`".format(request.item_name))
-        self.mgr.add_query(request.item_name)
-        successful = self.mgr.execute()
+        successful = await self._extract(request.item_name)
         logger.info("Request `{}` finished; success status: {}"
                     .format(request.item_name, successful))
         return imdb_pb2.ExtractionResponse(
             item_name=request.item_name, successful=successful)
 
+    async def StreamExtraction(self, request, context):
+        logger.info("Requesting to stream extraction of `{}`"
+                    .format(request.item_name))
+        progress_queue = asyncio.Queue()
 
-def serve():
+        def on_progress(season_num, seasons_count, episodes_count):
+            progress_queue.put_nowait(imdb_pb2.ExtractionProgress(
+                item_name=request.item_name,
+                season_number=season_num,
+                seasons_count=seasons_count,
+                episodes_count=episodes_count))
+
+        extraction = asyncio.ensure_future(
+            self._extract(request.item_name, on_progress))
+        extraction.add_done_callback(
+            lambda _: progress_queue.put_nowait(None))
+
+        while True:
+            progress = await progress_queue.get()
+            if progress is None:
+                break
+            yield progress
+
+        successful = extraction.result()
+        logger.info("Request `{}` finished; success status: {}"
+                    .format(request.item_name, successful))
+        yield imdb_pb2.ExtractionProgress(
+            item_name=request.item_name, done=True, successful=successful)
+
+    async def _extract(self, item_name: str,
+                       on_progress: Callable = None) -> bool:
+        """Extracts `item_name`, or waits for the extraction of the same
+        series already in flight.
+
+        `on_progress(season_num, seasons_count, episodes_count)` is called on
+        the event loop for every season extracted from now on.
+        """
+        key = normalize_identifier(item_name)
+        if self.inflight.is_inflight(key):
+            logger.info("Extraction of `{}` already in flight; waiting on it"
+                        .format(item_name))
+        if on_progress is not None:
+            self.progress_listeners[key].append(on_progress)
+        try:
+            return await self.inflight.do(
+                key, lambda: self._run_extraction(item_name, key))
+        finally:
+            if on_progress is not None:
+                self.progress_listeners[key].remove(on_progress)
+                if not self.progress_listeners[key]:
+                    del self.progress_listeners[key]
+
+    async def _run_extraction(self, item_name: str, key: str) -> bool:
+        """Extracts `item_name` on the executor, with a manager of its own.
+        """
+        loop = asyncio.get_running_loop()
+
+        def on_season(series_ratings, season_num, season_ratings):
+            loop.call_soon_threadsafe(
+                self._broadcast_progress, key, season_num,
+                series_ratings.seasons_count, len(season_ratings))
+
+        mgr = IMDb_Queries_Manager(self.cfg, self.driver_pool, on_season,
+                                   db_client=self.db_client)
+        mgr.add_query(item_name)
+        return await loop.run_in_executor(self.executor, mgr.execute)
+
+    def _broadcast_progress(self, key: str, *progress) -> None:
+        for on_progress in self.progress_listeners.get(key, []):
+            on_progress(*progress)
+
+    def close(self):
+        """Tears down resources held across requests."""
+        self.executor.shutdown(wait=False)
+        self.db_client.close()
+        if self.driver_pool is not None:
+            self.driver_pool.close()
+
+
+async def serve():
     PORT = ":8989"
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.aio.server()
 
     try:
-        imdb_pb2_grpc.add_ExtractorServiceServicer_to_server(
-            ExtractionService(), server)
+        service = ExtractionService()
     except ExtractionServiceInitError:
         raise ServeError
+    imdb_pb2_grpc.add_ExtractorServiceServicer_to_server(service, server)
 
     server.add_insecure_port('[::]{}'.format(PORT))
-    server.start()
+    await server.start()
     logger.info("Server started at port{}".format(PORT))
 
     try:
-        while True:
-            time.sleep(60 * 60 * 12)
-    except KeyboardInterrupt:
-        server.stop(0)
-        raise ServeError
+        await server.wait_for_termination()
+    finally:
+        await server.stop(None)
+        service.close()
 
 
 if __name__ == '__main__':
     try:
-        serve()
-    except ServeError:
+        asyncio.run(serve())
+    except (ServeError, KeyboardInterrupt):
         sys.exit(1)
-        
\ No newline at end of file
@@ -0,0 +1,70 @@
+import asyncio
+
+from tests.context import common
+from common.singleflight import SingleFlight
+
+
+def test_concurrent_calls_coalesced():
+    sf = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[sf.do("key", work) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert len(calls) == 1
+    assert len(sf) == 0
+
+
+def test_different_keys_not_coalesced():
+    sf = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(sf.do("a", work), sf.do("b", work))
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_exception_shared_and_key_released():
+    sf = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        results = await asyncio.gather(sf.do("key", fail), sf.do("key", fail),
+                                       return_exceptions=True)
+        return results, sf.is_inflight("key")
+
+    results, inflight = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not inflight
+
+
+def test_cancelled_caller_does_not_cancel_operation():
+    sf = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        first = asyncio.ensure_future(sf.do("key", work))
+        second = asyncio.ensure_future(sf.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "result"
@@ -9,4 +9,16 @@ from common import utils
 def test_get_logger_cfg_fpath():
     """Tests that the logger config file path returned leads to an actual file
     """
-    assert os.path.isfile(utils.get_logger_cfg_fpath())
\ No newline at end of file
+    assert os.path.isfile(utils.get_logger_cfg_fpath())
+
+def test_normalize_identifier():
+    """Identifiers should match the ones the database service stores."""
+    assert utils.normalize_identifier("Game of Thrones") == "game_of_thrones"
+    assert utils.normalize_identifier(
+        "How to Sell Drugs Online (Fast)") == "how_to_sell_drugs_online_fast"
+    assert utils.normalize_identifier("game of thrones!") == "game_of_thrones"
+    # edge cases, as stored by the database service
+    assert utils.normalize_identifier("Money  Heist") == "money__heist"
+    assert utils.normalize_identifier("Señorita 89") == "señorita_89"
+    assert utils.normalize_identifier("Dark\tSeason") == "darkseason"
+    assert utils.normalize_identifier("snake_case") == "snakecase"
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'imdb')
+
+
+def _fixture_fname(url: str) -> str:
+    """Maps a request URL to the recorded IMDb page it should be served with.
+    """
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if parsed.path == '/find':
+        slug = re.sub(r'\W+', '_', query.get('q', [''])[0].lower())
+        fname = f'find_{slug}.html'
+        if not os.path.isfile(os.path.join(FIXTURES_DIR, fname)):
+            fname = 'find_no_results.html'
+        return fname
+    match = re.match(r'^/title/(tt\d+)/(episodes)?$', parsed.path)
+    if match is None:
+        return None
+    title_id, episodes = match.groups()
+    if episodes is None:
+        return f'title_{title_id}.html'
+    return f"episodes_{title_id}_s{query.get('season', [''])[0]}.html"
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.server.requested_paths.append(self.path)
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight,
+                                            self.server.in_flight)
+        try:
+            time.sleep(self.server.delay_secs)
+            self._serve_fixture()
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _serve_fixture(self):
+        if self.path in self.server.error_statuses:
+            self.send_error(self.server.error_statuses[self.path])
+            return
+        fname = _fixture_fname(self.path)
+        fpath = os.path.join(FIXTURES_DIR, fname or '')
+        if fname is None or not os.path.isfile(fpath):
+            self.send_error(404)
+            return
+        with open(fpath, 'rb') as f:
+            body = f.read()
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            with self.server.lock:
+                self.server.not_modified_count += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def imdb_server():
+    """Serves the recorded IMDb pages in `fixtures/imdb` from a local HTTP
+    server. Yields the server; its base URL is `server.base_url`, and every
+    path requested is appended to `server.requested_paths`.
+
+    Set `server.delay_secs` to slow down every response; the peak number of
+    requests served at once is recorded in `server.max_in_flight`. Pages are
+    served with an `ETag`; `server.not_modified_count` counts the requests
+    answered with a 304 thanks to `If-None-Match`. Paths of
+    `server.error_statuses` are answered with the status they map to.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    server.base_url = 'http://127.0.0.1:{}/'.format(server.server_port)
+    server.requested_paths = []
+    server.delay_secs = 0
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.not_modified_count = 0
+    server.error_statuses = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _FakeDBHandler(BaseHTTPRequestHandler):
+    """Serves `/tv-series/batch` the way db-service does, from memory."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.server.requests.append(('GET', parsed.path))
+        self.server.connections.add(self.client_address)
+        if self._fail():
+            return
+        query = parse_qs(parsed.query)
+        results = []
+        for name in query.get('name', []):
+            doc = self.server.series.get(_identifier(name))
+            result = {'name': name, 'identifier': _identifier(name),
+                      'exists': doc is not None}
+            if doc is not None and query.get('include') == ['seasons']:
+                checked = {'$date': self.server.checked_ms.get(
+                    _identifier(name), 0)}
+                result['last_modified'] = checked
+                result['seasons'] = [
+                    {'season': season['season'],
+                     'episodes_count': len(season['ratings']),
+                     'last_modified': checked, 'last_checked': checked}
+                    for season in doc.get('episode_ratings', [])]
+            results.append(result)
+        self._send_json({'results': results})
+
+    def do_POST(self):
+        self.server.requests.append(('POST', urlparse(self.path).path))
+        self.server.connections.add(self.client_address)
+        length = int(self.headers['Content-Length'])
+        if self._fail():
+            self.rfile.read(length)
+            return
+        results = []
+        for doc in json.loads(self.rfile.read(length)):
+            identifier = _identifier(doc['name'])
+            status = ('replaced' if identifier in self.server.series
+                      else 'created')
+            self.server.series[identifier] = doc
+            self.server.checked_ms[identifier] = int(time.time() * 1000)
+            results.append({'name': doc['name'], 'identifier': identifier,
+                            'status': status, 'messages': []})
+        self._send_json({'results': results})
+
+    def _fail(self) -> bool:
+        """Answers with `server.fail_status` if failures are still due."""
+        with self.server.lock:
+            if self.server.failures_left == 0:
+                return False
+            self.server.failures_left -= 1
+        self._send_json({'message': 'Failing on purpose'},
+                        self.server.fail_status)
+        return True
+
+    def _send_json(self, obj, status=200):
+        body = json.dumps(obj).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _identifier(name: str) -> str:
+    return name.strip().lower().replace(' ', '_')
+
+
+@pytest.fixture
+def db_server():
+    """Serves an in-memory stand-in of db-service's batch API. Yields the
+    server; its batch endpoint is `server.batch_url`, stored series are in
+    `server.series` (keyed by identifier), and every request is appended to
+    `server.requests` as a `(method, path)` tuple. Series are reported as
+    last checked when they were saved, or at `server.checked_ms[identifier]`.
+
+    Set `server.failures_left` to answer that many requests with
+    `server.fail_status` (default 503) first. The client addresses of all
+    connections used are recorded in `server.connections`.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeDBHandler)
+    server.batch_url = 'http://127.0.0.1:{}/tv-series/batch'.format(
+        server.server_port)
+    server.series = {}
+    server.checked_ms = {}
+    server.requests = []
+    server.connections = set()
+    server.lock = threading.Lock()
+    server.failures_left = 0
+    server.fail_status = 503
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
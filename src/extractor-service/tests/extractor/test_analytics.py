@@ -0,0 +1,120 @@
+import time
+
+import numpy as np
+import pytest
+
+from tests.context import extractor
+from extractor.analytics import RatingsMatrix
+from extractor.ratings import SeriesRatings, SeriesRatingsCollection
+
+
+def _series(name: str, overall: float, seasons: dict) -> SeriesRatings:
+    s = SeriesRatings(series_name=name, overall_rating=overall)
+    for season_num, ratings in seasons.items():
+        s.add_season_ratings(season_num, ratings)
+    return s
+
+
+@pytest.fixture
+def matrix():
+    c = SeriesRatingsCollection()
+    c.add_multiple([
+        _series("Game of Thrones", 9.3, {
+            1: [9.0, 8.8, 8.7], 2: [8.8, 9.6], 3: [4.0, 6.0]}),
+        # seasons added out of order, and an empty season
+        _series("Dark", 8.8, {2: [8.9, 9.1], 1: [8.0, 8.4, 8.2], 3: []}),
+        _series("Chernobyl", 9.4, {1: [9.4, 9.6, 9.4, 9.6, 9.6]}),
+    ])
+    return c.analytics()
+
+
+def test_season_stats(matrix):
+    stats = matrix.season_stats()
+    names = matrix.series_names
+
+    assert [(names[i], s) for i, s in zip(stats['series'],
+                                          stats['season'])] == [
+        ("Game of Thrones", 1), ("Game of Thrones", 2),
+        ("Game of Thrones", 3), ("Dark", 1), ("Dark", 2), ("Chernobyl", 1)]
+    assert stats['count'].tolist() == [3, 2, 2, 3, 2, 5]
+    np.testing.assert_allclose(stats['mean'],
+                               [8.833333, 9.2, 5.0, 8.2, 9.0, 9.52],
+                               atol=1e-6)
+    np.testing.assert_allclose(stats['median'],
+                               [8.8, 9.2, 5.0, 8.2, 9.0, 9.6])
+    np.testing.assert_allclose(stats['var'],
+                               [np.var([9.0, 8.8, 8.7]), 0.16, 1.0,
+                                np.var([8.0, 8.4, 8.2]), 0.01,
+                                np.var([9.4, 9.6, 9.4, 9.6, 9.6])])
+
+
+def test_trend_slopes(matrix):
+    slopes = matrix.trend_slopes()
+    expected = np.polyfit([1, 2, 3], [26.5 / 3, 9.2, 5.0], 1)[0]
+
+    assert slopes[0] == pytest.approx(expected)
+    assert slopes[1] == pytest.approx(0.8)
+    assert np.isnan(slopes[2])
+
+
+def test_largest_drops(matrix):
+    drops, from_seasons, to_seasons = matrix.largest_drops()
+
+    assert drops[0] == pytest.approx(4.2)
+    assert (from_seasons[0], to_seasons[0]) == (2, 3)
+    assert drops[1] == pytest.approx(-0.8)
+    assert np.isnan(drops[2]) and from_seasons[2] == -1
+
+
+def test_outliers(matrix):
+    outliers = matrix.outliers(threshold=2)
+
+    assert outliers == [{'series': "Game of Thrones", 'season': 3,
+                         'episode': 1, 'rating': 4.0,
+                         'z': pytest.approx(outliers[0]['z'])}]
+    assert outliers[0]['z'] < -2
+
+
+def test_top_k(matrix):
+    assert matrix.top_k('overall_rating', k=2) == [("Chernobyl", 9.4),
+                                                   ("Game of Thrones", 9.3)]
+    assert [name for name, _ in matrix.top_k('mean', k=1, largest=False)] \
+        == ["Game of Thrones"]
+    # undefined for Chernobyl (a single season)
+    assert [name for name, _ in matrix.top_k('largest_drop', k=5)] == [
+        "Game of Thrones", "Dark"]
+    assert matrix.top_k('episodes', k=1) == [("Game of Thrones", 7.0)]
+    with pytest.raises(ValueError):
+        matrix.top_k('votes')
+
+
+def test_empty_matrix():
+    matrix = RatingsMatrix([SeriesRatings(series_name="Unaired")])
+
+    assert matrix.episodes_count == 0
+    assert len(matrix.season_stats()['mean']) == 0
+    assert np.isnan(matrix.trend_slopes()[0])
+    assert matrix.outliers() == []
+    assert matrix.top_k('mean') == []
+
+
+def test_many_series_stay_interactive():
+    """Tens of thousands of series should be analyzed in about a second."""
+    rng = np.random.RandomState(0)
+    series = []
+    for i in range(20000):
+        s = SeriesRatings(series_name=f"Series {i}", overall_rating=8.0)
+        for season_num in range(1, 6):
+            s.add_season_ratings(season_num,
+                                 rng.uniform(5, 10, size=10).tolist())
+        series.append(s)
+
+    start = time.perf_counter()
+    matrix = RatingsMatrix(series)
+    matrix.season_stats()
+    matrix.trend_slopes()
+    matrix.largest_drops()
+    matrix.outliers()
+    matrix.top_k('slope', k=10)
+    assert matrix.episodes_count == 1000000
+    assert time.perf_counter() - start < 5
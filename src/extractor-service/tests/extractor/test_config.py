@@ -1,7 +1,8 @@
 import pytest
 
 from tests.context import extractor
-from extractor.config import ExtractorConfig, ExtractorConfigFileNotFoundError
+from extractor.config import (ExtractorConfig, ExtractorConfigFileNotFoundError,
+                              ExtractorConfigValueError)
 
 
 def test_invalid_fpath():
@@ -11,3 +12,19 @@ def test_invalid_fpath():
     invalid_fpath = "conf.yml"
     with pytest.raises(ExtractorConfigFileNotFoundError):
         ExtractorConfig(invalid_fpath)
+
+
+def test_invalid_season_workers(tmp_path):
+    """`season_workers` must be a positive integer."""
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("season_workers: 0\n")
+    with pytest.raises(ExtractorConfigValueError):
+        ExtractorConfig(str(cfg_fpath))
+
+
+def test_invalid_db_client_retries(tmp_path):
+    """`db_client.retries` must be a non-negative integer."""
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("db_client:\n  retries: -1\n")
+    with pytest.raises(ExtractorConfigValueError):
+        ExtractorConfig(str(cfg_fpath))
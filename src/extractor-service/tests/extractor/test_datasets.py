@@ -0,0 +1,117 @@
+import gzip
+import json
+
+import pytest
+
+from tests.context import extractor
+from extractor.datasets import DatasetImporter
+from import_datasets import main
+
+BASICS = """tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult
+tt0944947\ttvSeries\tGame of Thrones\tGame of Thrones\t0
+tt0386676\ttvSeries\tThe Office\tThe Office\t0
+tt0290978\ttvSeries\tThe Office\tThe Office\t0
+tt0133093\tmovie\tThe Matrix\tThe Matrix\t0
+tt9999999\ttvSeries\tUnrated Show\tUnrated Show\t0
+tt1000001\ttvEpisode\tWinter Is Coming\tWinter Is Coming\t0
+"""
+
+EPISODES = """tconst\tparentTconst\tseasonNumber\tepisodeNumber
+tt1000001\ttt0944947\t1\t1
+tt1000002\ttt0944947\t1\t2
+tt1000003\ttt0944947\t1\t4
+tt1000004\ttt0944947\t2\t1
+tt1000005\ttt0944947\t3\t1
+tt1000006\ttt0944947\t\\N\t\\N
+tt2000001\ttt0386676\t1\t1
+tt3000001\ttt0290978\t1\t1
+tt9000001\ttt9999999\t1\t1
+"""
+
+RATINGS = """tconst\taverageRating\tnumVotes
+tt0944947\t9.2\t2000000
+tt0386676\t9.0\t700000
+tt0290978\t8.5\t130000
+tt0133093\t8.7\t2000000
+tt1000001\t8.9\t50000
+tt1000002\t8.6\t40000
+tt1000003\t8.7\t40000
+tt1000004\t8.5\t30000
+tt1000006\t7.0\t10
+tt2000001\t7.5\t20000
+tt3000001\t7.9\t10000
+tt9000001\t6.0\t100
+"""
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    paths = []
+    for name, text in (('title.basics.tsv.gz', BASICS),
+                       ('title.episode.tsv.gz', EPISODES),
+                       ('title.ratings.tsv', RATINGS)):
+        path = tmp_path / name
+        if name.endswith('.gz'):
+            with gzip.open(path, 'wt', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            path.write_text(text)
+        paths.append(str(path))
+    return paths
+
+
+def _import(dumps, tmp_path, **kwargs) -> dict:
+    importer = DatasetImporter(*dumps, work_dir=str(tmp_path), **kwargs)
+    return {series['name']: series for series in importer.series()}
+
+
+def test_joins_episodes_to_series(dumps, tmp_path):
+    series = _import(dumps, tmp_path)
+
+    got = series['Game of Thrones']
+    assert got['series_rating'] == 9.2
+    # episodes are numbered in order; unrated episodes (season 3) and
+    # episodes without numbers are dropped
+    assert got['episode_ratings'] == [
+        {'season': 1, 'ratings': [{'episode_number': 1, 'rating': 8.9},
+                                  {'episode_number': 2, 'rating': 8.6},
+                                  {'episode_number': 3, 'rating': 8.7}]},
+        {'season': 2, 'ratings': [{'episode_number': 1, 'rating': 8.5}]},
+    ]
+
+
+def test_skips_movies_and_unrated_series(dumps, tmp_path):
+    series = _import(dumps, tmp_path)
+    assert "The Matrix" not in series
+    assert "Unrated Show" not in series
+
+
+def test_same_name_keeps_most_voted(dumps, tmp_path):
+    series = _import(dumps, tmp_path)
+    assert series['The Office']['series_rating'] == 9.0
+
+
+def test_min_votes(dumps, tmp_path):
+    series = _import(dumps, tmp_path, min_votes=1000000)
+    assert list(series) == ['Game of Thrones']
+
+
+@pytest.mark.parametrize('partitions', [1, 3, 16])
+def test_partition_count_does_not_change_results(dumps, tmp_path,
+                                                 partitions):
+    assert (_import(dumps, tmp_path, partitions=partitions) ==
+            _import(dumps, tmp_path, partitions=2))
+
+
+def test_spill_files_removed(dumps, tmp_path):
+    _import(dumps, tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        ['title.basics.tsv.gz', 'title.episode.tsv.gz', 'title.ratings.tsv'])
+
+
+def test_cli_writes_json_lines(dumps, tmp_path):
+    out = tmp_path / "series.jsonl"
+    assert main(dumps + ['--out', str(out)])
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(s['name'] for s in lines) == ["Game of Thrones",
+                                                 "The Office"]
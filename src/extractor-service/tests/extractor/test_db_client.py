@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from tests.context import extractor
+from extractor.config import ExtractorConfig
+from extractor.db_client import DBClient, DBRequestError
+
+
+@pytest.fixture
+def db_config(tmp_path):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text(("db_client:\n  timeout_secs: 2\n  retries: 2\n"
+                          "  backoff_secs: 0.01\n  names_per_request: 2\n"))
+    return ExtractorConfig(str(cfg_fpath))
+
+
+def test_exist_many_in_chunks(db_config, db_server):
+    """Names should be checked `names_per_request` at a time, over a single
+    kept-alive connection.
+    """
+    db_server.series['dark'] = {'name': 'Dark'}
+    client = DBClient(db_server.batch_url, db_config)
+    names = ["Dark", "Succession", "Fargo", "Dark", "Lost"]
+
+    assert client.exist_many(names) == {
+        "Dark": True, "Succession": False, "Fargo": False, "Lost": False}
+    assert len(db_server.requests) == 3
+    assert len(db_server.connections) == 1
+
+
+def test_exist_many_async(db_config, db_server):
+    db_server.series['fargo'] = {'name': 'Fargo'}
+    client = DBClient(db_server.batch_url, db_config)
+    names = ["Dark", "Succession", "Fargo"]
+
+    exists = asyncio.run(client.exist_many_async(names))
+
+    assert exists == {"Dark": False, "Succession": False, "Fargo": True}
+    assert len(db_server.requests) == 2
+
+
+def test_retries_server_errors(db_config, db_server):
+    """5xx responses should be retried until one succeeds."""
+    db_server.failures_left = 2
+    client = DBClient(db_server.batch_url, db_config)
+
+    results = client.save_many([{'name': 'Dark'}])
+
+    assert results[0]['status'] == 'created'
+    assert len(db_server.requests) == 3
+
+
+def test_gives_up_after_retries(db_config, db_server):
+    db_server.failures_left = 3
+    client = DBClient(db_server.batch_url, db_config)
+
+    with pytest.raises(DBRequestError):
+        client.exist_many(["Dark"])
+    assert len(db_server.requests) == 3
+
+
+def test_client_errors_are_not_retried(db_config, db_server):
+    db_server.failures_left = 1
+    db_server.fail_status = 400
+    client = DBClient(db_server.batch_url, db_config)
+
+    with pytest.raises(DBRequestError):
+        client.exist_many(["Dark"])
+    assert len(db_server.requests) == 1
+
+
+def test_retries_connection_errors(db_config, db_server):
+    """Connection errors should be retried, then reported."""
+    client = DBClient('http://127.0.0.1:1/tv-series/batch', db_config)
+
+    with pytest.raises(DBRequestError):
+        client.exist_many(["Dark"])
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from tests.context import extractor
+from extractor.driver_pool import (DriverPool, DriverPoolClosedError,
+                                   DriverPoolTimeoutError)
+
+
+class FakeDriver():
+    def __init__(self):
+        self.quit_called = False
+        self.dead = False
+
+    @property
+    def current_url(self):
+        if self.dead:
+            raise WebDriverException("session deleted")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeDriverFactory():
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        self.created.append(FakeDriver())
+        return self.created[-1]
+
+
+def test_lease_reuses_driver():
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=2)
+
+    with pool.lease() as d1:
+        pass
+    with pool.lease() as d2:
+        pass
+
+    assert d1 is d2
+    assert len(factory.created) == 1
+    assert not d1.quit_called
+
+
+def test_driver_recycled_after_max_uses():
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=1, max_uses=2)
+
+    for _ in range(3):
+        with pool.lease():
+            pass
+
+    assert len(factory.created) == 2
+    assert factory.created[0].quit_called
+    assert pool.alive_count == 1
+
+
+def test_unhealthy_driver_replaced():
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=1)
+
+    with pool.lease() as d1:
+        pass
+    d1.dead = True
+    with pool.lease() as d2:
+        pass
+
+    assert d1 is not d2
+    assert d1.quit_called
+
+
+def test_broken_lease_discards_driver():
+    """A driver whose lease raised a WebDriverException is not reused."""
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=1)
+
+    with pytest.raises(WebDriverException):
+        with pool.lease():
+            raise WebDriverException("chrome not reachable")
+
+    assert factory.created[0].quit_called
+    assert pool.alive_count == 0
+
+
+def test_lease_timeout_when_exhausted():
+    pool = DriverPool(FakeDriverFactory(), size=1, lease_timeout_secs=0.1)
+    with pool.lease():
+        with pytest.raises(DriverPoolTimeoutError):
+            with pool.lease():
+                pass
+
+
+def test_waiter_woken_when_driver_recycled():
+    """Recycling a driver frees up a slot for a lease waiting on a full pool.
+    """
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=1, max_uses=1, lease_timeout_secs=5)
+    leased = threading.Event()
+    waiter_done = threading.Event()
+
+    def waiter():
+        leased.wait()
+        with pool.lease():
+            waiter_done.set()
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    with pool.lease():
+        leased.set()
+    t.join(timeout=5)
+
+    assert waiter_done.is_set()
+    assert len(factory.created) == 2
+
+
+def test_close_quits_all_drivers():
+    factory = FakeDriverFactory()
+    pool = DriverPool(factory, size=2)
+
+    with pool.lease():
+        with pool.lease():
+            pass
+    pool.close()
+
+    assert all(d.quit_called for d in factory.created)
+    assert pool.alive_count == 0
+    with pytest.raises(DriverPoolClosedError):
+        with pool.lease():
+            pass
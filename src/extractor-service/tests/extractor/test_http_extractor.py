@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from tests.context import extractor
+from extractor import make_extractor
+from extractor.config import ExtractorConfig
+from extractor.http_extractor import (IMDb_HTTP_Extractor, PageFetchError,
+                                      SeriesNotFoundError)
+from extractor.ratings import SeriesRatingsCollection
+
+
+@pytest.fixture
+def http_config(tmp_path, imdb_server):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("backend: http\nimdb_base_url: '{}'\n".format(
+        imdb_server.base_url))
+    return ExtractorConfig(str(cfg_fpath))
+
+
+def test_make_extractor_selects_http_backend(http_config):
+    """`make_extractor` should return the HTTP backend if configured so."""
+    assert isinstance(make_extractor(http_config), IMDb_HTTP_Extractor)
+
+
+def test_query(http_config):
+    """Tests that querying a series against the recorded pages produces the
+    same `SeriesRatings` the Selenium backend would.
+    """
+    ratings = IMDb_HTTP_Extractor(http_config).query("Game of Thrones")
+
+    assert ratings.series_name == "Game of Thrones"
+    assert ratings.overall_rating == 9.4
+    assert ratings.seasons_count == 3
+    # season 3 has not aired (no ratings), thus is not added
+    assert ratings.rating_values == {1: [9.1, 8.8, 8.7], 2: [8.8, 8.5]}
+    assert ratings.json['episode_ratings'][1] == {
+        'season': 2,
+        'ratings': [{'episode_number': 1, 'rating': 8.8},
+                    {'episode_number': 2, 'rating': 8.5}]
+    }
+
+
+def test_query_selected_seasons(http_config, imdb_server):
+    """Only the seasons picked by `select_seasons` should be fetched."""
+    ratings = IMDb_HTTP_Extractor(http_config).query(
+        "Game of Thrones", select_seasons=lambda seasons_count: [2])
+
+    assert ratings.seasons_count == 3
+    assert ratings.rating_values == {2: [8.8, 8.5]}
+    assert not any('season=1' in path or 'season=3' in path
+                   for path in imdb_server.requested_paths)
+
+
+def test_multiple_queries(http_config):
+    c = SeriesRatingsCollection()
+    IMDb_HTTP_Extractor(http_config).multiple_queries(["Game of Thrones"], c)
+    assert "Game of Thrones" in c
+    assert len(c) == 1
+
+
+def test_query_series_not_found(http_config):
+    with pytest.raises(SeriesNotFoundError):
+        IMDb_HTTP_Extractor(http_config).query("Not A Real Show")
+
+
+def test_fetch_error(http_config, imdb_server):
+    """A page not served with 200 should raise `PageFetchError`."""
+    with pytest.raises(PageFetchError):
+        IMDb_HTTP_Extractor(http_config)._fetch("title/tt0000000/")
+
+
+def test_seasons_fetched_concurrently(tmp_path, imdb_server):
+    """All seasons should be in flight at once, and still be added in
+    season order.
+    """
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("imdb_base_url: '{}'\nseason_workers: 3\n".format(
+        imdb_server.base_url))
+    extractor = IMDb_HTTP_Extractor(ExtractorConfig(str(cfg_fpath)))
+    imdb_server.delay_secs = 0.2
+
+    ratings = extractor.query("Game of Thrones")
+
+    assert imdb_server.max_in_flight == 3
+    assert list(ratings.rating_values.keys()) == [1, 2]
+
+
+def test_parallel_multiple_queries_isolates_failures(tmp_path, imdb_server):
+    """Series are extracted concurrently; a failing series is reported but
+    does not abort the others.
+    """
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("imdb_base_url: '{}'\nseries_workers: 2\n".format(
+        imdb_server.base_url))
+    extractor = IMDb_HTTP_Extractor(ExtractorConfig(str(cfg_fpath)))
+    imdb_server.delay_secs = 0.2
+    c = SeriesRatingsCollection()
+
+    failures = extractor.multiple_queries(
+        ["Game of Thrones", "Not A Real Show"], c)
+
+    assert imdb_server.max_in_flight >= 2
+    assert "Game of Thrones" in c
+    assert list(failures.keys()) == ["Not A Real Show"]
+    assert isinstance(failures["Not A Real Show"], SeriesNotFoundError)
+
+
+def test_rate_limit(tmp_path, imdb_server):
+    """Page loads of a query should be spaced out by the rate limit."""
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text(("imdb_base_url: '{}'\n"
+                          "rate_limit:\n  requests_per_sec: 10\n"
+                          ).format(imdb_server.base_url))
+    extractor = IMDb_HTTP_Extractor(ExtractorConfig(str(cfg_fpath)))
+
+    start = time.monotonic()
+    extractor.query("Game of Thrones")
+    elapsed = time.monotonic() - start
+
+    # find + title + 3 season pages: 4 waits of 1/10 second
+    assert len(imdb_server.requested_paths) == 5
+    assert elapsed >= 0.4 - 0.01
@@ -0,0 +1,47 @@
+from tests.context import extractor
+from extractor.incremental import SeasonPlanner
+
+NOW = 1_600_000_000
+DAY_MS = 86400 * 1000
+
+
+def _summary(*checked_days_ago):
+    """Summary of a series whose season N was checked `checked_days_ago[N-1]`
+    days ago."""
+    return {'last_modified': {'$date': NOW * 1000},
+            'seasons': [{'season': num, 'episodes_count': 10,
+                         'last_checked': {'$date': NOW * 1000 - days * DAY_MS}}
+                         for num, days in enumerate(checked_days_ago, 1)]}
+
+
+def test_selects_latest_seasons():
+    planner = SeasonPlanner(_summary(1, 1, 1, 1, 1), latest_seasons=2,
+                            stale_after_secs=30 * 86400, now=NOW)
+    assert planner.select(5) == [4, 5]
+
+
+def test_selects_missing_seasons():
+    """Seasons that are not stored, new or previously unrated, should be
+    extracted."""
+    summary = _summary(1, 1, 1)
+    del summary['seasons'][1]
+    planner = SeasonPlanner(summary, latest_seasons=1,
+                            stale_after_secs=30 * 86400, now=NOW)
+    assert planner.select(5) == [2, 4, 5]
+
+
+def test_selects_stale_seasons():
+    planner = SeasonPlanner(_summary(40, 1, 31, 1), latest_seasons=1,
+                            stale_after_secs=30 * 86400, now=NOW)
+    assert planner.select(4) == [1, 3, 4]
+
+
+def test_falls_back_to_series_last_modified():
+    """Seasons stored before seasons were timestamped should be as stale as
+    the series."""
+    summary = {'last_modified': {'$date': NOW * 1000 - 40 * DAY_MS},
+               'seasons': [{'season': 1, 'episodes_count': 10},
+                           {'season': 2, 'episodes_count': 10}]}
+    planner = SeasonPlanner(summary, latest_seasons=0,
+                            stale_after_secs=30 * 86400, now=NOW)
+    assert planner.select(2) == [1, 2]
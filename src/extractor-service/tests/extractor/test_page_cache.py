@@ -0,0 +1,162 @@
+import gzip
+import os
+
+import pytest
+
+from tests.context import extractor
+from extractor.config import ExtractorConfig, ExtractorConfigValueError
+from extractor.http_extractor import IMDb_HTTP_Extractor, PageFetchError
+from extractor.page_cache import PageCache, page_type
+
+URL = 'https://www.imdb.com/title/tt0944947/episodes?season=1'
+
+
+def test_put_and_get(tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.put(URL, b'<html>season 1</html>', etag='"abc"')
+
+    cached = cache.get(URL)
+    assert cached.body == b'<html>season 1</html>'
+    assert cached.etag == '"abc"'
+    assert cached.fresh
+    assert cache.get(URL + '0') is None
+
+
+def test_pages_are_stored_compressed(tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.put(URL, b'<html>' + b'x' * 10000 + b'</html>')
+
+    gz_files = [f for f in os.listdir(tmp_path) if f.endswith('.gz')]
+    assert len(gz_files) == 1
+    with open(tmp_path / gz_files[0], 'rb') as f:
+        compressed = f.read()
+    assert len(compressed) < 1000
+    assert gzip.decompress(compressed).startswith(b'<html>xxx')
+
+
+def test_persists_across_instances(tmp_path):
+    PageCache(str(tmp_path)).put(URL, b'page')
+    assert PageCache(str(tmp_path)).get(URL).body == b'page'
+
+
+def test_ttl_by_page_type(tmp_path):
+    cache = PageCache(str(tmp_path), ttl_secs={'season': 0})
+    cache.put(URL, b'page')
+    cache.put('https://www.imdb.com/title/tt0944947/', b'page')
+
+    assert not cache.get(URL).fresh
+    assert cache.get('https://www.imdb.com/title/tt0944947/').fresh
+
+
+def test_parsed_results_dropped_with_page(tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.put(URL, b'page')
+    cache.set_parsed(URL, [9.1, 8.8])
+    assert cache.get(URL).parsed == [9.1, 8.8]
+
+    cache.put(URL, b'new page')
+    assert cache.get(URL).parsed is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = PageCache(str(tmp_path), max_bytes=2000)
+    urls = [f'https://www.imdb.com/find?q={i}' for i in range(3)]
+    for url in urls:
+        cache.put(url, os.urandom(400))
+    cache.get(urls[0])
+    cache.put('https://www.imdb.com/find?q=3', os.urandom(400))
+
+    assert cache.size_bytes <= 2000
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+
+
+
+def test_corrupt_page_dropped(tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.put(URL, b'page')
+    gz_file, = [f for f in os.listdir(tmp_path) if f.endswith('.gz')]
+    (tmp_path / gz_file).write_bytes(b'not gzip')
+
+    assert cache.get(URL) is None
+    assert cache.size_bytes == 0
+    assert os.listdir(tmp_path) == []
+
+
+class RacingPageCache(PageCache):
+    """Replaces the page the first time a body is read."""
+
+    def _read_body(self, key, url):
+        body = super()._read_body(key, url)
+        if not getattr(self, 'raced', False):
+            self.raced = True
+            self.put(url, b'new page', etag='"new"')
+        return body
+
+
+def test_page_replaced_while_read(tmp_path):
+    """The body and validators returned are always of the same page."""
+    cache = RacingPageCache(str(tmp_path))
+    cache.put(URL, b'old page', etag='"old"')
+
+    cached = cache.get(URL)
+    assert (cached.body, cached.etag) == (b'new page', '"new"')
+
+
+def test_invalid_ttl_page_type(tmp_path):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("page_cache:\n  ttl_secs:\n    titles: 60\n")
+    with pytest.raises(ExtractorConfigValueError):
+        ExtractorConfig(str(cfg_fpath))
+
+
+def test_page_type():
+    assert page_type('https://www.imdb.com/find?q=dark&s=tt') == 'find'
+    assert page_type('https://www.imdb.com/title/tt5753856/') == 'title'
+    assert page_type(URL) == 'season'
+    assert page_type('https://www.imdb.com/') == 'other'
+
+
+@pytest.fixture
+def http_config(tmp_path, imdb_server):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text(
+        "backend: http\nimdb_base_url: '{}'\npage_cache:\n  dir: '{}'\n"
+        .format(imdb_server.base_url, tmp_path / "pages"))
+    return ExtractorConfig(str(cfg_fpath))
+
+
+def test_repeat_query_served_from_cache(http_config, imdb_server):
+    """A repeat query should not touch the network while pages are fresh."""
+    first = IMDb_HTTP_Extractor(http_config).query("Game of Thrones")
+    requests_made = len(imdb_server.requested_paths)
+
+    second = IMDb_HTTP_Extractor(http_config).query("Game of Thrones")
+
+    assert len(imdb_server.requested_paths) == requests_made
+    assert second.rating_values == first.rating_values
+    assert second.overall_rating == first.overall_rating
+
+
+def test_stale_pages_revalidated(tmp_path, http_config, imdb_server):
+    """Stale pages should be revalidated with their ETag."""
+    page_cache = PageCache(str(tmp_path / "stale_pages"),
+                           ttl_secs={'find': 0, 'title': 0, 'season': 0})
+    extractor = IMDb_HTTP_Extractor(http_config, page_cache=page_cache)
+    extractor.query("Game of Thrones")
+    requests_made = len(imdb_server.requested_paths)
+
+    ratings = extractor.query("Game of Thrones")
+
+    assert imdb_server.not_modified_count == requests_made
+    assert ratings.rating_values == {1: [9.1, 8.8, 8.7], 2: [8.8, 8.5]}
+
+
+def test_offline_misses(tmp_path, http_config, imdb_server):
+    """Offline, pages that are not cached should not be fetched."""
+    page_cache = PageCache(str(tmp_path / "offline_pages"), offline=True)
+    extractor = IMDb_HTTP_Extractor(http_config, page_cache=page_cache)
+
+    with pytest.raises(PageFetchError):
+        extractor.query("Game of Thrones")
+    assert imdb_server.requested_paths == []
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from tests.context import extractor
+from extractor.config import ExtractorConfig
+from extractor.db_client import DBClient
+from extractor.persistence import BatchWriter, BatchWriterClosedError
+
+
+@pytest.fixture
+def db_client(tmp_path, db_server):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("db_client:\n  retries: 0\n  backoff_secs: 0.01\n")
+    return DBClient(db_server.batch_url, ExtractorConfig(str(cfg_fpath)))
+
+
+def _series(name: str) -> dict:
+    return {'name': name, 'series_rating': 8.0, 'episode_ratings': []}
+
+
+def test_batches(db_client, db_server):
+    """Series should be saved `batch_size` at a time."""
+    with BatchWriter(db_client, batch_size=2, flush_secs=5) as writer:
+        for name in ("Dark", "Fargo", "Lost", "Succession", "Chernobyl"):
+            writer.submit(_series(name))
+
+    assert writer.saved_count == 5
+    assert writer.failed == {}
+    assert len(db_server.requests) == 3
+    assert len(db_server.series) == 5
+
+
+def test_flushes_after_flush_secs(db_client, db_server):
+    """A partial batch should be saved without waiting for `close`."""
+    writer = BatchWriter(db_client, batch_size=10, flush_secs=0.05)
+    writer.submit(_series("Dark"))
+    for _ in range(100):
+        if 'dark' in db_server.series:
+            break
+        time.sleep(0.01)
+    assert 'dark' in db_server.series
+    writer.close()
+
+
+def test_retries_failed_batches(db_client, db_server):
+    db_server.failures_left = 2
+    with BatchWriter(db_client, retries=2, backoff_secs=0.01) as writer:
+        writer.submit(_series("Dark"))
+
+    assert writer.failed == {}
+    assert 'dark' in db_server.series
+
+
+def test_reports_series_not_saved(db_client, db_server):
+    db_server.failures_left = 3
+    with BatchWriter(db_client, retries=2, backoff_secs=0.01) as writer:
+        writer.submit(_series("Dark"))
+
+    assert list(writer.failed) == ["Dark"]
+    assert db_server.series == {}
+
+
+def test_submit_after_close(db_client):
+    writer = BatchWriter(db_client)
+    writer.close()
+    with pytest.raises(BatchWriterClosedError):
+        writer.submit(_series("Dark"))
+
+
+
+class ShortResultsDB():
+    """Saves every series, but returns at most `results` results."""
+
+    def __init__(self, results: int):
+        self.results = results
+        self.saved = []
+
+    def save_many(self, batch):
+        self.saved.extend(series['name'] for series in batch)
+        return [{'status': 'created'}] * min(self.results, len(batch))
+
+
+def test_series_without_result_retried():
+    db = ShortResultsDB(results=1)
+    with BatchWriter(db, batch_size=2, retries=1,
+                     backoff_secs=0.01) as writer:
+        writer.submit(_series("Dark"))
+        writer.submit(_series("Fargo"))
+
+    assert db.saved == ["Dark", "Fargo", "Fargo"]
+    assert writer.saved_count == 2
+    assert writer.failed == {}
+
+
+def test_series_without_result_reported():
+    db = ShortResultsDB(results=0)
+    with BatchWriter(db, retries=1, backoff_secs=0.01) as writer:
+        writer.submit(_series("Dark"))
+
+    assert writer.saved_count == 0
+    assert list(writer.failed) == ["Dark"]
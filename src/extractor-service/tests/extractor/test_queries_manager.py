@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from tests.context import extractor
+import extractor
+from extractor import IMDb_Queries_Manager
+from extractor.config import ExtractorConfig
+
+
+@pytest.fixture
+def manager(tmp_path, imdb_server, db_server, monkeypatch):
+    monkeypatch.setattr(extractor, 'DB_BATCH_API', db_server.batch_url)
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text(("backend: http\nimdb_base_url: '{}'\n"
+                          "pickle:\n  should_pickle: false\n").format(imdb_server.base_url))
+    return IMDb_Queries_Manager(ExtractorConfig(str(cfg_fpath)))
+
+
+def test_execute_uses_batch_endpoints(manager, db_server):
+    """Existence checks and saves should take one request each, however
+    many series are queued.
+    """
+    db_server.series['breaking_bad'] = {'name': 'Breaking Bad'}
+    manager.add_multiple_queries(["Game of Thrones", "Breaking Bad"])
+
+    assert manager.execute()
+    assert db_server.requests == [('GET', '/tv-series/batch'),
+                                  ('POST', '/tv-series/batch')]
+    assert db_server.series['game_of_thrones']['series_rating'] == 9.4
+    assert manager.pending_queries == []
+
+
+def test_execute_skips_series_in_db(manager, db_server, imdb_server):
+    """Nothing should be extracted or saved if every series is persisted."""
+    db_server.series['game_of_thrones'] = {'name': 'Game of Thrones'}
+    manager.add_query("Game of Thrones")
+
+    assert manager.execute()
+    assert db_server.requests == [('GET', '/tv-series/batch')]
+    assert imdb_server.requested_paths == []
+
+
+def test_execute_saves_finished_series_despite_failures(manager, db_server):
+    """A series that fails to be extracted should not keep the others from
+    being saved.
+    """
+    manager.add_multiple_queries(["Game of Thrones", "Not A Real Show"])
+
+    assert not manager.execute()
+    assert list(db_server.series) == ['game_of_thrones']
+
+
+def test_incremental_execute_refreshes_selected_seasons(
+        manager, db_server, imdb_server):
+    """An incremental refresh of a stored series should not fetch seasons
+    that were checked recently and are not among the latest."""
+    db_server.series['game_of_thrones'] = {
+        'name': 'Game of Thrones', 'series_rating': 9.4,
+        'episode_ratings': [{'season': 1, 'ratings': []}]}
+    db_server.checked_ms['game_of_thrones'] = int(time.time() * 1000)
+    manager.add_query("Game of Thrones")
+
+    assert manager.execute(incremental=True)
+
+    season_paths = [path for path in imdb_server.requested_paths
+                    if 'season=' in path]
+    assert sorted(season_paths) == ['/title/tt0944947/episodes?season=2',
+                                    '/title/tt0944947/episodes?season=3']
+    saved = db_server.series['game_of_thrones']['episode_ratings']
+    assert [season['season'] for season in saved] == [2]
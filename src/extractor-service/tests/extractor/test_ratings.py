@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from tests.context import extractor
@@ -123,3 +125,53 @@ def test_ratings_collection_add_item():
         c.add_multiple("Test")
     with pytest.raises(ratings.CollectionItemTypeError):
         c.add_multiple(13)
+
+
+def test_rating_values_and_json():
+    s = SeriesRatings(series_name="GOT", overall_rating=9.3, seasons_count=2)
+    s.add_season_ratings(1, [9.1, 8.8])
+    s.add_season_ratings(2, [8.5])
+
+    assert s.rating_values == {1: [9.1, 8.8], 2: [8.5]}
+    assert s.json['episode_ratings'] == [
+        {'season': 1, 'ratings': [{'episode_number': 1, 'rating': 9.1},
+                                  {'episode_number': 2, 'rating': 8.8}]},
+        {'season': 2, 'ratings': [{'episode_number': 1, 'rating': 8.5}]},
+    ]
+
+
+def test_ratings_stored_contiguously():
+    """Seasons should be laid end to end in one buffer, readable in place."""
+    s = SeriesRatings(series_name="GOT")
+    s.add_season_ratings(2, [8.8, 8.5])
+    s.add_season_ratings(1, [9.1, 8.8, 8.7])
+
+    assert not hasattr(s, '__dict__')
+    assert s.season_numbers == (2, 1)
+    assert s.season_offsets == (0, 2, 5)
+    assert s.ratings_buffer.tolist() == [8.8, 8.5, 9.1, 8.8, 8.7]
+    view = s.season_view(1)
+    assert view.readonly
+    assert view.tolist() == [9.1, 8.8, 8.7]
+    view.release()
+    with pytest.raises(KeyError):
+        s.season_view(3)
+
+
+def test_replace_season_ratings():
+    s = SeriesRatings(series_name="GOT")
+    s.add_season_ratings(1, [9.1])
+    s.add_season_ratings(2, [8.8, 8.5])
+    s.add_season_ratings(1, [9.1, 8.8, 8.7])
+
+    assert s.rating_values == {1: [9.1, 8.8, 8.7], 2: [8.8, 8.5]}
+    assert s.season_offsets == (0, 3, 5)
+
+
+def test_pickle_ratings():
+    s = SeriesRatings(series_name="GOT", overall_rating=9.3, seasons_count=1)
+    s.add_season_ratings(1, [9.1, 8.8])
+
+    copy = pickle.loads(pickle.dumps(s))
+    assert copy.series_name == "GOT"
+    assert copy.rating_values == s.rating_values
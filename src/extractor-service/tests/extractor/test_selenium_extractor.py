@@ -0,0 +1,38 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from tests.context import extractor
+from extractor import IMDb_Extractor
+from extractor.http_extractor import PageParseError
+
+decorators = IMDb_Extractor._Decorators
+
+
+class FakeDriver():
+    def find_element_by_css_selector(self, selector):
+        raise NoSuchElementException(selector)
+
+
+class FakeExtractor():
+    def __init__(self):
+        self._IMDb_Extractor__driver = FakeDriver()
+
+
+def test_missing_element_raises_page_parse_error():
+    @decorators.catch_no_such_element_exception
+    def get_element(self):
+        raise NoSuchElementException("rating")
+
+    with pytest.raises(PageParseError):
+        get_element(FakeExtractor())
+
+
+def test_missing_series_header_raises_page_parse_error():
+    @decorators.execute_in_series_homepage
+    def get_seasons_count(self, series_name):
+        return 1
+
+    # a normal exception, isolated per series by `multiple_queries`, unlike
+    # the `SystemExit` of `quit()`
+    with pytest.raises(PageParseError):
+        get_seasons_count(FakeExtractor(), "Game of Thrones")
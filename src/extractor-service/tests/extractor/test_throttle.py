@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from tests.context import extractor
+from extractor.throttle import RateLimiter
+
+
+def test_rate_limited_per_host():
+    limiter = RateLimiter(requests_per_sec=20, burst=1)
+
+    start = time.monotonic()
+    waits = [limiter.acquire("imdb.com") for _ in range(5)]
+    elapsed = time.monotonic() - start
+
+    assert waits[0] == 0
+    assert elapsed >= 4 / 20 - 0.01
+
+
+def test_hosts_throttled_independently():
+    limiter = RateLimiter(requests_per_sec=1, burst=1)
+    assert limiter.acquire("imdb.com") == 0
+    assert limiter.acquire("m.imdb.com") == 0
+
+
+def test_burst():
+    limiter = RateLimiter(requests_per_sec=1, burst=3)
+    assert [limiter.acquire("imdb.com") for _ in range(3)] == [0, 0, 0]
+
+
+def test_invalid_args():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_sec=0)
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_sec=1, burst=0)
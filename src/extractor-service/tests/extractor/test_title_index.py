@@ -0,0 +1,166 @@
+import json
+
+import pytest
+
+from tests.context import extractor
+from extractor.config import ExtractorConfig, ExtractorConfigValueError
+from extractor.http_extractor import IMDb_HTTP_Extractor, PageFetchError
+from extractor.title_index import TitleIndex
+
+
+def test_add_and_lookup(tmp_path):
+    index = TitleIndex(str(tmp_path / "ids.json"))
+    index.add("Game of Thrones", "tt0944947")
+
+    assert index.lookup("game of thrones") == "tt0944947"
+    assert index.lookup("Dark") is None
+    assert TitleIndex(str(tmp_path / "ids.json")).lookup(
+        "Game of Thrones") == "tt0944947"
+
+
+def test_seed_files(tmp_path):
+    (tmp_path / "seed.json").write_text(json.dumps({"Dark": "tt5753856"}))
+    (tmp_path / "title.basics.tsv").write_text(
+        "tconst\ttitleType\tprimaryTitle\toriginalTitle\n"
+        "tt0944947\ttvSeries\tGame of Thrones\tGame of Thrones\n"
+        "tt0133093\tmovie\tThe Matrix\tThe Matrix\n")
+    index = TitleIndex(seed_paths=[str(tmp_path / "seed.json"),
+                                   str(tmp_path / "title.basics.tsv")])
+
+    assert len(index) == 2
+    assert index.lookup("Dark") == "tt5753856"
+    assert index.lookup("Game of Thrones") == "tt0944947"
+    assert index.lookup("The Matrix") is None
+
+
+def test_ambiguous_seed_names_left_out(tmp_path):
+    """Names of several series (e.g. remakes) are searched for instead."""
+    (tmp_path / "title.basics.tsv").write_text(
+        "tconst\ttitleType\tprimaryTitle\toriginalTitle\n"
+        "tt0077041\ttvSeries\tBattlestar Galactica\tBattlestar Galactica\n"
+        "tt0407362\ttvSeries\tBattlestar Galactica\tBattlestar Galactica\n"
+        "tt5753856\ttvSeries\tDark\tDark\n"
+        "tt5753856\ttvSeries\tDark\tDark\n")
+    index = TitleIndex(seed_paths=[str(tmp_path / "title.basics.tsv")],
+                       fuzzy_cutoff=1)
+
+    assert index.lookup("Battlestar Galactica") is None
+    assert index.lookup("Dark") == "tt5753856"
+    assert len(index) == 1
+
+
+def test_fuzzy_lookup(tmp_path):
+    index = TitleIndex(fuzzy_cutoff=0.9)
+    index.add("Game of Thrones", "tt0944947")
+
+    assert index.lookup("Game of Throne") == "tt0944947"
+    assert index.lookup("Game of Throne", fuzzy=False) is None
+    assert index.lookup("Game of Life") is None
+
+
+def test_no_fuzzy_lookup_in_large_index(tmp_path):
+    index = TitleIndex(fuzzy_cutoff=0.9, fuzzy_max_entries=1)
+    index.add("Game of Thrones", "tt0944947")
+    assert index.lookup("Game of Throne") == "tt0944947"
+
+    index.add("Dark", "tt5753856")
+    assert index.lookup("Game of Throne") is None
+    assert index.lookup("Game of Thrones") == "tt0944947"
+
+
+def test_invalidate(tmp_path):
+    index = TitleIndex(str(tmp_path / "ids.json"))
+    index.add("Game of Thrones", "tt0944947")
+    index.invalidate("Game of Thrones")
+
+    assert index.lookup("Game of Thrones") is None
+    assert TitleIndex(str(tmp_path / "ids.json")).lookup(
+        "Game of Thrones") is None
+
+
+def test_invalidate_fuzzy_match(tmp_path):
+    index = TitleIndex(fuzzy_cutoff=0.9)
+    index.add("Game of Thrones", "tt0944947")
+    title_id = index.lookup("Game of Throne")
+    index.invalidate("Game of Throne", title_id)
+
+    assert index.lookup("Game of Thrones", fuzzy=False) is None
+    assert index.lookup("Game of Throne") is None
+
+
+def test_only_learned_entries_saved(tmp_path):
+    (tmp_path / "seed.json").write_text(json.dumps(
+        {"Dark": "tt5753856", "Game of Thrones": "tt0944947"}))
+    seed_paths = [str(tmp_path / "seed.json")]
+    index = TitleIndex(str(tmp_path / "ids.json"), seed_paths=seed_paths)
+    index.add("Chernobyl", "tt7366338")
+    index.invalidate("Dark")
+
+    assert json.loads((tmp_path / "ids.json").read_text()) == {
+        "chernobyl": "tt7366338", "dark": None}
+    reloaded = TitleIndex(str(tmp_path / "ids.json"), seed_paths=seed_paths)
+    assert len(reloaded) == 2
+    assert reloaded.lookup("Dark", fuzzy=False) is None
+    assert reloaded.lookup("Game of Thrones") == "tt0944947"
+
+
+def test_invalid_fuzzy_cutoff(tmp_path):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("title_index:\n  fuzzy_cutoff: 2\n")
+    with pytest.raises(ExtractorConfigValueError):
+        ExtractorConfig(str(cfg_fpath))
+
+
+@pytest.fixture
+def http_config(tmp_path, imdb_server):
+    cfg_fpath = tmp_path / "cfg.yml"
+    cfg_fpath.write_text("backend: http\nimdb_base_url: '{}'\n".format(
+        imdb_server.base_url))
+    return ExtractorConfig(str(cfg_fpath))
+
+
+def test_query_indexed_series_skips_search(http_config, imdb_server):
+    index = TitleIndex()
+    index.add("Game of Thrones", "tt0944947")
+
+    ratings = IMDb_HTTP_Extractor(http_config, title_index=index).query(
+        "Game of Thrones")
+
+    assert ratings.rating_values == {1: [9.1, 8.8, 8.7], 2: [8.8, 8.5]}
+    assert not any(path.startswith('/find')
+                   for path in imdb_server.requested_paths)
+
+
+def test_query_records_searched_title_id(http_config):
+    index = TitleIndex()
+    IMDb_HTTP_Extractor(http_config, title_index=index).query(
+        "Game of Thrones")
+    assert index.lookup("Game of Thrones", fuzzy=False) == "tt0944947"
+
+
+def test_stale_entry_invalidated(http_config, imdb_server):
+    """An indexed title ID whose page is missing should be replaced by the
+    one searched for."""
+    index = TitleIndex()
+    index.add("Game of Thrones", "tt0000000")
+
+    ratings = IMDb_HTTP_Extractor(http_config, title_index=index).query(
+        "Game of Thrones")
+
+    assert ratings.overall_rating == 9.4
+    assert any(path.startswith('/find')
+               for path in imdb_server.requested_paths)
+    assert index.lookup("Game of Thrones", fuzzy=False) == "tt0944947"
+
+
+def test_entry_kept_on_server_error(http_config, imdb_server):
+    """A title page failing with a 5xx says nothing of the entry."""
+    imdb_server.error_statuses['/title/tt0944947/'] = 503
+    index = TitleIndex()
+    index.add("Game of Thrones", "tt0944947")
+
+    with pytest.raises(PageFetchError):
+        IMDb_HTTP_Extractor(http_config, title_index=index).query(
+            "Game of Thrones")
+
+    assert index.lookup("Game of Thrones", fuzzy=False) == "tt0944947"
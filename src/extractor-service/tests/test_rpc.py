@@ -1,6 +1,115 @@
-import pytest
+import asyncio
+import time
 
-import signal
+import grpc
+import pytest
 
 from tests.context import rpc
+from common.utils import normalize_identifier
+import imdb_pb2
+import imdb_pb2_grpc
+
+
+class FakeQueriesManager():
+    """Stands in for `IMDb_Queries_Manager`: reports 2 seasons of 3 episodes
+    to `on_season`, and records every instance created.
+    """
+    instances = []
+
+    class FakeRatings():
+        seasons_count = 2
+
+    def __init__(self, config, driver_pool=None, on_season=None,
+                 db_client=None):
+        self.on_season = on_season
+        self.queries = []
+        FakeQueriesManager.instances.append(self)
+
+    def add_query(self, query):
+        self.queries.append(query)
+
+    def execute(self):
+        time.sleep(0.1)
+        for season_num in (1, 2):
+            if self.on_season is not None:
+                self.on_season(self.FakeRatings(), season_num, [8.0] * 3)
+        return self.queries != ["Not A Real Show"]
+
+
+@pytest.fixture
+def fake_manager(monkeypatch):
+    FakeQueriesManager.instances = []
+    monkeypatch.setattr(rpc, 'IMDb_Queries_Manager', FakeQueriesManager)
+    return FakeQueriesManager
+
+
+async def _call_service(coro_fn):
+    server = grpc.aio.server()
+    service = rpc.ExtractionService()
+    imdb_pb2_grpc.add_ExtractorServiceServicer_to_server(service, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f'127.0.0.1:{port}') as channel:
+            return await coro_fn(imdb_pb2_grpc.ExtractorServiceStub(channel))
+    finally:
+        await server.stop(None)
+        service.close()
+
+
+def test_concurrent_extractions_are_isolated(fake_manager):
+    """Each request gets a manager of its own, holding its query only."""
+    names = ["Game of Thrones", "Chernobyl", "Not A Real Show"]
+
+    async def call(stub):
+        return await asyncio.gather(*[
+            stub.InitiateExtraction(imdb_pb2.ExtractionRequest(item_name=n))
+            for n in names])
+
+    responses = asyncio.run(_call_service(call))
+
+    assert [r.item_name for r in responses] == names
+    assert [r.successful for r in responses] == [True, True, False]
+    assert sorted(m.queries[0] for m in fake_manager.instances) == \
+        sorted(names)
+    assert all(len(m.queries) == 1 for m in fake_manager.instances)
+
+
+def test_stream_extraction(fake_manager):
+    async def call(stub):
+        request = imdb_pb2.ExtractionRequest(item_name="Game of Thrones")
+        return [p async for p in stub.StreamExtraction(request)]
+
+    progress = asyncio.run(_call_service(call))
+
+    assert [p.season_number for p in progress[:-1]] == [1, 2]
+    assert all(p.seasons_count == 2 and p.episodes_count == 3
+               for p in progress[:-1])
+    assert progress[-1].done and progress[-1].successful
+
+
+def test_duplicate_extractions_coalesced(fake_manager):
+    """Concurrent requests for the same series share one extraction."""
+    names = ["Game of Thrones", "game of thrones!", "Chernobyl"]
+
+    async def call(stub):
+        request = imdb_pb2.ExtractionRequest(item_name="Game Of Thrones")
+        streamed, *responses = await asyncio.gather(
+            _collect(stub.StreamExtraction(request)),
+            *[stub.InitiateExtraction(imdb_pb2.ExtractionRequest(item_name=n))
+              for n in names])
+        return streamed, responses
+
+    streamed, responses = asyncio.run(_call_service(call))
+
+    assert all(r.successful for r in responses)
+    assert sorted(normalize_identifier(m.queries[0])
+                  for m in fake_manager.instances) == \
+        ["chernobyl", "game_of_thrones"]
+    # the stream shares the progress of the coalesced extraction
+    assert [p.season_number for p in streamed[:-1]] == [1, 2]
+    assert streamed[-1].item_name == "Game Of Thrones"
+
 
+async def _collect(stream):
+    return [p async for p in stream]